@@ -1,5 +1,8 @@
-from database.db import get_db
+from database.db import get_async_db, get_db
+from database.redis_client import get_redis
+from database.runner import AsyncSessionRunner, SessionRunner, SyncSessionRunner
 from core.config import settings
+from core.request_context import get_auth_context
 from schemas.user import UserRead
 from fastapi import Depends
 from core.exceptions import AuthenticationException, PermissionDeniedException, NotFoundException
@@ -10,6 +13,9 @@ from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordBearer
 from fastapi import Request, HTTPException
 from typing import Optional
+import secrets
+import redis.asyncio as redis
+from utils.cache import user_cache
 
 
 class OAuth2PasswordBearerWithCookie(OAuth2PasswordBearer):
@@ -44,15 +50,56 @@ def get_db_session():
         db.close()
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db_session)) -> UserRead:
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-    except jwt.JWTError:
-        raise AuthenticationException()
+async def get_async_db_session():
+    async for db in get_async_db():
+        yield db
+
+
+def get_session_runner(db: Session = Depends(get_db_session)) -> SessionRunner:
+    return SyncSessionRunner(db)
+
+
+async def get_async_session_runner(db=Depends(get_async_db_session)) -> SessionRunner:
+    return AsyncSessionRunner(db)
+
+
+# Endpoints depend on get_db_runner, DATABASE_BACKEND decides which driver serves them
+get_db_runner = get_async_session_runner if settings.DATABASE_BACKEND == "async" else get_session_runner
 
-    user = UserService(db).get_user_by_username(payload.get("sub"))
+
+def get_redis_client() -> Optional[redis.Redis]:
+    """Shared async Redis client, None when Redis is not configured"""
+    client = get_redis()
+    return client.client if client else None
+
+
+async def get_current_user(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: SessionRunner = Depends(get_db_runner),
+) -> UserRead:
+    auth = get_auth_context(request)
+    if auth is not None and auth.token == token:
+        payload = auth.claims
+    else:
+        try:
+            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        except jwt.JWTError:
+            raise AuthenticationException()
+
+    username = payload.get("sub")
+    user_id = payload.get("user_id")
+    cached_user = user_cache.get(user_id) if user_id is not None else None
+    if cached_user is not None and cached_user.username == username:
+        return cached_user
+
+    user = await db.run(
+        lambda session: UserService(session).get_user_by_username(username),
+        response_model=UserRead,
+    )
     if not user:
         raise NotFoundException(detail="User not found")
+    user_cache.set(user.id, user)
     return user
 
 
@@ -60,3 +107,11 @@ async def get_current_admin(current_user: UserRead = Depends(get_current_user))
     if current_user.type != Type.ADMIN:
         raise PermissionDeniedException(detail="Admin permission required")
     return current_user
+
+
+def verify_metrics_token(request: Request) -> None:
+    """Scrapers cannot log in for a JWT, /metrics takes the static METRICS_TOKEN as a bearer token instead"""
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    expected = settings.METRICS_TOKEN
+    if not expected or scheme.lower() != "bearer" or not secrets.compare_digest(token.encode(), expected.encode()):
+        raise AuthenticationException(detail="Invalid metrics token")
@@ -1,9 +1,9 @@
-from fastapi import APIRouter, Depends, status, HTTPException, Query
-from sqlalchemy.orm import Session
-from schemas.asset import AssetCreate, AssetRead, AssetUpdate
+from fastapi import APIRouter, Depends, status, HTTPException, Query, UploadFile, File
+from schemas.asset import AssetCreate, AssetRead, AssetUpdate, AssetImportResult
 from schemas.query.check.isValid import IsValid
 from services.asset import AssetService
-from api.dependencies import get_db_session, get_current_admin
+from api.dependencies import get_db_runner, get_current_admin
+from database.runner import SessionRunner
 from schemas.shared.paginated_response import PaginatedResponse
 from schemas.query.filter.asset import AssetFilter
 from schemas.user import UserRead
@@ -12,6 +12,9 @@ from services.assignment import AssignmentService
 from schemas.asset import AssetHistory
 from enums.asset.state import AssetState
 from typing import Optional
+from core.config import settings
+from core.exceptions import ValidationException
+from utils.tabular import iter_table_rows
 
 router = APIRouter(prefix="/assets", tags=["Assets"])
 
@@ -23,11 +26,13 @@ router = APIRouter(prefix="/assets", tags=["Assets"])
 async def get_assets(
     states: Optional[list[AssetState]] = Query(None, description="Filter by asset state", alias="states[]"),
     filter: AssetFilter = Depends(), 
-    db: Session = Depends(get_db_session), 
+    db: SessionRunner = Depends(get_db_runner), 
     current_user = Depends(get_current_admin)
 ):
-    asset_service = AssetService(db)
-    return asset_service.read_assets_paginated(states,filter, current_user.location)
+    return await db.run_json(
+        lambda session: AssetService(session).read_assets_paginated(states, filter, current_user.location),
+        response_model=PaginatedResponse[AssetRead],
+    )
 
 
 @router.get(
@@ -40,11 +45,13 @@ async def get_assets(
 async def get_asset_history(
     asset_id: int,
     filter: AssignmentFilter = Depends(),
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user=Depends(get_current_admin),
 ):
-    assignment_service = AssignmentService(db)
-    return assignment_service.get_assignment_history(asset_id, filter, current_user)
+    return await db.run_json(
+        lambda session: AssignmentService(session).get_assignment_history(asset_id, filter, current_user),
+        response_model=PaginatedResponse[AssetHistory],
+    )
 
 @router.get("/{asset_id}", 
             response_model=AssetRead,
@@ -53,31 +60,59 @@ async def get_asset_history(
             description="Get an asset full details by its ID.")
 async def get_asset_by_id(
     asset_id: int, 
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user = Depends(get_current_admin)
 ):
-    asset_service = AssetService(db)
-    return asset_service.read_asset(asset_id,current_user.location)
+    return await db.run(
+        lambda session: AssetService(session).read_asset(asset_id, current_user.location),
+        response_model=AssetRead,
+    )
 
 @router.post("", 
              response_model=AssetRead,
              status_code=status.HTTP_201_CREATED,
              summary="Create a new asset",
              description="Create a new asset with the provided details.")
-async def create_asset(asset: AssetCreate, db: Session = Depends(get_db_session), current_user: UserRead = Depends(get_current_admin)):
-    service = AssetService(db)
+async def create_asset(asset: AssetCreate, db: SessionRunner = Depends(get_db_runner), current_user: UserRead = Depends(get_current_admin)):
     try:
-        return service.create_asset(asset, current_user)
+        return await db.run(
+            lambda session: AssetService(session).create_asset(asset, current_user),
+            response_model=AssetRead,
+        )
     except HTTPException as e:
         raise e
 
+@router.post("/bulk",
+             response_model=AssetImportResult,
+             status_code=status.HTTP_200_OK,
+             summary="Import assets from a file",
+             description="Create assets in the admin's location from a CSV or XLSX file with the columns "
+                         "asset_name, category_id, specification, installed_date and asset_state. "
+                         "Valid rows are created, invalid rows are listed in the error report.")
+async def import_assets(
+    file: UploadFile = File(...),
+    db: SessionRunner = Depends(get_db_runner),
+    current_user: UserRead = Depends(get_current_admin),
+):
+    if file.size is not None and file.size > settings.ASSET_IMPORT_MAX_SIZE:
+        raise ValidationException(detail=f"File is larger than {settings.ASSET_IMPORT_MAX_SIZE} bytes")
+    # parsed lazily, the service reads it chunk by chunk off the event loop
+    rows = iter_table_rows(file.file, file.filename)
+    return await db.run(
+        lambda session: AssetService(session).import_assets(rows, current_user),
+        response_model=AssetImportResult,
+    )
+
 @router.put("/{asset_id}", 
             response_model=AssetRead,
             status_code=status.HTTP_200_OK,
             summary="Update asset by ID",
             description="Update an asset by its ID with the provided details.")
-async def update_asset(asset_id: int, asset: AssetUpdate, db: Session = Depends(get_db_session), current_user: UserRead = Depends(get_current_admin)):
-    return AssetService(db).update_asset(current_user, asset_id, asset)
+async def update_asset(asset_id: int, asset: AssetUpdate, db: SessionRunner = Depends(get_db_runner), current_user: UserRead = Depends(get_current_admin)):
+    return await db.run(
+        lambda session: AssetService(session).update_asset(current_user, asset_id, asset),
+        response_model=AssetRead,
+    )
 
 @router.delete("/{asset_id}",
                status_code=status.HTTP_204_NO_CONTENT,
@@ -85,12 +120,11 @@ async def update_asset(asset_id: int, asset: AssetUpdate, db: Session = Depends(
                description="Delete an asset by its ID. Only assets with no historical assignments can be deleted.")
 async def delete_asset(
     asset_id: int,
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user = Depends(get_current_admin)
 ):
     current_location = current_user.location
-    asset_service = AssetService(db)
-    asset_service.delete_asset(asset_id, current_location)
+    await db.run(lambda session: AssetService(session).delete_asset(asset_id, current_location))
     
 @router.get(
     "/valid-asset/{asset_id}",
@@ -99,7 +133,9 @@ async def delete_asset(
     summary="Get and check if asset is valid by ID",
     description="Get an asset and check if asset is valid by ID. Asset is valid if it has no historical assignments.",
 )
-async def get_valid_asset(asset_id: int, db: Session = Depends(get_db_session), current_user: UserRead = Depends(get_current_admin)):
+async def get_valid_asset(asset_id: int, db: SessionRunner = Depends(get_db_runner), current_user: UserRead = Depends(get_current_admin)):
     """Get a valid user by ID"""
-    asset_service = AssetService(db)
-    return asset_service.check_asset_valid(asset_id)
+    return await db.run(
+        lambda session: AssetService(session).check_asset_valid(asset_id),
+        response_model=IsValid,
+    )
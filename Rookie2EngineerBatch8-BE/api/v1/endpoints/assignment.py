@@ -1,8 +1,11 @@
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-
-from api.dependencies import get_current_admin, get_db_session, get_current_user
+from api.dependencies import get_current_admin, get_db_runner, get_current_user
+from database.runner import SessionRunner
 from schemas.assignment import (
+    AssignmentBatchCreate,
+    AssignmentBatchResult,
+    AssignmentBatchStateResult,
+    AssignmentBatchStateUpdate,
     AssignmentRead,
     AssignmentCreate,
     AssignmentStateUpdate,
@@ -28,12 +31,14 @@ router = APIRouter(prefix="/assignments", tags=["Assignments"])
 )
 async def get_assignments(
     filter: AssignmentFilter = Depends(),
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user: UserRead = Depends(get_current_admin)
 ):
     """Get a list of all assignments"""
-    assignment_service = AssignmentService(db)
-    return assignment_service.read_assignments_paginated(filter, current_user)
+    return await db.run_json(
+        lambda session: AssignmentService(session).read_assignments_paginated(filter, current_user),
+        response_model=PaginatedResponse[AssignmentRead],
+    )
 
 
 @router.get(
@@ -45,13 +50,56 @@ async def get_assignments(
 )
 async def get_assignments_by_user(
     filter: HomeAssignmentFilter = Depends(),
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user: UserRead = Depends(get_current_user),
 ):
     """Get all assignments for a specific user until current date"""
-    assignment_service = AssignmentService(db)
-    return assignment_service.get_user_assignments_until_current_date(
-        filter, current_user
+    return await db.run_json(
+        lambda session: AssignmentService(session).get_user_assignments_until_current_date(
+            filter, current_user
+        ),
+        response_model=PaginatedResponse[AssignmentUserReadByUID],
+    )
+
+@router.post(
+    "/batch",
+    response_model=AssignmentBatchResult,
+    status_code=status.HTTP_200_OK,
+    summary="Create many assignments",
+    description="Create up to 100 assignments in one request. Valid items are created, "
+                "every item reports its assignment or the reason it was rejected."
+)
+async def create_assignments(
+    batch: AssignmentBatchCreate,
+    db: SessionRunner = Depends(get_db_runner),
+    current_user: UserRead = Depends(get_current_admin)
+):
+    """Create many assignments"""
+    return await db.run(
+        lambda session: AssignmentService(session).create_assignments(batch, current_user),
+        response_model=AssignmentBatchResult,
+    )
+
+
+@router.patch(
+    "/batch/state",
+    response_model=AssignmentBatchStateResult,
+    status_code=status.HTTP_200_OK,
+    summary="Update the state of many assignments",
+    description="Accept or decline up to 100 of the current user's assignments. Valid items are "
+                "updated, every item reports its new state or the reason it was rejected."
+)
+async def update_assignment_states(
+    batch: AssignmentBatchStateUpdate,
+    db: SessionRunner = Depends(get_db_runner),
+    current_user: UserRead = Depends(get_current_user),
+):
+    """Update the state of many assignments"""
+    user_id = current_user.id
+    location = current_user.location
+    return await db.run(
+        lambda session: AssignmentService(session).update_assignment_states(batch, user_id, location),
+        response_model=AssignmentBatchStateResult,
     )
 
 @router.get(
@@ -61,10 +109,12 @@ async def get_assignments_by_user(
     summary="Get assignment by ID",
     description="Get an assignment by its ID."
 )
-async def get_assignment(assignment_id: int, db: Session = Depends(get_db_session), current_user: UserRead = Depends(get_current_admin)):
+async def get_assignment(assignment_id: int, db: SessionRunner = Depends(get_db_runner), current_user: UserRead = Depends(get_current_admin)):
     """Get an assignment by ID"""
-    assignment_service = AssignmentService(db)
-    return assignment_service.read_assignment(assignment_id, current_user)
+    return await db.run(
+        lambda session: AssignmentService(session).read_assignment(assignment_id, current_user),
+        response_model=AssignmentReadDetail,
+    )
 
 @router.post(
     "",
@@ -75,7 +125,7 @@ async def get_assignment(assignment_id: int, db: Session = Depends(get_db_sessio
 )
 async def create_assignment(
     assignment: AssignmentCreate,
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user: UserRead = Depends(get_current_admin)
 ):
     """
@@ -88,14 +138,14 @@ async def create_assignment(
     """
 
 
-    # Create the assignment with current user info
-    assignment_service = AssignmentService(db)
-
     # Create a new assignment object with the current user's ID
-    db_assignment = assignment_service.create_assignment(
-        assignment=assignment,
-        assigned_by_id=current_user.id,
-        current_user=current_user
+    db_assignment = await db.run(
+        lambda session: AssignmentService(session).create_assignment(
+            assignment=assignment,
+            assigned_by_id=current_user.id,
+            current_user=current_user
+        ),
+        response_model=AssignmentRead,
     )
 
     return db_assignment
@@ -111,12 +161,14 @@ async def create_assignment(
 async def update_assignment(
     assignment_id: int,
     assignment_update: AssignmentUpdate,
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user: UserRead = Depends(get_current_admin)
 ):
     """Update an assignment by ID"""
-    assignment_service = AssignmentService(db)
-    return assignment_service.edit_assignment(assignment_id, assignment_update, current_user)
+    return await db.run(
+        lambda session: AssignmentService(session).edit_assignment(assignment_id, assignment_update, current_user),
+        response_model=AssignmentUpdateResponse,
+    )
 
 
 @router.patch(
@@ -129,14 +181,16 @@ async def update_assignment(
 async def update_assignment_state(
     assignment_id: int,
     assignment: AssignmentStateUpdate,
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user: UserRead = Depends(get_current_user),
 ):
     """Partially update an assignment's state by ID"""
-    assignment_service = AssignmentService(db)
     user_id = current_user.id
     location = current_user.location
-    return assignment_service.update_assignment_state(assignment_id, assignment, user_id, location)
+    return await db.run(
+        lambda session: AssignmentService(session).update_assignment_state(assignment_id, assignment, user_id, location),
+        response_model=AssignmentUpdateResponse,
+    )
 
 
 @router.delete(
@@ -145,8 +199,7 @@ async def update_assignment_state(
     summary="Delete assignment by ID",
     description="Delete an assignment by its ID."
 )
-async def delete_assignment(assignment_id: int, db: Session = Depends(get_db_session), current_user: UserRead = Depends(get_current_admin)):
+async def delete_assignment(assignment_id: int, db: SessionRunner = Depends(get_db_runner), current_user: UserRead = Depends(get_current_admin)):
     """Delete an assignment by ID"""
-    assignment_service = AssignmentService(db)
     location = current_user.location
-    return assignment_service.delete_assignment(assignment_id, location)
+    return await db.run(lambda session: AssignmentService(session).delete_assignment(assignment_id, location))
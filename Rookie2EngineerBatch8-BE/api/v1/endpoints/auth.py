@@ -1,21 +1,22 @@
 from fastapi import APIRouter, Depends, Response, Request, status
+import redis.asyncio as redis
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlmodel import Session
 from services.auth import AuthService
 from schemas.auth import TokenResponse, ChangePasswordRequest
-from api.dependencies import get_db_session
+from api.dependencies import get_db_runner, get_db_session, get_redis_client
+from database.runner import SessionRunner
 from schemas.user import UserRead
 from api.dependencies import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 @router.post("/login", response_model=TokenResponse)
-def login(
+async def login(
     response: Response,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db_session),
-   
-    
+    redis_client: redis.Redis | None = Depends(get_redis_client),
 ):
     """
     Login endpoint to authenticate users and issue tokens
@@ -24,18 +25,20 @@ def login(
         response: FastAPI response object for setting cookies
         form_data: Form with username and password
         db: Database session
+        redis_client: Shared Redis client for refresh tokens
 
     Returns:
         TokenResponse with access and refresh tokens
     """
     # Optional: Add a check using current_user if needed
-    return AuthService(db).login(form_data.username, form_data.password, response)
+    return await AuthService(db, redis_client).login(form_data.username, form_data.password, response)
 
 @router.post("/refresh", response_model=TokenResponse)
 async def refresh_token(
     response: Response,
     request: Request,
-    db: Session = Depends(get_db_session)
+    db: Session = Depends(get_db_session),
+    redis_client: redis.Redis | None = Depends(get_redis_client),
 ):
     """
     Refresh token endpoint to issue new tokens
@@ -44,17 +47,19 @@ async def refresh_token(
         response: FastAPI response object for setting cookies
         request: FastAPI request object for getting cookies/body
         db: Database session
+        redis_client: Shared Redis client for refresh tokens
 
     Returns:
         TokenResponse with new access and refresh tokens
     """
-    return await AuthService(db).refresh_token(response, request)
+    return await AuthService(db, redis_client).refresh_token(response, request)
 
 @router.post("/logout")
 async def logout(
     response: Response,
     request: Request,
-    db: Session = Depends(get_db_session)
+    db: Session = Depends(get_db_session),
+    redis_client: redis.Redis | None = Depends(get_redis_client),
 ):
     """
     Logout endpoint to clear cookies and revoke refresh token
@@ -63,25 +68,28 @@ async def logout(
         response: FastAPI response object for clearing cookies
         request: FastAPI request object for getting cookies/body
         db: Database session
+        redis_client: Shared Redis client for refresh tokens
 
     Returns:
         Success message
     """
-    return await AuthService(db).logout(response, request)
+    return await AuthService(db, redis_client).logout(response, request)
 
 @router.post("/change-password", status_code=status.HTTP_200_OK)
-def change_password(
+async def change_password(
     payload: ChangePasswordRequest,
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user = Depends(get_current_user)
 ):
     """
     Đổi mật khẩu cho user đã đăng nhập.
     """
-    return AuthService(db).change_password(
-        user=current_user,
-        old_password=payload.old_password,
-        new_password=payload.new_password
+    return await db.run(
+        lambda session: AuthService(session).change_password(
+            user=current_user,
+            old_password=payload.old_password,
+            new_password=payload.new_password
+        )
     )
     
 @router.get("/check", status_code=status.HTTP_200_OK)
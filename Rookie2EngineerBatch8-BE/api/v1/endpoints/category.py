@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-from api.dependencies import get_db_session
+from api.dependencies import get_db_runner
+from database.runner import SessionRunner
 from typing import List
 from schemas.category import CategoryRead, CategoryCreate
 from services.category import CategoryService
@@ -16,11 +16,13 @@ router = APIRouter(prefix="/categories", tags=["Categories"])
     summary="Get all categories",
     description="Get a list of all categories."
 )
-async def get_categories(db: Session = Depends(get_db_session),
+async def get_categories(db: SessionRunner = Depends(get_db_runner),
                          current_user: UserRead = Depends(get_current_user)):
     """Get all categories"""
-    category_service = CategoryService(db)
-    return category_service.get_categories()
+    return await db.run(
+        lambda session: CategoryService(session).get_categories(),
+        response_model=List[CategoryRead],
+    )
 
 
 @router.get(
@@ -30,10 +32,12 @@ async def get_categories(db: Session = Depends(get_db_session),
     summary="Get category by ID",
     description="Get a category by its ID."
 )
-async def get_category(category_id: int, db: Session = Depends(get_db_session)):
+async def get_category(category_id: int, db: SessionRunner = Depends(get_db_runner)):
     """Get a category by ID"""
-    category_service = CategoryService(db)
-    return category_service.get_category_by_id(category_id)
+    return await db.run(
+        lambda session: CategoryService(session).get_category_by_id(category_id),
+        response_model=CategoryRead,
+    )
 
 
 @router.post(
@@ -46,11 +50,13 @@ async def get_category(category_id: int, db: Session = Depends(get_db_session)):
 )
 async def create_category(
     category: CategoryCreate,
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user: UserRead = Depends(get_current_user)
 ):
     """Create a new category"""
-    category_service = CategoryService(db)
-    return category_service.create_category(category, current_user.id)
+    return await db.run(
+        lambda session: CategoryService(session).create_category(category, current_user.id),
+        response_model=CategoryRead,
+    )
 
 
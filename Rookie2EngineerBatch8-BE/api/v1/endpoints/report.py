@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from api.dependencies import get_db_session
+from api.dependencies import get_db_runner, get_db_session
+from database.db import session_scope
+from enums.shared.export_format import ExportFormat
+from utils.export import CSV_MEDIA_TYPE, GZIP_MEDIA_TYPE, XLSX_MEDIA_TYPE, gzip_stream
+from database.runner import SessionRunner
 from core.exceptions import NotImplementedException
 from schemas.report import ReportRead
 from typing import List
@@ -22,11 +26,13 @@ router = APIRouter(prefix="/reports", tags=["Reports"])
             description="Get paginated list of report with the provided details.")
 async def get_report_paginated(
     sort: ReportSort = Depends(),
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user: UserRead = Depends(get_current_admin)
-) -> PaginatedResponse[ReportRead]:
-    report_service = ReportService(db)
-    return report_service.get_report_paginated(sort, current_user)
+):
+    return await db.run_json(
+        lambda session: ReportService(session).get_report_paginated(sort, current_user),
+        response_model=PaginatedResponse[ReportRead],
+    )
 
 
 @router.get("/all",
@@ -41,17 +47,29 @@ async def get_all_report(sort: ReportSort = Depends(), db: Session = Depends(get
 @router.get("/export",
             status_code=status.HTTP_200_OK,
             summary="Export report file",
-            description="Export all report into an excel file.")
-async def export_to_excel(
-    db: Session = Depends(get_db_session),
+            description="Export all report into an excel or csv file, optionally gzip compressed. "
+                        "The file is streamed while the rows are read.")
+async def export_report(
+    file_format: ExportFormat = Query(ExportFormat.XLSX, alias="format", description="xlsx or csv"),
+    compress: bool = Query(False, description="Gzip the file"),
     current_user: UserRead = Depends(get_current_admin)
 ):
     now = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    filename = f"reports_{now}.xlsx"
-    service = ReportService(db)
-    stream = await service.convert_to_excel(current_user)
+    filename = f"reports_{now}.{file_format.value}"
+    media_type = XLSX_MEDIA_TYPE if file_format == ExportFormat.XLSX else CSV_MEDIA_TYPE
+
+    def content():
+        # the request's session is closed before a streamed body is sent, the stream owns its own
+        with session_scope() as session:
+            yield from ReportService(session).export_report(current_user, file_format)
+
+    body = content()
+    if compress:
+        body = gzip_stream(body)
+        filename += ".gz"
+        media_type = GZIP_MEDIA_TYPE
     return StreamingResponse(
-        content=stream,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        content=body,
+        media_type=media_type,
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
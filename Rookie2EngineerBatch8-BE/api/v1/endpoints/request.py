@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-from api.dependencies import get_current_admin, get_current_user, get_db_session
+from api.dependencies import get_current_admin, get_current_user, get_db_runner
+from database.runner import SessionRunner
 from enums.user.type import Type
 from schemas.query.filter.request import RequestFilter
 from schemas.request import RequestCreate, RequestRead, RequestUpdate, RequestReadDetail
@@ -20,12 +20,14 @@ router = APIRouter(prefix="/requests", tags=["Requests"])
 )
 async def get_requests(
     filter: RequestFilter = Depends(),
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user = Depends(get_current_user)
 ):
     """Get a paginated list of all requests"""
-    request_service = RequestReturningService(db)
-    return request_service.read_requests_paginated(filter, current_user)
+    return await db.run_json(
+        lambda session: RequestReturningService(session).read_requests_paginated(filter, current_user),
+        response_model=PaginatedResponse[RequestReadDetail],
+    )
 
 
 
@@ -38,14 +40,20 @@ async def get_requests(
 )
 async def create_request(
     request: RequestCreate,
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user: UserRead = Depends(get_current_user)
 ):
     """Create a new request"""
     print(f"Endpoint pass")
     if current_user.type == Type.ADMIN:
-        return RequestReturningService(db).create_request_returning(request, current_user)
-    return RequestReturningService(db).create_request_returning_by_staff(request, current_user)
+        return await db.run(
+            lambda session: RequestReturningService(session).create_request_returning(request, current_user),
+            response_model=RequestRead,
+        )
+    return await db.run(
+        lambda session: RequestReturningService(session).create_request_returning_by_staff(request, current_user),
+        response_model=RequestRead,
+    )
 
 
 @router.patch(
@@ -58,12 +66,14 @@ async def create_request(
 async def update_request(
     request_id: int,
     request: RequestUpdate,
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_admin : UserRead = Depends(get_current_admin)
 ):
     """Partially update a request by ID"""
-    request_service = RequestReturningService(db)
-    updated_request = request_service.update_request(request_id, request, current_admin)
+    updated_request = await db.run(
+        lambda session: RequestReturningService(session).update_request(request_id, request, current_admin),
+        response_model=RequestRead,
+    )
     return updated_request
 
 
@@ -75,10 +85,9 @@ async def update_request(
 )
 async def delete_request(
     request_id: int,
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_admin: UserRead = Depends(get_current_admin)
 ):
     """Cancel a request for returning by ID"""
-    request_service = RequestReturningService(db)
-    request_service.cancel_request(request_id, current_admin)
+    await db.run(lambda session: RequestReturningService(session).cancel_request(request_id, current_admin))
     return
\ No newline at end of file
@@ -1,13 +1,15 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-from core.exceptions import NotFoundException
+from fastapi import APIRouter, Depends, File, UploadFile, status
+from core.config import settings
+from core.exceptions import NotFoundException, ValidationException
 from schemas.query.check.isValid import IsValid
 from schemas.query.filter.user import UserFilter
 from schemas.shared.paginated_response import PaginatedResponse
-from schemas.user import UserRead, UserCreate, UserUpdate
+from schemas.user import UserRead, UserCreate, UserImportResult, UserUpdate
+from utils.tabular import iter_table_rows
 
 from services.user import UserService
-from api.dependencies import get_db_session
+from api.dependencies import get_db_runner
+from database.runner import SessionRunner
 from api.dependencies import get_current_admin, get_current_user
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -21,11 +23,13 @@ router = APIRouter(prefix="/users", tags=["Users"])
 )
 async def get_users(
     filter: UserFilter = Depends(),
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user: UserRead = Depends(get_current_admin),
 ):
-    user_service = UserService(db)
-    return user_service.read_users_paginated(filter, current_user)
+    return await db.run_json(
+        lambda session: UserService(session).read_users_paginated(filter, current_user),
+        response_model=PaginatedResponse[UserRead],
+    )
 
 @router.get(
     "/{user_id}",
@@ -34,10 +38,9 @@ async def get_users(
     summary="Get user by ID",
     description="Get a user by their ID.",
 )
-async def get_user(user_id: int, db: Session = Depends(get_db_session), current_user: UserRead = Depends(get_current_user)):
+async def get_user(user_id: int, db: SessionRunner = Depends(get_db_runner), current_user: UserRead = Depends(get_current_user)):
     """Get a user by ID"""
-    user_service = UserService(db)
-    return user_service.read_user(user_id)
+    return await db.run(lambda session: UserService(session).read_user(user_id), response_model=UserRead)
 
 
 @router.post(
@@ -49,15 +52,42 @@ async def get_user(user_id: int, db: Session = Depends(get_db_session), current_
 )
 async def create_user(
     user: UserCreate,
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user: UserRead = Depends(get_current_admin),
 ):
-    user_service = UserService(db)
-    created_user = user_service.create_user(user, current_user.location)
+    created_user = await db.run(
+        lambda session: UserService(session).create_user(user, current_user.location),
+        response_model=UserRead,
+    )
     # No need to convert is_first_login as it's now properly defined as an enum
     return created_user
 
 
+@router.post(
+    "/bulk",
+    response_model=UserImportResult,
+    status_code=status.HTTP_200_OK,
+    summary="Import users from a file",
+    description="Create users from a CSV or XLSX file with the columns first_name, last_name, "
+                "date_of_birth, join_date, gender, type and location. Usernames, staff codes and "
+                "passwords are generated as for a single user. Valid rows are created, invalid rows "
+                "are listed in the error report.",
+)
+async def import_users(
+    file: UploadFile = File(...),
+    db: SessionRunner = Depends(get_db_runner),
+    current_user: UserRead = Depends(get_current_admin),
+):
+    if file.size is not None and file.size > settings.USER_IMPORT_MAX_SIZE:
+        raise ValidationException(detail=f"File is larger than {settings.USER_IMPORT_MAX_SIZE} bytes")
+    # parsed lazily, the service reads it chunk by chunk off the event loop
+    rows = iter_table_rows(file.file, file.filename)
+    return await db.run(
+        lambda session: UserService(session).import_users(rows, current_user.location),
+        response_model=UserImportResult,
+    )
+
+
 @router.put(
     "/{user_id}",
     response_model=UserRead,
@@ -68,13 +98,15 @@ async def create_user(
 async def update_user(
     user_id: int,
     user: UserUpdate,
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user: UserRead = Depends(get_current_admin),
 ):
-    user_service = UserService(db)
     if not current_user:
         raise NotFoundException(detail="User not found")
-    updated_user = user_service.edit_user(user_id, user, current_user.location)
+    updated_user = await db.run(
+        lambda session: UserService(session).edit_user(user_id, user, current_user.location),
+        response_model=UserRead,
+    )
     return updated_user
 
 
@@ -86,11 +118,10 @@ async def update_user(
 )
 async def delete_user(
     user_id: int,
-    db: Session = Depends(get_db_session),
+    db: SessionRunner = Depends(get_db_runner),
     current_user: UserRead = Depends(get_current_admin),
 ):
-    user_service = UserService(db)
-    return user_service.disable_user(user_id)
+    return await db.run(lambda session: UserService(session).disable_user(user_id))
 
 
 @router.get(
@@ -100,7 +131,9 @@ async def delete_user(
     summary="Get and check if user valid by ID",
     description="Get a user and check if user valid by their ID.",
 )
-async def get_valid_user(user_id: int, db: Session = Depends(get_db_session), current_user: UserRead = Depends(get_current_user)):
+async def get_valid_user(user_id: int, db: SessionRunner = Depends(get_db_runner), current_user: UserRead = Depends(get_current_user)):
     """Get a valid user by ID"""
-    user_service = UserService(db)
-    return user_service.check_user_valid(user_id)
+    return await db.run(
+        lambda session: UserService(session).check_user_valid(user_id),
+        response_model=IsValid,
+    )
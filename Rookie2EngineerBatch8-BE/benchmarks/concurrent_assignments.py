@@ -0,0 +1,125 @@
+"""
+Throughput of concurrent assignment creation and a double assignment check.
+
+Every round resets the assets to Available, then ``--workers`` threads each create
+assignments through ``AssignmentService.create_assignment`` in their own session, with
+``--contention`` requests racing for every asset. A round fails loudly if any asset ends up
+with more than one open assignment, so the reported rate only counts rounds that held.
+
+Runs against a throwaway SQLite file unless ``--url`` points at a scratch database, whose
+tables are created and dropped by the run.
+
+    python -m benchmarks.concurrent_assignments [--url postgresql+psycopg://...] [--assets 50]
+        [--contention 4] [--workers 8] [--rounds 5]
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from pathlib import Path
+from sqlalchemy import delete, update
+from sqlmodel import Session, create_engine, func, select
+from core.exceptions import ConflictException
+from enums.asset.state import AssetState
+from enums.assignment.state import AssignmentState
+from enums.shared.location import Location
+from enums.user.type import Type
+from models.asset import Asset
+from models.assignment import Assignment
+from models.category import Category
+from models.request import Request
+from models.user import User
+from schemas.assignment import AssignmentCreate
+from schemas.user import UserRead
+from services.assignment import AssignmentService
+
+TABLES = [model.__table__ for model in (Category, User, Asset, Assignment, Request)]
+
+
+def seed(engine, assets: int) -> None:
+    now = datetime.now(timezone.utc)
+    rows = [Category(id=1, category_name="Laptop", prefix="LA", created_at=now, updated_at=now)]
+    for index, user_type in ((1, Type.ADMIN), (2, Type.STAFF)):
+        rows.append(User(
+            id=index, staff_code=f"SD{index:04d}", username=f"bench{index}", password="hashed",
+            first_name="Bench", last_name=str(index), date_of_birth=date(1990, 1, 1), join_date=date(2023, 1, 1),
+            type=user_type, location=Location.HANOI, created_at=now, updated_at=now,
+        ))
+    for index in range(1, assets + 1):
+        rows.append(Asset(
+            id=index, asset_code=f"LA{index:06d}", asset_name=f"Laptop {index}", specification="spec",
+            installed_date=date(2023, 1, 1), asset_state=AssetState.AVAILABLE, asset_location=Location.HANOI,
+            category_id=1, created_at=now, updated_at=now,
+        ))
+    with Session(engine) as session:
+        session.add_all(rows)
+        session.commit()
+
+
+def reset(engine) -> None:
+    with Session(engine) as session:
+        session.exec(delete(Assignment))
+        session.exec(update(Asset).values(asset_state=AssetState.AVAILABLE))
+        session.commit()
+
+
+def assign(engine, asset_id: int) -> bool:
+    with Session(engine) as session:
+        admin = UserRead.model_validate(session.get(User, 1), from_attributes=True)
+        assignment = AssignmentCreate(asset_id=asset_id, assigned_to_id=2, assign_date=datetime.now(timezone.utc))
+        try:
+            AssignmentService(session).create_assignment(assignment, admin.id, admin)
+        except ConflictException:
+            return False
+        return True
+
+
+def most_open_assignments(engine) -> int:
+    with Session(engine) as session:
+        counts = session.exec(
+            select(func.count())
+            .where(Assignment.assignment_state.in_([AssignmentState.WAITING_FOR_ACCEPTANCE, AssignmentState.ACCEPTED]))
+            .group_by(Assignment.asset_id)
+        ).all()
+    return max(counts, default=0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url")
+    parser.add_argument("--assets", type=int, default=50)
+    parser.add_argument("--contention", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        url = args.url or f"sqlite:///{Path(directory) / 'assignments.db'}"
+        engine = create_engine(url, pool_size=args.workers, connect_args={} if args.url else {"timeout": 30})
+        Category.metadata.create_all(engine, tables=TABLES)
+        try:
+            seed(engine, args.assets)
+            asset_ids = [asset_id for asset_id in range(1, args.assets + 1) for _ in range(args.contention)]
+            rates = []
+            for round_number in range(1, args.rounds + 1):
+                reset(engine)
+                start = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=args.workers) as pool:
+                    created = sum(pool.map(lambda asset_id: assign(engine, asset_id), asset_ids))
+                elapsed = time.perf_counter() - start
+
+                assert created == args.assets, f"round {round_number}: {created} assignments for {args.assets} assets"
+                assert most_open_assignments(engine) == 1, f"round {round_number}: an asset was assigned twice"
+                rates.append(len(asset_ids) / elapsed)
+                print(f"round {round_number:<3} {rates[-1]:8.0f} requests/s  {created} created  {len(asset_ids) - created} conflicts")
+        finally:
+            Category.metadata.drop_all(engine, tables=TABLES)
+            engine.dispose()
+
+    print(f"{'mean':<9} {statistics.mean(rates):8.0f} requests/s  spread {statistics.pstdev(rates) / statistics.mean(rates):.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Encoding throughput of a paginated list response.
+
+Both paths start from the page the repository hands out (read schemas built by a projection).
+The ``response_model`` path reproduces what an endpoint returning the model costs: the runner
+validates it, FastAPI validates it again against the route's response model, turns it into
+plain Python and ``JSONResponse`` encodes that with ``json.dumps``. The ``run_json`` path is
+``SessionRunner.run_json``, one pass through the cached adapter and pydantic-core's encoder.
+
+    python -m benchmarks.json_response [--rows 100] [--pages 2000]
+"""
+import argparse
+import asyncio
+import time
+from datetime import date, datetime
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from database.runner import serialize, serialize_json
+from enums.asset.state import AssetState
+from enums.assignment.state import AssignmentState
+from enums.shared.location import Location
+from schemas.assignment import AssignmentRead
+from schemas.asset import AssetRead
+from schemas.category import CategoryRead
+from schemas.shared.paginated_response import PaginatedResponse, PaginationMeta
+
+RESPONSE_MODEL = PaginatedResponse[AssignmentRead]
+
+
+def build_page(rows: int) -> PaginatedResponse:
+    category = CategoryRead.model_construct(category_name="Laptop", prefix="LA", id=1)
+    data = [
+        AssignmentRead.model_construct(
+            asset_id=index,
+            assigned_to_id=index + 1,
+            assigned_by_id=1,
+            assigned_to_username=f"staff{index}",
+            assigned_by_username="admin",
+            assignment_note="Handed over with charger and bag",
+            id=index,
+            assign_date=date(2025, 1, 1),
+            assignment_state=AssignmentState.ACCEPTED,
+            asset=AssetRead.model_construct(
+                asset_name=f"Laptop {index}",
+                id=index,
+                asset_code=f"LA{index:06d}",
+                specification="Core i7, 16GB RAM, 512GB SSD",
+                installed_date=date(2024, 6, 1),
+                asset_state=AssetState.ASSIGNED,
+                asset_location=Location.HANOI,
+                category=category,
+            ),
+        )
+        for index in range(1, rows + 1)
+    ]
+    meta = PaginationMeta(total=rows * 10, total_pages=10, page=1, page_size=rows)
+    return PaginatedResponse(data=data, meta=meta)
+
+
+async def response_model_path(page: PaginatedResponse, field) -> bytes:
+    content = await serialize_response(
+        field=field, response_content=serialize(page, RESPONSE_MODEL), is_coroutine=True
+    )
+    return JSONResponse(content).body
+
+
+async def run_json_path(page: PaginatedResponse, field) -> bytes:
+    return serialize_json(page, RESPONSE_MODEL)
+
+
+async def measure(encode, page, field, pages: int):
+    await encode(page, field)  # warm up the cached adapters
+    size = 0
+    start = time.perf_counter()
+    for _ in range(pages):
+        size += len(await encode(page, field))
+    return size, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=2_000)
+    args = parser.parse_args()
+
+    page = build_page(args.rows)
+    field = create_model_field("Response", RESPONSE_MODEL, mode="serialization")
+
+    results = {}
+    for name, encode in (("response_model", response_model_path), ("run_json", run_json_path)):
+        size, elapsed = asyncio.run(measure(encode, page, field, args.pages))
+        results[name] = size / elapsed
+        print(f"{name:<16} {results[name] / 1_000_000:8.1f} MB/s  {elapsed / args.pages * 1000:7.3f} ms/page")
+
+    print(f"{'speedup':<16} {results['run_json'] / results['response_model']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
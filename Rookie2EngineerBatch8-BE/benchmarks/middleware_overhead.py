@@ -0,0 +1,116 @@
+"""
+Per-request overhead of the auth and logging middleware.
+
+Drives a bare Starlette app directly over ASGI (no sockets, no HTTP parsing) so the numbers
+only contain the middleware stack. The ``BaseHTTPMiddleware`` variants reproduce the previous
+implementation and serve as the baseline.
+
+    python -m benchmarks.middleware_overhead [--requests 20000]
+"""
+import argparse
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from jose import jwt
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Route
+from core.config import settings
+from core.request_context import AuthContext
+from middleware.auth import AuthMiddleware
+from middleware.logging import LoggingMiddleware, logger
+
+
+class BaseHTTPAuthMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        if request.method == "OPTIONS" or request.url.path in AuthMiddleware.EXCLUDED_PATHS:
+            return await call_next(request)
+        token = request.cookies.get("access_token") or request.cookies.get("refresh_token") or request.headers.get("Authorization")
+        if not token:
+            return JSONResponse(status_code=401, content={"message": "Missing authentication token", "error": "no_tokens"})
+        try:
+            claims = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        except jwt.JWTError:
+            return JSONResponse(status_code=401, content={"message": "Invalid token", "error": "invalid"})
+        request.state.auth = AuthContext(token=token, claims=claims)
+        return await call_next(request)
+
+
+class BaseHTTPLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        logger.info(f"Request: {request.method} {request.url}")
+        response = await call_next(request)
+        logger.info(f"Response: {request.method} {request.url} Status: {response.status_code} Duration: {time.time() - start_time:.3f}s")
+        return response
+
+
+def build_app(auth_class, logging_class) -> Starlette:
+    async def endpoint(request):
+        return PlainTextResponse("ok")
+
+    # the last entry is the innermost, same order as app.add_middleware in main.py
+    return Starlette(
+        routes=[Route("/v1/assets", endpoint)],
+        middleware=[Middleware(auth_class), Middleware(logging_class)],
+    )
+
+
+async def drive(app, requests: int, headers) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "path": "/v1/assets",
+        "raw_path": b"/v1/assets",
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers,
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    # measure the middleware, not the log handlers
+    logger.setLevel(logging.WARNING)
+    exp = int((datetime.now(timezone.utc) + timedelta(hours=1)).timestamp())
+    token = jwt.encode({"sub": "bench", "user_id": 1, "exp": exp}, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    headers = [(b"authorization", token.encode())]
+
+    results = {}
+    for name, app in (
+        ("BaseHTTPMiddleware", build_app(BaseHTTPAuthMiddleware, BaseHTTPLoggingMiddleware)),
+        ("pure ASGI", build_app(AuthMiddleware, LoggingMiddleware)),
+    ):
+        asyncio.run(drive(app, 500, headers))  # warm up
+        elapsed = asyncio.run(drive(app, args.requests, headers))
+        results[name] = elapsed / args.requests * 1_000_000
+        print(f"{name:<20} {results[name]:8.1f} us/request")
+
+    saved = results["BaseHTTPMiddleware"] - results["pure ASGI"]
+    print(f"{'saved':<20} {saved:8.1f} us/request ({saved / results['BaseHTTPMiddleware']:.0%})")
+
+
+if __name__ == "__main__":
+    main()
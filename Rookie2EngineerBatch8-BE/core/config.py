@@ -1,5 +1,5 @@
 # core/config.py
-from typing import List, Optional, Union
+from typing import List, Literal, Optional, Union
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
 import secrets
@@ -17,12 +17,14 @@ class Settings(BaseSettings):
     SERVER_HOST: str = "0.0.0.0"
     SERVER_PORT: int = 8000
     DEBUG: bool = False
+    METRICS_TOKEN: Optional[str] = None  # bearer token scrapers send to /metrics, unset turns the endpoint off
 
     # Security Settings
     SECRET_KEY: str = secrets.token_urlsafe(32)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     ALGORITHM: str = "HS256"
+    PASSWORD_HASH_WORKERS: Optional[int] = None  # threads verifying bcrypt hashes, defaults to the CPU count
 
     # Database Settings
     POSTGRES_DB: str
@@ -33,6 +35,11 @@ class Settings(BaseSettings):
     DATABASE_POOL_SIZE: int = 5
     DATABASE_MAX_OVERFLOW: int = 10
     DATABASE_POOL_TIMEOUT: int = 30
+    DATABASE_POOL_RECYCLE: int = 1800  # seconds, -1 disables recycling
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_STATEMENT_TIMEOUT: int = 30_000  # milliseconds, 0 disables the timeout
+    DATABASE_ECHO: bool = False
+    DATABASE_BACKEND: Literal["sync", "async"] = "sync"
 
     # CORS Settings
     ALLOWED_ORIGINS: List[str] = []
@@ -48,6 +55,9 @@ class Settings(BaseSettings):
     REDIS_HOST: Optional[str] = None
     REDIS_PORT: Optional[int] = None
     REDIS_PASSWORD: Optional[str] = None
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT: float = 2.0
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30  # seconds a connection may idle before it is pinged again
 
     # Logging Settings
     LOG_LEVEL: str = "INFO"
@@ -60,6 +70,12 @@ class Settings(BaseSettings):
     # File Upload
     MAX_UPLOAD_SIZE: int = 5_242_880  # 5MB in bytes
     ALLOWED_FILE_TYPES: List[str] = ["image/jpeg", "image/png"]
+    ASSET_IMPORT_MAX_SIZE: int = 20_971_520  # 20MB in bytes
+    ASSET_IMPORT_CHUNK_SIZE: int = 1000  # rows validated and inserted per transaction
+    ASSET_CODE_BLOCK_SIZE: int = 1  # asset codes a worker reserves per counter update, 1 keeps codes in creation order
+    USER_IMPORT_MAX_SIZE: int = 5_242_880  # 5MB in bytes
+    USER_IMPORT_CHUNK_SIZE: int = 500  # rows validated, hashed and inserted per transaction
+    STAFF_CODE_BLOCK_SIZE: int = 1  # staff codes a worker draws from the sequence at once, 1 keeps codes in creation order
 
     # Pagination
     DEFAULT_PAGE_SIZE: int = 10
@@ -67,6 +83,8 @@ class Settings(BaseSettings):
 
     # Cache Settings
     CACHE_TTL: int = 3600  # 1 hour in seconds
+    USER_CACHE_TTL: int = 30  # seconds an authenticated user is served from memory, 0 disables
+    USER_CACHE_MAX_SIZE: int = 1024
     
     # Root Account
     ROOT_ACCOUNT_USERNAME: str
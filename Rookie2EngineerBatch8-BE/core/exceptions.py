@@ -40,3 +40,7 @@ class ValidationException(CustomException):
 class BusinessException(CustomException):
     def __init__(self, detail: str):
         super().__init__(status_code=400, detail=detail)
+
+class ConflictException(CustomException):
+    def __init__(self, detail: str = "Resource was changed by another request"):
+        super().__init__(status_code=409, detail=detail)
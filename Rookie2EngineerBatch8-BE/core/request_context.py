@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from starlette.requests import Request
+
+
+@dataclass(frozen=True)
+class AuthContext:
+    """Token and decoded claims of the current request, set by AuthMiddleware."""
+    token: str
+    claims: Dict[str, Any]
+
+
+def get_auth_context(request: Request) -> Optional[AuthContext]:
+    return getattr(request.state, "auth", None)
@@ -0,0 +1,53 @@
+"""
+One-shot database bootstrap, run once per deployment before the API workers start:
+
+    python -m database.bootstrap
+
+Upgrades the schema to the latest migration and provisions the root account. Both steps are
+idempotent, so running it on every deploy is safe.
+"""
+import argparse
+from alembic import command
+from sqlalchemy import inspect
+from core.logging_config import get_logger, setup_logging
+from database.migrations import get_alembic_config, get_current_revisions
+from database.postgres import PostgresDatabase
+
+logger = get_logger(__name__)
+
+BASELINE_REVISION = "0001"
+
+
+def stamp_legacy_schema(database: PostgresDatabase) -> None:
+    """Databases built by create_all before migrations existed already hold the baseline schema."""
+    with database.engine.begin() as connection:
+        if get_current_revisions(connection) or not inspect(connection).has_table("user"):
+            return
+        logger.info(f"Existing schema without migration history, stamping {BASELINE_REVISION}")
+        config = get_alembic_config()
+        config.attributes["connection"] = connection
+        command.stamp(config, BASELINE_REVISION)
+
+
+def bootstrap(skip_root_user: bool = False) -> None:
+    database = PostgresDatabase()
+    try:
+        stamp_legacy_schema(database)
+        database.migrate()
+        if not skip_root_user:
+            database.create_root_user()
+    finally:
+        database.engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Migrate the database and create the root account")
+    parser.add_argument("--skip-root-user", action="store_true", help="only run the migrations")
+    args = parser.parse_args()
+
+    setup_logging()
+    bootstrap(skip_root_user=args.skip_root_user)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,38 @@
-from typing import Generator
+import threading
+from contextlib import contextmanager
+from typing import AsyncGenerator, Generator, Optional
 from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from database.postgres import PostgresDatabase
 
-# Create a global database instance
-db_instance = PostgresDatabase()
+_database: Optional[PostgresDatabase] = None
+_database_lock = threading.Lock()
+
+
+def get_database() -> PostgresDatabase:
+    """Process-wide database instance, created on first use"""
+    global _database
+    if _database is None:
+        with _database_lock:
+            if _database is None:
+                _database = PostgresDatabase()
+    return _database
+
+
+@contextmanager
+def session_scope() -> Generator[Session, None, None]:
+    """Session owned by the caller, for work that outlives the request, like a streamed response"""
+    yield from get_database().get_session()
+
 
 def get_db() -> Generator[Session, None, None]:
     """Get a database session"""
     # The get_session method is already a generator that yields a session
     # Just pass through the generator
-    yield from db_instance.get_session() 
\ No newline at end of file
+    yield from get_database().get_session()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get an asyncpg backed database session"""
+    async for session in get_database().get_async_session():
+        yield session
@@ -0,0 +1,44 @@
+from pathlib import Path
+from typing import Set
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.engine import Connection
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class SchemaNotAtHeadError(RuntimeError):
+    pass
+
+
+def get_alembic_config() -> Config:
+    config = Config(str(PROJECT_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(PROJECT_ROOT / "migrations"))
+    return config
+
+
+def get_head_revisions() -> Set[str]:
+    return set(ScriptDirectory.from_config(get_alembic_config()).get_heads())
+
+
+def get_current_revisions(connection: Connection) -> Set[str]:
+    return set(MigrationContext.configure(connection).get_current_heads())
+
+
+def ensure_schema_at_head(connection: Connection) -> None:
+    """Refuse to serve against a database whose migrations are behind (or ahead of) the code."""
+    current = get_current_revisions(connection)
+    heads = get_head_revisions()
+    if current != heads:
+        raise SchemaNotAtHeadError(
+            f"Database schema is at {sorted(current) or 'no revision'}, expected {sorted(heads)}. "
+            "Run `alembic upgrade head` before starting the application."
+        )
+
+
+def upgrade_to_head(connection: Connection) -> None:
+    config = get_alembic_config()
+    config.attributes["connection"] = connection
+    command.upgrade(config, "head")
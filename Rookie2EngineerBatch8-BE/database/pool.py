@@ -0,0 +1,113 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Dict
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from core.config import Settings
+
+
+class PoolMetrics:
+    """Thread-safe counters describing how a connection pool is being used."""
+
+    def __init__(self, window_seconds: int = 60):
+        self.window_seconds = window_seconds
+        self._lock = threading.Lock()
+        self._recent_checkouts: deque = deque()
+        self.total_checkouts = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.last_wait_time = 0.0
+
+    def record_checkout(self, wait_time: float) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self.total_checkouts += 1
+            self.total_wait_time += wait_time
+            self.last_wait_time = wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+            self._recent_checkouts.append(now)
+            self._prune(now)
+
+    def checkouts_per_second(self) -> float:
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            return len(self._recent_checkouts) / self.window_seconds
+
+    def _prune(self, now: float) -> None:
+        threshold = now - self.window_seconds
+        while self._recent_checkouts and self._recent_checkouts[0] < threshold:
+            self._recent_checkouts.popleft()
+
+    def snapshot(self) -> Dict[str, Any]:
+        checkouts_per_second = self.checkouts_per_second()
+        with self._lock:
+            average_wait = self.total_wait_time / self.total_checkouts if self.total_checkouts else 0.0
+            return {
+                "total_checkouts": self.total_checkouts,
+                "checkouts_per_second": round(checkouts_per_second, 3),
+                "wait_time_avg_ms": round(average_wait * 1000, 3),
+                "wait_time_max_ms": round(self.max_wait_time * 1000, 3),
+                "wait_time_last_ms": round(self.last_wait_time * 1000, 3),
+            }
+
+
+class MeteredPoolMixin:
+    """Records how long callers wait to check out a connection from a queue pool."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        connection = super()._do_get()
+        self.metrics.record_checkout(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps the pool, keep the counters across the swap
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pool_size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": self.overflow(),
+            **self.metrics.snapshot(),
+        }
+
+
+class MeteredQueuePool(MeteredPoolMixin, QueuePool):
+    pass
+
+
+class MeteredAsyncAdaptedQueuePool(MeteredPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def build_engine_options(settings: Settings, is_async: bool = False) -> Dict[str, Any]:
+    """Translate the database settings into keyword arguments for create_engine."""
+    options: Dict[str, Any] = {
+        "echo": settings.DATABASE_ECHO,
+        "poolclass": MeteredAsyncAdaptedQueuePool if is_async else MeteredQueuePool,
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+    if settings.DATABASE_STATEMENT_TIMEOUT > 0:
+        if is_async:
+            # asyncpg does not understand libpq "options", it takes server settings directly
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": str(settings.DATABASE_STATEMENT_TIMEOUT)}
+            }
+        else:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={settings.DATABASE_STATEMENT_TIMEOUT}"
+            }
+    return options
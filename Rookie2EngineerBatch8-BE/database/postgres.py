@@ -1,36 +1,60 @@
 import urllib.parse
-from sqlmodel import SQLModel, create_engine, Session
-from typing import Generator
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import AsyncGenerator, Generator
 from core.config import settings
 from core.logging_config import get_logger
+from database.migrations import ensure_schema_at_head, upgrade_to_head
+from database.pool import build_engine_options
 from services.user import UserService
 logger = get_logger(__name__)
 
+
+def build_database_url(driver: str = "psycopg2") -> str:
+    encoded_password = urllib.parse.quote_plus(settings.POSTGRES_PASSWORD)
+    return f"postgresql+{driver}://{settings.POSTGRES_USER}:{encoded_password}@{settings.DATABASE_HOST}:{settings.DATABASE_PORT}/{settings.POSTGRES_DB}"
+
+
 class PostgresDatabase:
+    """
+    Engines and session factories for the application.
+
+    Building it does not touch the database, connections are opened on first use. Schema
+    migrations and the root account are handled once per deployment by database/bootstrap.py.
+    """
+
     def __init__(self):
-        encoded_password = urllib.parse.quote_plus(settings.POSTGRES_PASSWORD)
-        self.DATABASE_URL = f"postgresql+psycopg2://{settings.POSTGRES_USER}:{encoded_password}@{settings.DATABASE_HOST}:{settings.DATABASE_PORT}/{settings.POSTGRES_DB}"
+        self.DATABASE_URL = build_database_url()
+        self.ASYNC_DATABASE_URL = build_database_url("asyncpg")
+        self.async_engine = None
+        self.async_session_factory = None
         try:
-            self.engine = create_engine(self.DATABASE_URL, echo=True)
-            with self.engine.connect() as connection:
-                logger.info(f"Connected to the database")
-                self.create_db_and_tables()
-                self.create_root_user()
+            self.engine = create_engine(self.DATABASE_URL, **build_engine_options(settings))
+            if settings.DATABASE_BACKEND == "async":
+                self.async_engine = create_async_engine(
+                    self.ASYNC_DATABASE_URL, **build_engine_options(settings, is_async=True)
+                )
+                # objects are handed back to the endpoint after the session closes
+                self.async_session_factory = async_sessionmaker(
+                    self.async_engine, class_=AsyncSession, expire_on_commit=False
+                )
         except Exception as e:
             logger.error(f"Error creating engine: {e}")
             raise e
 
-    def create_db_and_tables(self):
-        # from models.<name> import <Name>
-        logger.info("Creating database and tables")
-        from models.asset import Asset
-        from models.category import Category
-        from models.user import User
-        from models.assignment import Assignment
-        from models.request import Request
-        SQLModel.metadata.create_all(self.engine)
-        logger.info("Database and tables created")
-        
+    def check_schema(self):
+        logger.info("Checking database schema revision")
+        with self.engine.connect() as connection:
+            ensure_schema_at_head(connection)
+        logger.info("Database schema is up to date")
+
+    def migrate(self):
+        logger.info("Upgrading database schema")
+        with self.engine.begin() as connection:
+            upgrade_to_head(connection)
+        logger.info("Database schema upgraded")
+
     def create_root_user(self):
         logger.info("Creating root user")
         with Session(self.engine) as session:
@@ -38,6 +62,26 @@ class PostgresDatabase:
             user_service.create_root_user()
         logger.info("Root user created")
 
+    def get_pool_stats(self) -> dict:
+        stats = self.engine.pool.stats()
+        if self.async_engine is not None:
+            stats = {"sync": stats, "async": self.async_engine.pool.stats()}
+        return stats
+
     def get_session(self) -> Generator[Session, None, None]:
         with Session(self.engine) as session:
-            yield session
\ No newline at end of file
+            yield session
+
+    async def get_async_session(self) -> AsyncGenerator[AsyncSession, None]:
+        if self.async_session_factory is None:
+            raise RuntimeError("Async database backend is not enabled, set DATABASE_BACKEND=async")
+        async with self.async_session_factory() as session:
+            yield session
+
+    def dispose(self):
+        self.engine.dispose()
+
+    async def dispose_async(self):
+        self.dispose()
+        if self.async_engine is not None:
+            await self.async_engine.dispose()
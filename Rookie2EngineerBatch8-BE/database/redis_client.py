@@ -0,0 +1,76 @@
+import threading
+from typing import Any, Dict, Optional
+import redis.asyncio as redis
+from redis.observability.attributes import DB_CLIENT_CONNECTION_STATE, ConnectionState
+from core.config import Settings, settings
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class RedisClient:
+    """
+    Process-wide async Redis client backed by a single connection pool.
+
+    Connections are checked with PING after ``REDIS_HEALTH_CHECK_INTERVAL`` idle seconds before
+    being handed out, so a Redis restart costs one retry instead of a failed request.
+    """
+
+    def __init__(self, config: Settings = settings):
+        self.pool = redis.ConnectionPool(
+            host=config.REDIS_HOST,
+            port=config.REDIS_PORT,
+            password=config.REDIS_PASSWORD or None,
+            db=0,
+            decode_responses=True,
+            max_connections=config.REDIS_MAX_CONNECTIONS,
+            socket_timeout=config.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=config.REDIS_SOCKET_TIMEOUT,
+            health_check_interval=config.REDIS_HEALTH_CHECK_INTERVAL,
+        )
+        self.client = redis.Redis(connection_pool=self.pool)
+
+    async def ping(self) -> bool:
+        try:
+            return bool(await self.client.ping())
+        except redis.RedisError as e:
+            logger.warning(f"Redis is not reachable: {str(e)}")
+            return False
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        # one (count, attributes) pair per connection state, idle and used
+        counts = {attributes[DB_CLIENT_CONNECTION_STATE]: count for count, attributes in self.pool.get_connection_count()}
+        available = counts.get(ConnectionState.IDLE.value, 0)
+        in_use = counts.get(ConnectionState.USED.value, 0)
+        return {
+            "max_connections": self.pool.max_connections,
+            "created_connections": available + in_use,
+            "in_use": in_use,
+            "available": available,
+        }
+
+    async def close(self) -> None:
+        await self.client.aclose()
+        await self.pool.aclose()
+
+
+_redis: Optional[RedisClient] = None
+_redis_lock = threading.Lock()
+
+
+def get_redis() -> Optional[RedisClient]:
+    """Process-wide Redis client, created on first use, None when Redis is not configured"""
+    global _redis
+    if _redis is None and settings.REDIS_HOST:
+        with _redis_lock:
+            if _redis is None:
+                _redis = RedisClient()
+    return _redis
+
+
+async def close_redis() -> None:
+    global _redis
+    with _redis_lock:
+        client, _redis = _redis, None
+    if client is not None:
+        await client.close()
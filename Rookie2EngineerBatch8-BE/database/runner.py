@@ -0,0 +1,107 @@
+import asyncio
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Callable, Optional, TypeVar
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=None)
+def _get_adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def serialize(result: Any, response_model: Optional[Any]) -> Any:
+    """Build the response model while the session that loaded ``result`` is still open."""
+    if response_model is None or result is None:
+        return result
+    return _get_adapter(response_model).validate_python(result, from_attributes=True)
+
+
+def serialize_json(result: Any, response_model: Any) -> bytes:
+    """
+    Encode ``result`` with the cached adapter of ``response_model``.
+
+    The repositories already hand out built read schemas, validation passes them through and
+    pydantic-core writes the JSON in one step instead of jsonable_encoder followed by json.dumps.
+    """
+    return _get_adapter(response_model).dump_json(serialize(result, response_model))
+
+
+def run_blocking(fn: Callable[..., T], *args) -> T:
+    """
+    Run blocking file IO or parsing from service code without stalling the event loop.
+
+    Under AsyncSession.run_sync the service runs on the event loop thread, there the call goes
+    to the default executor and the wait is handed back to the loop. On the threadpool of the
+    sync runner it runs on the calling thread.
+    """
+    if in_greenlet():
+        return await_only(asyncio.get_running_loop().run_in_executor(None, fn, *args))
+    return fn(*args)
+
+
+class SessionRunner(ABC):
+    """
+    Runs repository/service code against a database session without blocking the event loop.
+
+    ``fn`` receives the session as its first argument. When ``response_model`` is given the
+    result is converted inside the same unit of work, so lazy relationships are loaded before
+    the session goes away.
+    """
+
+    @abstractmethod
+    async def run(self, fn: Callable[..., T], *args, response_model: Optional[Any] = None, **kwargs) -> T:
+        ...
+
+    async def run_json(self, fn: Callable[..., Any], *args, response_model: Any, status_code: int = 200, **kwargs) -> Response:
+        """
+        Like ``run`` but the body is encoded in the same unit of work. Returning the response
+        skips FastAPI's second validation against the route's ``response_model``, which then
+        only documents the schema.
+        """
+        def call(session, *call_args, **call_kwargs):
+            return serialize_json(fn(session, *call_args, **call_kwargs), response_model)
+
+        content = await self.run(call, *args, **kwargs)
+        return Response(content, status_code=status_code, media_type="application/json")
+
+
+class SyncSessionRunner(SessionRunner):
+    """Executes the call on the threadpool with a psycopg2 ``Session``."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    async def run(self, fn: Callable[..., T], *args, response_model: Optional[Any] = None, **kwargs) -> T:
+        def call():
+            return serialize(fn(self.session, *args, **kwargs), response_model)
+
+        return await run_in_threadpool(call)
+
+
+class AsyncSessionRunner(SessionRunner):
+    """
+    Executes the call on the event loop with an asyncpg ``AsyncSession``.
+
+    ``fn`` runs on the loop thread, so CPU-bound work must not happen inside it: read uploads
+    through ``run_blocking`` and hash passwords through ``utils.hash.run_on_password_executor``.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def run(self, fn: Callable[..., T], *args, response_model: Optional[Any] = None, **kwargs) -> T:
+        def call(session: Session):
+            return serialize(fn(session, *args, **kwargs), response_model)
+
+        # run_sync hands the sync facade of the AsyncSession to the existing repositories,
+        # every query they emit awaits asyncpg instead of blocking a thread
+        return await self.session.run_sync(call)
@@ -1,12 +1,17 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI
 import uvicorn
 from middleware.cors import setup_cors_middleware
 from middleware.logging import LoggingMiddleware
 from middleware.auth import AuthMiddleware
 from dotenv import load_dotenv
-from database.postgres import PostgresDatabase
+from database.db import get_database
+from database.redis_client import close_redis, get_redis
+from api.dependencies import verify_metrics_token
 from api.v1.router import router as v1_router
+from core.config import settings
 from core.logging_config import setup_logging, get_logger
+from utils.hash import shutdown_password_executor
 
 # Configure logging
 setup_logging()
@@ -15,15 +20,34 @@ logger = get_logger(__name__)
 # Load environment variables
 load_dotenv()
 
-# Initialize database
-logger.info("Initializing database...")
-db = PostgresDatabase()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema and root user are provisioned by `python -m database.bootstrap`,
+    # workers only verify they run against a migrated database
+    logger.info("Checking database...")
+    database = get_database()
+    database.check_schema()
+    redis_client = get_redis()
+    if redis_client is None:
+        logger.warning("REDIS_HOST is not set, refresh tokens will not be tracked")
+    elif not await redis_client.ping():
+        logger.warning("Redis is not reachable yet, the pool will keep retrying")
+    yield
+    shutdown_password_executor()
+    await close_redis()
+    if settings.DATABASE_BACKEND == "async":
+        await database.dispose_async()
+    else:
+        database.dispose()
+
 
 # FastAPI App
 app = FastAPI(
     title="Assets Management API",
     description="API for Assets Management",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Middleware
@@ -37,6 +61,16 @@ app.add_middleware(AuthMiddleware)
 async def health():
     return {"message": "OK"}
 
+# Metrics, pool internals are only served to scrapers holding METRICS_TOKEN
+if settings.METRICS_TOKEN:
+    @app.get("/metrics", dependencies=[Depends(verify_metrics_token)])
+    async def metrics():
+        redis_client = get_redis()
+        return {
+            "db_pool": get_database().get_pool_stats(),
+            "redis_pool": redis_client.get_pool_stats() if redis_client else None,
+        }
+
 # Include routers
 logger.info("Including routers...")
 app.include_router(v1_router)
@@ -1,38 +1,63 @@
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import HTTPConnection
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 from core.config import settings
 from jose import jwt
-from starlette.responses import JSONResponse
+from core.request_context import AuthContext
+
+
+class AuthMiddleware:
+    """
+    Rejects HTTP requests without a valid JWT before they reach the routers.
+
+    Written as plain ASGI middleware: unlike ``BaseHTTPMiddleware`` it does not spawn a task
+    or wrap the response stream, a request that passes the check is forwarded untouched.
+    """
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    EXCLUDED_PATHS = [
+    EXCLUDED_PATHS = frozenset([
         "",
         "/",
         "/docs",
         "/redoc",
         "/health",
+        # checked against METRICS_TOKEN by the endpoint, scrapers have no user token
+        "/metrics",
         "/openapi.json",
         "/v1/auth/login",
         "/favicon.ico",
-    ]
+    ])
 
-    async def dispatch(self, request: Request, call_next):
-        if request.method == "OPTIONS":
-            return await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        if request.url.path in self.EXCLUDED_PATHS:
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "OPTIONS" or scope["path"] in self.EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
 
-        token = request.cookies.get("access_token") or request.cookies.get("refresh_token") or request.headers.get("Authorization")
+        connection = HTTPConnection(scope)
+        token = (
+            connection.cookies.get("access_token")
+            or connection.cookies.get("refresh_token")
+            or connection.headers.get("Authorization")
+        )
         if not token:
-            return JSONResponse(status_code=401, content={"message": "Missing authentication token", "error": "no_tokens"})
+            response = JSONResponse(status_code=401, content={"message": "Missing authentication token", "error": "no_tokens"})
+            await response(scope, receive, send)
+            return
 
         try:
-            jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            claims = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         except jwt.ExpiredSignatureError:
-            return JSONResponse(status_code=401, content={"message": "Token expired", "error": "expired"})
+            response = JSONResponse(status_code=401, content={"message": "Token expired", "error": "expired"})
+            await response(scope, receive, send)
+            return
         except jwt.JWTError:
-            return JSONResponse(status_code=401, content={"message": "Invalid token", "error": "invalid"})
+            response = JSONResponse(status_code=401, content={"message": "Invalid token", "error": "invalid"})
+            await response(scope, receive, send)
+            return
 
-        response = await call_next(request)
-        return response
+        # hand the decoded token to the dependencies so they do not decode it again,
+        # request.state reads and writes scope["state"]
+        connection.state.auth = AuthContext(token=token, claims=claims)
+        await self.app(scope, receive, send)
@@ -1,35 +1,46 @@
 import time
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+class LoggingMiddleware:
+    """Logs every HTTP request and its response status, written as plain ASGI middleware."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.time()
+        method = scope["method"]
+        url = HTTPConnection(scope).url
 
         # Log request
-        logger.info(f"Request: {request.method} {request.url}")
-
-        response = await call_next(request)
-
-        # Log response
-        process_time = time.time() - start_time
-        status_code = response.status_code
-        
-        if status_code >= 500:
-            log_level = logger.error
-        elif status_code >= 400:
-            log_level = logger.warning
-        else:
-            log_level = logger.info
-            
-        log_level(
-            f"Response: {request.method} {request.url} "
-            f"Status: {status_code} "
-            f"Duration: {process_time:.3f}s"
-        )
-
-        return response
+        logger.info(f"Request: {method} {url}")
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Log response once the status is known, the body is not buffered
+                process_time = time.time() - start_time
+                if status_code >= 500:
+                    log_level = logger.error
+                elif status_code >= 400:
+                    log_level = logger.warning
+                else:
+                    log_level = logger.info
+
+                log_level(
+                    f"Response: {method} {url} "
+                    f"Status: {status_code} "
+                    f"Duration: {process_time:.3f}s"
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,55 @@
+from logging.config import fileConfig
+from alembic import context
+from sqlalchemy import create_engine, pool
+from sqlmodel import SQLModel
+from database.postgres import build_database_url
+
+# Register every table on SQLModel.metadata for autogenerate
+from models.asset import Asset  # noqa: F401
+from models.asset_summary import AssetSummary  # noqa: F401
+from models.assignment import Assignment  # noqa: F401
+from models.category import Category  # noqa: F401
+from models.request import Request  # noqa: F401
+from models.user import User  # noqa: F401
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = SQLModel.metadata
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=build_database_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    # the app passes its own connection when it migrates at bootstrap
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_with_connection(connection)
+        return
+
+    engine = create_engine(build_database_url(), poolclass=pool.NullPool)
+    with engine.connect() as connection:
+        _run_with_connection(connection)
+
+
+def _run_with_connection(connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,131 @@
+"""baseline schema
+
+Mirrors the tables SQLModel.metadata.create_all used to build. Databases created that way
+already contain this schema and are stamped at this revision instead of running it.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ENUMS = {
+    "gender": ("MALE", "FEMALE"),
+    "type": ("ADMIN", "STAFF"),
+    "location": ("HANOI", "HCM", "DANANG"),
+    "status": ("ACTIVE", "DISABLED"),
+    "assetstate": ("AVAILABLE", "NOT_AVAILABLE", "ASSIGNED", "WAITING_FOR_RECYCLING", "RECYCLED"),
+    "assignmentstate": ("ACCEPTED", "DECLINED", "WAITING_FOR_ACCEPTANCE", "RETURNED"),
+    "requeststate": ("COMPLETED", "WAITING_FOR_RETURNING"),
+}
+
+
+def enum(name: str) -> postgresql.ENUM:
+    # types are created once up front, "location" is shared by user and asset
+    return postgresql.ENUM(*ENUMS[name], name=name, create_type=False)
+
+
+def timestamps() -> list:
+    return [
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for name, values in ENUMS.items():
+        postgresql.ENUM(*values, name=name).create(bind, checkfirst=True)
+
+    op.create_table(
+        "category",
+        *timestamps(),
+        sa.Column("category_name", sa.String(length=100), nullable=False),
+        sa.Column("prefix", sa.String(length=10), nullable=False),
+        sa.Column("id_counter", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "user",
+        *timestamps(),
+        sa.Column("staff_code", sa.String(), nullable=False),
+        sa.Column("username", sa.String(), nullable=False),
+        sa.Column("password", sa.String(), nullable=False),
+        sa.Column("first_name", sa.String(length=128), nullable=False),
+        sa.Column("last_name", sa.String(length=128), nullable=False),
+        sa.Column("date_of_birth", sa.Date(), nullable=False),
+        sa.Column("join_date", sa.Date(), nullable=False),
+        sa.Column("gender", enum("gender"), nullable=True),
+        sa.Column("type", enum("type"), nullable=False),
+        sa.Column("location", enum("location"), nullable=False),
+        sa.Column("status", enum("status"), nullable=False),
+        sa.Column("is_first_login", sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_user_staff_code", "user", ["staff_code"], unique=True)
+    op.create_index("ix_user_username", "user", ["username"], unique=True)
+    op.create_table(
+        "asset",
+        *timestamps(),
+        sa.Column("asset_code", sa.String(), nullable=False),
+        sa.Column("asset_name", sa.String(), nullable=False),
+        sa.Column("specification", sa.String(), nullable=False),
+        sa.Column("installed_date", sa.Date(), nullable=False),
+        sa.Column("asset_state", enum("assetstate"), nullable=False),
+        sa.Column("asset_location", enum("location"), nullable=False),
+        sa.Column("category_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["category_id"], ["category.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "assignment",
+        *timestamps(),
+        sa.Column("asset_id", sa.Integer(), nullable=False),
+        sa.Column("assigned_to_id", sa.Integer(), nullable=False),
+        sa.Column("assigned_by_id", sa.Integer(), nullable=False),
+        sa.Column("assign_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("assignment_note", sa.String(), nullable=True),
+        sa.Column("assignment_state", enum("assignmentstate"), nullable=False),
+        sa.ForeignKeyConstraint(["asset_id"], ["asset.id"]),
+        sa.ForeignKeyConstraint(["assigned_to_id"], ["user.id"]),
+        sa.ForeignKeyConstraint(["assigned_by_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "request",
+        *timestamps(),
+        sa.Column("assignment_id", sa.Integer(), nullable=False),
+        sa.Column("requested_by_id", sa.Integer(), nullable=False),
+        sa.Column("accepted_by_id", sa.Integer(), nullable=True),
+        sa.Column("return_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("request_state", enum("requeststate"), nullable=False),
+        sa.ForeignKeyConstraint(["assignment_id"], ["assignment.id"]),
+        sa.ForeignKeyConstraint(["requested_by_id"], ["user.id"]),
+        sa.ForeignKeyConstraint(["accepted_by_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("request")
+    op.drop_table("assignment")
+    op.drop_table("asset")
+    op.drop_index("ix_user_username", table_name="user")
+    op.drop_index("ix_user_staff_code", table_name="user")
+    op.drop_table("user")
+    op.drop_table("category")
+    bind = op.get_bind()
+    for name in reversed(list(ENUMS)):
+        postgresql.ENUM(name=name).drop(bind, checkfirst=True)
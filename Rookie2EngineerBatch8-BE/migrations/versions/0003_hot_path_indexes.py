@@ -0,0 +1,51 @@
+"""hot path indexes
+
+Composite and partial indexes for the filter/sort combinations the repositories run on
+every list, history and availability check.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_asset_location_state", "asset", ["asset_location", "asset_state"]),
+    ("ix_asset_location_asset_code", "asset", ["asset_location", "asset_code"]),
+    ("ix_asset_category_id", "asset", ["category_id"]),
+    ("ix_user_location_status", "user", ["location", "status"]),
+    ("ix_assignment_asset_id_state", "assignment", ["asset_id", "assignment_state"]),
+    ("ix_assignment_asset_id_created_at", "assignment", ["asset_id", "created_at"]),
+    ("ix_assignment_assigned_to_id_state", "assignment", ["assigned_to_id", "assignment_state"]),
+    ("ix_assignment_assigned_by_id", "assignment", ["assigned_by_id"]),
+    ("ix_request_assignment_id_state", "request", ["assignment_id", "request_state"]),
+    ("ix_request_requested_by_id", "request", ["requested_by_id"]),
+    ("ix_request_accepted_by_id", "request", ["accepted_by_id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+    op.create_index(
+        "ix_assignment_active_asset_id",
+        "assignment",
+        ["asset_id"],
+        postgresql_where=sa.text("assignment_state IN ('WAITING_FOR_ACCEPTANCE', 'ACCEPTED')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_assignment_active_asset_id", table_name="assignment")
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
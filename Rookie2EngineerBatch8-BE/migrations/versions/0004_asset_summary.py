@@ -0,0 +1,111 @@
+"""asset summary
+
+Per category and location asset counts for the report, kept current by statement-level
+triggers on asset so the report reads one row per category instead of scanning every asset.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# summary column -> assetstate enum name, total counts every state
+STATE_COLUMNS = {
+    "assigned": "ASSIGNED",
+    "available": "AVAILABLE",
+    "not_available": "NOT_AVAILABLE",
+    "waiting_for_recycling": "WAITING_FOR_RECYCLING",
+    "recycled": "RECYCLED",
+}
+COUNT_COLUMNS = ["total", *STATE_COLUMNS]
+
+
+def aggregate(source: str) -> str:
+    """SELECT summing the signed ``delta`` of ``source`` rows per category and location."""
+    sums = ",\n            ".join(
+        ["SUM(delta)"]
+        + [f"SUM(CASE WHEN asset_state = '{state}' THEN delta ELSE 0 END)" for state in STATE_COLUMNS.values()]
+    )
+    return f"""
+        SELECT category_id, asset_location,
+            {sums}
+        FROM ({source}) AS changes
+        GROUP BY category_id, asset_location
+        -- a fixed lock order keeps concurrent multi-category statements from deadlocking
+        ORDER BY category_id, asset_location"""
+
+
+def upsert(source: str) -> str:
+    columns = ", ".join(COUNT_COLUMNS)
+    updates = ", ".join(f"{column} = asset_summary.{column} + EXCLUDED.{column}" for column in COUNT_COLUMNS)
+    # updates that do not move an asset between states, categories or locations net out to zero
+    changed = " OR ".join(f"{column} <> 0" for column in COUNT_COLUMNS)
+    return f"""
+        INSERT INTO asset_summary (category_id, asset_location, {columns})
+        SELECT * FROM ({aggregate(source)}) AS deltas ({", ".join(["category_id", "asset_location", *COUNT_COLUMNS])})
+        WHERE {changed}
+        ON CONFLICT (category_id, asset_location) DO UPDATE SET {updates};"""
+
+
+NEW_ROWS = "SELECT category_id, asset_location, asset_state, 1 AS delta FROM new_rows"
+OLD_ROWS = "SELECT category_id, asset_location, asset_state, -1 AS delta FROM old_rows"
+
+TRIGGERS = {
+    # operation: (transition tables, rows that change the counts)
+    "INSERT": ("NEW TABLE AS new_rows", NEW_ROWS),
+    "DELETE": ("OLD TABLE AS old_rows", OLD_ROWS),
+    "UPDATE": ("OLD TABLE AS old_rows NEW TABLE AS new_rows", f"{NEW_ROWS} UNION ALL {OLD_ROWS}"),
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "asset_summary",
+        sa.Column("category_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "asset_location",
+            postgresql.ENUM("HANOI", "HCM", "DANANG", name="location", create_type=False),
+            nullable=False,
+        ),
+        *[sa.Column(column, sa.Integer(), nullable=False, server_default="0") for column in COUNT_COLUMNS],
+        sa.ForeignKeyConstraint(["category_id"], ["category.id"]),
+        sa.PrimaryKeyConstraint("category_id", "asset_location"),
+    )
+
+    for operation, (transition, source) in TRIGGERS.items():
+        name = f"asset_summary_after_{operation.lower()}"
+        op.execute(f"""
+            CREATE FUNCTION {name}() RETURNS trigger LANGUAGE plpgsql AS $$
+            BEGIN
+                {upsert(source)}
+                RETURN NULL;
+            END
+            $$;
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {name} AFTER {operation} ON asset
+            REFERENCING {transition}
+            FOR EACH STATEMENT EXECUTE FUNCTION {name}();
+        """)
+
+    # backfill from the existing assets, the triggers take over from here
+    op.execute(upsert("SELECT category_id, asset_location, asset_state, 1 AS delta FROM asset"))
+
+
+def downgrade() -> None:
+    for operation in reversed(list(TRIGGERS)):
+        name = f"asset_summary_after_{operation.lower()}"
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON asset")
+        op.execute(f"DROP FUNCTION IF EXISTS {name}()")
+    op.drop_table("asset_summary")
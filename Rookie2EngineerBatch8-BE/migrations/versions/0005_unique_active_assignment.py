@@ -0,0 +1,44 @@
+"""unique active assignment
+
+Turns the partial index on open assignments into a unique one, so the database refuses a
+second open assignment of the same asset even when two requests pass the availability check
+at the same moment.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_ASSIGNMENT = "assignment_state IN ('WAITING_FOR_ACCEPTANCE', 'ACCEPTED')"
+
+
+def upgrade() -> None:
+    op.drop_index("ix_assignment_active_asset_id", table_name="assignment")
+    op.create_index(
+        "uq_assignment_active_asset_id",
+        "assignment",
+        ["asset_id"],
+        unique=True,
+        postgresql_where=sa.text(ACTIVE_ASSIGNMENT),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_assignment_active_asset_id", table_name="assignment")
+    op.create_index(
+        "ix_assignment_active_asset_id",
+        "assignment",
+        ["asset_id"],
+        postgresql_where=sa.text(ACTIVE_ASSIGNMENT),
+    )
@@ -0,0 +1,34 @@
+"""staff code sequence
+
+Sequence the staff code numbers are drawn from, started after the highest SDxxxx code in use.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEQUENCE = "user_staff_code_seq"
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence(SEQUENCE)))
+    op.execute(f"""
+        SELECT setval('{SEQUENCE}', COALESCE(MAX(CAST(SUBSTRING(staff_code FROM 3) AS INTEGER)), 0) + 1, false)
+        FROM "user"
+        WHERE staff_code ~ '^SD[0-9]+$'
+    """)
+
+
+def downgrade() -> None:
+    op.execute(sa.schema.DropSequence(sa.Sequence(SEQUENCE)))
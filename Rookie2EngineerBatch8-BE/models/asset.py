@@ -1,7 +1,9 @@
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 from typing import List, TYPE_CHECKING
 from models.base import Base
 from models.category import Category
+from models.search import trigram_index
 from datetime import date
 from enums.asset.state import AssetState
 from enums.shared.location import Location
@@ -11,6 +13,14 @@ if TYPE_CHECKING:
 
 class Asset(Base, table=True):
     __tablename__ = "asset"
+    __table_args__ = (
+        trigram_index("asset", "asset_code"),
+        trigram_index("asset", "asset_name"),
+        # asset list: location is always filtered, state and the default code sort follow
+        Index("ix_asset_location_state", "asset_location", "asset_state"),
+        Index("ix_asset_location_asset_code", "asset_location", "asset_code"),
+        Index("ix_asset_category_id", "category_id"),
+    )
     asset_code: str = Field(...)
     asset_name: str = Field(...)
     specification: str = Field(...)
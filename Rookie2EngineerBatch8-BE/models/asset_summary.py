@@ -0,0 +1,20 @@
+from sqlmodel import Field, SQLModel
+from enums.shared.location import Location
+
+
+class AssetSummary(SQLModel, table=True):
+    """
+    Asset counts per category and location, one column per state.
+
+    Rows are maintained by statement-level triggers on ``asset`` (migration 0004), so every
+    write path, bulk inserts included, keeps them current. Never write to this table directly.
+    """
+    __tablename__ = "asset_summary"
+    category_id: int = Field(foreign_key="category.id", primary_key=True)
+    asset_location: Location = Field(primary_key=True)
+    total: int = Field(default=0)
+    assigned: int = Field(default=0)
+    available: int = Field(default=0)
+    not_available: int = Field(default=0)
+    waiting_for_recycling: int = Field(default=0)
+    recycled: int = Field(default=0)
@@ -1,3 +1,4 @@
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship
 from typing import TYPE_CHECKING, Optional
 from models.base import Base
@@ -9,8 +10,25 @@ if TYPE_CHECKING:
     from models.user import User
     from models.request import Request
 
+ACTIVE_ASSIGNMENT = "assignment_state IN ('WAITING_FOR_ACCEPTANCE', 'ACCEPTED')"
+ACTIVE_ASSIGNMENT_INDEX = "uq_assignment_active_asset_id"
+
 class Assignment(Base, table=True):
     __tablename__ = "assignment"
+    __table_args__ = (
+        Index("ix_assignment_asset_id_state", "asset_id", "assignment_state"),
+        Index("ix_assignment_asset_id_created_at", "asset_id", "created_at"),
+        Index("ix_assignment_assigned_to_id_state", "assigned_to_id", "assignment_state"),
+        Index("ix_assignment_assigned_by_id", "assigned_by_id"),
+        # an asset has at most one open assignment, the availability check reads the same index
+        Index(
+            ACTIVE_ASSIGNMENT_INDEX,
+            "asset_id",
+            unique=True,
+            postgresql_where=text(ACTIVE_ASSIGNMENT),
+            sqlite_where=text(ACTIVE_ASSIGNMENT),
+        ),
+    )
     asset_id: int = Field(foreign_key="asset.id")
     assigned_to_id: int = Field(foreign_key="user.id")
     assigned_by_id: int = Field(foreign_key="user.id")
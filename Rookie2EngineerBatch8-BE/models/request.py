@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 from typing import Optional, TYPE_CHECKING
 from models.base import Base
@@ -10,6 +11,11 @@ if TYPE_CHECKING:
 
 class Request(Base, table=True):
     __tablename__ = "request"
+    __table_args__ = (
+        Index("ix_request_assignment_id_state", "assignment_id", "request_state"),
+        Index("ix_request_requested_by_id", "requested_by_id"),
+        Index("ix_request_accepted_by_id", "accepted_by_id"),
+    )
     assignment_id: int = Field(foreign_key="assignment.id")
     requested_by_id: int = Field(foreign_key="user.id")
     accepted_by_id: Optional[int] = Field(foreign_key="user.id", default=None)
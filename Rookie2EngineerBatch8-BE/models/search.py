@@ -0,0 +1,22 @@
+from sqlalchemy import DDL, Index, event
+from sqlmodel import SQLModel
+
+TRIGRAM_OPS = "gin_trgm_ops"
+
+
+def trigram_index(table_name: str, column: str) -> Index:
+    """GIN trigram index so leading-wildcard ILIKE searches on the column can skip the sequential scan."""
+    return Index(
+        f"ix_{table_name}_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: TRIGRAM_OPS},
+    )
+
+
+# the operator class has to exist before create_all builds the trigram indexes
+event.listen(
+    SQLModel.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
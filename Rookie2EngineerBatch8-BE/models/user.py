@@ -1,4 +1,5 @@
-from sqlmodel import Field, Relationship
+from sqlalchemy import Index, Sequence
+from sqlmodel import Field, Relationship, SQLModel
 from enums.user.gender import Gender
 from enums.user.status import Status
 from enums.user.type import Type
@@ -6,13 +7,24 @@ from enums.shared.location import Location
 from datetime import date
 from typing import Optional, TYPE_CHECKING, List
 from models.base import Base
+from models.search import trigram_index
 
 if TYPE_CHECKING:
     from models.assignment import Assignment
     from models.request import Request
 
+# numbers of the SDxxxx staff codes, a sequence never hands out a number twice
+STAFF_CODE_SEQUENCE = Sequence("user_staff_code_seq", metadata=SQLModel.metadata)
+
 class User(Base, table=True):
     __tablename__ = "user"
+    __table_args__ = (
+        trigram_index("user", "staff_code"),
+        trigram_index("user", "username"),
+        trigram_index("user", "first_name"),
+        trigram_index("user", "last_name"),
+        Index("ix_user_location_status", "location", "status"),
+    )
     staff_code: str = Field(unique=True, index=True)
     username: str = Field(unique=True, index=True)
     password: str
@@ -1,16 +1,21 @@
 from schemas.query.check.isValid import IsValid
-from schemas.shared.paginated_response import PaginatedResponse, PaginationMeta
+from schemas.shared.paginated_response import PaginatedResponse
+from repositories.pagination import apply_sort, paginate
+from repositories.projection import asset_read
+from repositories.search import search_filter, search_rank
 from schemas.query.filter.asset import AssetFilter
 from schemas.query.sort.sort_type import SortAssetBy, SortDirection
 from schemas.asset import AssetRead, AssetUpdate
 from models.asset import Asset
 from models.assignment import Assignment
 from models.category import Category
+from sqlalchemy import insert, update
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, func
 from enums.shared.location import Location
 from enums.asset.state import AssetState
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 
 class AssetRepository:
@@ -20,7 +25,8 @@ class AssetRepository:
     def get_assets_paginated(
         self, states: Optional[List[AssetState]], asset_filter: AssetFilter, current_user_location: Location
     ) -> PaginatedResponse[AssetRead]:
-        query = self.db.query(Asset)\
+        projection = asset_read()
+        query = self.db.query(*projection.columns)\
             .join(Category, onclause=Asset.category_id == Category.id,
                   isouter=True)
         query = query.filter(Asset.asset_location == current_user_location)        
@@ -32,65 +38,52 @@ class AssetRepository:
             query = query.filter(
                 Category.category_name.ilike(f"%{asset_filter.category}%"))
 
+        search_columns = (Asset.asset_code, Asset.asset_name)
         if asset_filter.search:
-            query = query.filter(
-                (Asset.asset_code.ilike(f"%{asset_filter.search}%"))
-                | (Asset.asset_name.ilike(f"%{asset_filter.search}%"))
-            )
-
-        if asset_filter.sort_by:
-            if asset_filter.sort_by == SortAssetBy.ASSET_CODE:
-                query = query.order_by(
-                    Asset.asset_code.asc()
-                    if asset_filter.sort_direction == SortDirection.ASC
-                    else Asset.asset_code.desc()
-                )
-            elif asset_filter.sort_by == SortAssetBy.ASSET_NAME:
-                query = query.order_by(
-                    func.lower(Asset.asset_name).asc()
-                    if asset_filter.sort_direction == SortDirection.ASC
-                    else func.lower(Asset.asset_name).desc()
-                )
-            elif asset_filter.sort_by == SortAssetBy.CATEGORY:
-                query = query.order_by(
-                    func.lower(Category.category_name).asc()
-                    if asset_filter.sort_direction == SortDirection.ASC
-                    else func.lower(Category.category_name).desc()
-                )
-            elif asset_filter.sort_by == SortAssetBy.STATE:
-                query = query.order_by(
-                    Asset.asset_state.asc()
-                    if asset_filter.sort_direction == SortDirection.ASC
-                    else Asset.asset_state.desc()
-                )
-            elif asset_filter.sort_by == SortAssetBy.UPDATED_AT:
-                query = query.order_by(
-                    Asset.updated_at.asc()
-                    if asset_filter.sort_direction == SortDirection.ASC
-                    else Asset.updated_at.desc()
-                )
-
-        total = query.count()
-        total_pages = (total + asset_filter.size - 1) // asset_filter.size
-
-        assets = (
-            query.offset((asset_filter.page - 1) * asset_filter.size)
-            .limit(asset_filter.size)
-            .all()
-        )
+            query = query.filter(search_filter(asset_filter.search, *search_columns))
+
+        sort_columns = {
+            SortAssetBy.ASSET_CODE: Asset.asset_code,
+            SortAssetBy.ASSET_NAME: func.lower(Asset.asset_name),
+            SortAssetBy.CATEGORY: func.lower(Category.category_name),
+            SortAssetBy.STATE: Asset.asset_state,
+            SortAssetBy.UPDATED_AT: Asset.updated_at,
+        }
+        if asset_filter.search:
+            sort_columns[SortAssetBy.RELEVANCE] = search_rank(asset_filter.search, *search_columns)
+        sort_expression = sort_columns.get(SortAssetBy(asset_filter.sort_by)) if asset_filter.sort_by else None
+        query = apply_sort(query, sort_expression, asset_filter.sort_direction)
 
-        return PaginatedResponse(
-            data=assets,
-            meta=PaginationMeta(
-                total=total,
-                total_pages=total_pages,
-                page=asset_filter.page,
-                page_size=asset_filter.size,
-            ),
+        rows, meta = paginate(
+            query, asset_filter, Asset.id, sort_expression, asset_filter.sort_direction
         )
 
-    def get_asset_by_id(self, asset_id: int) -> Asset:
-        return self.db.query(Asset).filter(Asset.id == asset_id).first()
+        return PaginatedResponse(data=projection.build_all(rows), meta=meta)
+
+    def get_asset_by_id(self, asset_id: int, for_update: bool = False) -> Asset:
+        """
+        Get an asset by ID. With ``for_update`` the row stays locked until the caller's
+        transaction ends, and is read again even if the session already holds it.
+        """
+        query = self.db.query(Asset).filter(Asset.id == asset_id)
+        if for_update:
+            query = query.with_for_update().populate_existing()
+        return query.first()
+
+    def get_assets_by_ids(self, asset_ids: Iterable[int], for_update: bool = False) -> List[Asset]:
+        """
+        Fetch the given assets with their categories. With ``for_update`` the asset rows are
+        locked in id order, so two batches touching the same assets cannot deadlock.
+        """
+        query = (
+            self.db.query(Asset)
+            .options(selectinload(Asset.category))
+            .filter(Asset.id.in_(list(asset_ids)))
+            .order_by(Asset.id)
+        )
+        if for_update:
+            query = query.with_for_update(of=Asset).populate_existing()
+        return query.all()
 
     def create_asset(self, asset_data: Asset) -> Asset:
         """Create a new asset."""
@@ -101,9 +94,16 @@ class AssetRepository:
         self.db.refresh(asset_data)
         return asset_data
 
-    def update_asset(self, asset_id: int, asset_update: AssetUpdate) -> Asset:
-        """Update an asset."""
-        asset = self.db.query(Asset).filter(Asset.id == asset_id).first()
+    def bulk_create_assets(self, assets: List[dict]) -> None:
+        """Insert many assets, SQLAlchemy batches them into multi-row INSERT statements."""
+        if not assets:
+            return
+        self.db.execute(insert(Asset), assets)
+        self.db.commit()
+
+    def update_asset(self, asset_id: int, asset_update: AssetUpdate, commit: bool = True) -> Asset:
+        """Update an asset. With ``commit=False`` the change is left to the caller's unit of work."""
+        asset = self.db.get(Asset, asset_id)
 
         # Get only the set fields from update request
         update_data = asset_update.model_dump(exclude_unset=True)
@@ -114,10 +114,21 @@ class AssetRepository:
                 setattr(asset, field, value)
 
         asset.updated_at = datetime.now(timezone.utc)
-        self.db.commit()
-        self.db.refresh(asset)
+        if commit:
+            self.db.commit()
+            self.db.refresh(asset)
         return asset
 
+    def update_asset_states(self, asset_ids: Iterable[int], asset_state: AssetState, commit: bool = True) -> None:
+        """Set the state of many assets with one UPDATE, assets already in the session are updated too."""
+        self.db.execute(
+            update(Asset)
+            .where(Asset.id.in_(list(asset_ids)))
+            .values(asset_state=asset_state, updated_at=datetime.now(timezone.utc))
+        )
+        if commit:
+            self.db.commit()
+
     def delete_asset(self, asset: Asset) -> None:
         self.db.delete(asset)
         self.db.commit()
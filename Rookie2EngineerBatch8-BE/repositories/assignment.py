@@ -1,5 +1,6 @@
 from datetime import date, datetime, timezone
-from sqlalchemy import func
+from typing import Dict, Iterable, List, Optional, Set
+from sqlalchemy import func, insert, update
 from sqlalchemy.orm import Session, aliased, joinedload
 from core.exceptions import NotFoundException
 from enums.assignment.state import AssignmentState
@@ -7,9 +8,13 @@ from enums.assignment.state import AssignmentState
 from models.asset import Asset
 from models.category import Category
 from schemas.query.filter.assignment import AssignmentFilter, HomeAssignmentFilter
-from schemas.assignment import AssignmentRead, AssignmentUpdate, AssignmentStateUpdate, AssignmentUpdateResponse, AssignmentUserReadByUID
+from schemas.assignment import AssignmentRead, AssignmentReadDetail, AssignmentReadSimple, AssignmentUpdate, AssignmentStateUpdate, AssignmentUpdateResponse, AssignmentUserReadByUID
 from schemas.asset import AssetRead
-from schemas.shared.paginated_response import PaginatedResponse, PaginationMeta
+from schemas.shared.paginated_response import PaginatedResponse
+from repositories.loading import assignment_options
+from repositories.pagination import apply_sort, paginate
+from repositories.projection import Converted, Projection, asset_read, to_date, user_read
+from repositories.search import search_filter, search_rank
 from models.assignment import Assignment
 from models.user import User
 from schemas.query.sort.sort_type import SortAssignmentBy, SortDirection, SortHomeAssignmentBy
@@ -30,8 +35,22 @@ class AssignmentRepository:
         AssignedToUser = aliased(User)
         AssignedByUser = aliased(User)
         
-        query = self.db.query(Assignment)\
+        projection = Projection(
+            AssignmentRead,
+            asset_id=Assignment.asset_id,
+            assigned_to_id=Assignment.assigned_to_id,
+            assigned_by_id=Assignment.assigned_by_id,
+            assigned_to_username=AssignedToUser.username,
+            assigned_by_username=AssignedByUser.username,
+            assignment_note=Assignment.assignment_note,
+            id=Assignment.id,
+            assign_date=Converted(Assignment.assign_date, to_date),
+            assignment_state=Assignment.assignment_state,
+            asset=asset_read(),
+        )
+        query = self.db.query(*projection.columns)\
             .join(Asset, Assignment.asset_id == Asset.id)\
+            .join(Category, Asset.category_id == Category.id)\
             .join(AssignedToUser, Assignment.assigned_to_id == AssignedToUser.id, isouter=True)\
             .join(AssignedByUser, Assignment.assigned_by_id == AssignedByUser.id, isouter=True)\
             .filter(
@@ -50,97 +69,29 @@ class AssignmentRepository:
         if assignment_filter.asset_id:
             query = query.filter(Assignment.asset_id == assignment_filter.asset_id)
         
+        search_columns = (Asset.asset_code, Asset.asset_name, AssignedToUser.username)
         if assignment_filter.search:
-            query = query.filter(
-                (Asset.asset_code.ilike(f"%{assignment_filter.search}%"))
-                | (Asset.asset_name.ilike(f"%{assignment_filter.search}%"))
-                | (AssignedToUser.username.ilike(f"%{assignment_filter.search}%"))
-            )
+            query = query.filter(search_filter(assignment_filter.search, *search_columns))
         
-        if assignment_filter.sort_by:
-            if assignment_filter.sort_by == SortAssignmentBy.ID:
-                query = query.order_by(
-                    Assignment.id.asc()
-                    if assignment_filter.sort_direction == SortDirection.ASC
-                    else Assignment.id.desc()
-                )
-            elif assignment_filter.sort_by == SortAssignmentBy.ASSET_CODE:
-                query = query.order_by(
-                    Asset.asset_code.asc()
-                    if assignment_filter.sort_direction == SortDirection.ASC
-                    else Asset.asset_code.desc()
-                )
-            elif assignment_filter.sort_by == SortAssignmentBy.ASSET_NAME:
-                query = query.order_by(
-                    Asset.asset_name.asc()
-                    if assignment_filter.sort_direction == SortDirection.ASC
-                    else Asset.asset_name.desc()
-                )
-            elif assignment_filter.sort_by == SortAssignmentBy.ASSIGNED_TO:
-                query = query.order_by(
-                    AssignedToUser.username.asc()
-                    if assignment_filter.sort_direction == SortDirection.ASC
-                    else AssignedToUser.username.desc()
-                )
-            elif assignment_filter.sort_by == SortAssignmentBy.ASSIGNED_BY:
-                query = query.order_by(
-                    AssignedByUser.username.asc()
-                    if assignment_filter.sort_direction == SortDirection.ASC
-                    else AssignedByUser.username.desc()
-                )
-            elif assignment_filter.sort_by == SortAssignmentBy.ASSIGN_DATE:
-                query = query.order_by(
-                    Assignment.assign_date.asc()
-                    if assignment_filter.sort_direction == SortDirection.ASC
-                    else Assignment.assign_date.desc()
-                )
-            elif assignment_filter.sort_by == SortAssignmentBy.STATE:
-                query = query.order_by(
-                    Assignment.assignment_state.asc()
-                    if assignment_filter.sort_direction == SortDirection.ASC
-                    else Assignment.assignment_state.desc()
-                )
-            elif assignment_filter.sort_by == SortAssignmentBy.UPDATED_AT:
-                query = query.order_by(
-                    Assignment.updated_at.asc()
-                    if assignment_filter.sort_direction == SortDirection.ASC
-                    else Assignment.updated_at.desc()
-                )
-
-        total = query.count()
-        total_pages = (total + assignment_filter.size - 1) // assignment_filter.size
-
-        assignments = (
-            query.offset((assignment_filter.page - 1) * assignment_filter.size)
-            .limit(assignment_filter.size)
-            .all()
-        )
+        sort_columns = {
+            SortAssignmentBy.ID: Assignment.id,
+            SortAssignmentBy.ASSET_CODE: Asset.asset_code,
+            SortAssignmentBy.ASSET_NAME: Asset.asset_name,
+            SortAssignmentBy.ASSIGNED_TO: AssignedToUser.username,
+            SortAssignmentBy.ASSIGNED_BY: AssignedByUser.username,
+            SortAssignmentBy.ASSIGN_DATE: Assignment.assign_date,
+            SortAssignmentBy.STATE: Assignment.assignment_state,
+            SortAssignmentBy.UPDATED_AT: Assignment.updated_at,
+        }
+        if assignment_filter.search:
+            sort_columns[SortAssignmentBy.RELEVANCE] = search_rank(assignment_filter.search, *search_columns)
+        sort_expression = sort_columns.get(SortAssignmentBy(assignment_filter.sort_by)) if assignment_filter.sort_by else None
+        query = apply_sort(query, sort_expression, assignment_filter.sort_direction)
 
-        # Map Assignment models to AssignmentRead DTOs
-        assignment_reads = [
-            AssignmentRead(
-                id=assignment.id,
-                assign_date=assignment.assign_date.date(),
-                assignment_state=assignment.assignment_state,
-                asset_id=assignment.asset_id,
-                assigned_to_id=assignment.assigned_to_id,
-                assigned_by_id=assignment.assigned_by_id,
-                assigned_to_username=assignment.assigned_to_user.username,
-                assigned_by_username=assignment.assigned_by_user.username,
-                assignment_note=assignment.assignment_note,
-                asset=AssetRead.model_validate(assignment.asset, from_attributes=True)
-            )
-            for assignment in assignments
-        ]
-        return PaginatedResponse(
-            data=assignment_reads,  # Return DTOs instead of models
-            meta=PaginationMeta(
-                total=total,
-                total_pages=total_pages,
-                page=assignment_filter.page,
-                page_size=assignment_filter.size,
-            ),
+        rows, meta = paginate(
+            query, assignment_filter, Assignment.id, sort_expression, assignment_filter.sort_direction
         )
+        return PaginatedResponse(data=projection.build_all(rows), meta=meta)
 
     def get_assignment_by_id(self, assignment_id: int) -> Assignment:
         return ( 
@@ -154,6 +105,35 @@ class AssignmentRepository:
                 .first()
             )
     
+    def get_assignment_detail(self, assignment_id: int) -> Optional[AssignmentReadDetail]:
+        """The assignment with its asset, the asset's category and both users, read in one joined query."""
+        AssignedToUser = aliased(User)
+        AssignedByUser = aliased(User)
+
+        projection = Projection(
+            AssignmentReadDetail,
+            assignment=Projection(
+                AssignmentReadSimple,
+                id=Assignment.id,
+                assign_date=Converted(Assignment.assign_date, to_date),
+                assignment_state=Assignment.assignment_state,
+                assignment_note=Assignment.assignment_note,
+            ),
+            assigned_to_user=user_read(AssignedToUser),
+            assigned_by_user=user_read(AssignedByUser),
+            asset=asset_read(),
+        )
+        row = (
+            self.db.query(*projection.columns)
+            .join(Asset, Assignment.asset_id == Asset.id)
+            .join(Category, Asset.category_id == Category.id)
+            .join(AssignedToUser, Assignment.assigned_to_id == AssignedToUser.id)
+            .join(AssignedByUser, Assignment.assigned_by_id == AssignedByUser.id)
+            .filter(Assignment.id == assignment_id)
+            .first()
+        )
+        return projection.build(row) if row else None
+
     def update_assignment(
         self, assignment_id: int, assignment_update: AssignmentUpdate, assigned_by_id: int
     ) -> AssignmentUpdateResponse:
@@ -185,51 +165,25 @@ class AssignmentRepository:
             self.db.query(Assignment)
             .join(Asset, Assignment.asset_id == Asset.id)
             .join(Category, Asset.category_id == Category.id)
+            .options(*assignment_options(category_joined=True))
             .filter(
                 Assignment.assigned_to_id == user_id,
                 Assignment.assignment_state.notin_([AssignmentState.DECLINED, AssignmentState.RETURNED]),
                 func.date(Assignment.assign_date) <= end_date,
             )
         )
-        if pagination.sort_by:
-            if pagination.sort_by == SortHomeAssignmentBy.ASSET_CODE:
-                query = query.order_by(
-                    Asset.asset_code.asc()
-                    if pagination.sort_direction == SortDirection.ASC
-                    else Asset.asset_code.desc()
-                )
-            elif pagination.sort_by == SortHomeAssignmentBy.ASSET_NAME:
-                query = query.order_by(
-                    Asset.asset_name.asc()
-                    if pagination.sort_direction == SortDirection.ASC
-                    else Asset.asset_name.desc()
-                )
-            elif pagination.sort_by == SortHomeAssignmentBy.CATEGORY:
-                query = query.order_by(
-                    Category.category_name.asc()
-                    if pagination.sort_direction == SortDirection.ASC
-                    else Category.category_name.desc()
-                )
-            elif pagination.sort_by == SortHomeAssignmentBy.STATE:
-                query = query.order_by(
-                    Assignment.assignment_state.asc()
-                    if pagination.sort_direction == SortDirection.ASC
-                    else Assignment.assignment_state.desc()
-                )
-            elif pagination.sort_by == SortHomeAssignmentBy.ASSIGN_DATE:
-                query = query.order_by(
-                    Assignment.assign_date.asc()
-                    if pagination.sort_direction == SortDirection.ASC
-                    else Assignment.assign_date.desc()
-                )
+        sort_columns = {
+            SortHomeAssignmentBy.ASSET_CODE: Asset.asset_code,
+            SortHomeAssignmentBy.ASSET_NAME: Asset.asset_name,
+            SortHomeAssignmentBy.CATEGORY: Category.category_name,
+            SortHomeAssignmentBy.STATE: Assignment.assignment_state,
+            SortHomeAssignmentBy.ASSIGN_DATE: Assignment.assign_date,
+        }
+        sort_expression = sort_columns.get(SortHomeAssignmentBy(pagination.sort_by)) if pagination.sort_by else None
+        query = apply_sort(query, sort_expression, pagination.sort_direction)
 
-        total = query.count()
-        total_pages = (total + pagination.size - 1) // pagination.size
-
-        assignments = (
-            query.offset((pagination.page - 1) * pagination.size)
-            .limit(pagination.size)
-            .all()
+        assignments, meta = paginate(
+            query, pagination, Assignment.id, sort_expression, pagination.sort_direction
         )
 
         assignment_reads = [
@@ -245,55 +199,49 @@ class AssignmentRepository:
             for assignment in assignments
         ]
 
-        return PaginatedResponse(
-            data=assignment_reads,
-            meta=PaginationMeta(
-                total=total,
-                total_pages=total_pages,
-                page=pagination.page,
-                page_size=pagination.size,
-            ),
-        )
+        return PaginatedResponse(data=assignment_reads, meta=meta)
 
     def update_assignment_state(
-        self, assignment_id: int, assignment: AssignmentStateUpdate
+        self, assignment_id: int, assignment: AssignmentStateUpdate, commit: bool = True
     ) -> Assignment:
         """
-        Update an assignment's state by ID.
+        Update an assignment's state by ID. With ``commit=False`` the change is left to the caller's unit of work.
         """
-        assignment_model = self.db.query(Assignment).filter(
-            Assignment.id == assignment_id
-        ).first()
+        assignment_model = self.db.get(Assignment, assignment_id)
         if not assignment_model:
             logger.error(f"Assignment {assignment_id} not found")
             raise NotFoundException(detail="Assignment not found")
         
         assignment_model.assignment_state = assignment.assignment_state
-        self.db.commit()
-        self.db.refresh(assignment_model)
+        if commit:
+            self.db.commit()
+            self.db.refresh(assignment_model)
         return assignment_model
 
-    def create_assignment(self, assignment: Assignment) -> Assignment:
+    def create_assignment(self, assignment: Assignment, commit: bool = True) -> Assignment:
         """
         Save an assignment to the database
         
         Args:
             assignment: The assignment object to save
+            commit: False only stages the insert for the caller's unit of work
             
         Returns:
-            Assignment: The saved assignment with ID
+            Assignment: The saved assignment with ID, once committed or flushed
         """
         self.db.add(assignment)
-        self.db.commit()
-        self.db.refresh(assignment)
+        if commit:
+            self.db.commit()
+            self.db.refresh(assignment)
         return assignment
         
-    def delete_assignment(self, assignment: Assignment) -> None:
+    def delete_assignment(self, assignment: Assignment, commit: bool = True) -> None:
         """
         Delete an assignment by ID.
         """
         self.db.delete(assignment)
-        self.db.commit()
+        if commit:
+            self.db.commit()
         
     def is_asset_available(self, asset_id: int) -> bool:
         """Check if an asset is available for assignment"""
@@ -308,17 +256,68 @@ class AssignmentRepository:
         
         return active_assignments == 0
 
+    def get_assigned_asset_ids(self, asset_ids: Iterable[int]) -> Set[int]:
+        """The assets among ``asset_ids`` that already have an open assignment, in one query."""
+        rows = self.db.query(Assignment.asset_id).filter(
+            Assignment.asset_id.in_(list(asset_ids)),
+            Assignment.assignment_state.in_([
+                AssignmentState.WAITING_FOR_ACCEPTANCE,
+                AssignmentState.ACCEPTED
+            ])
+        ).all()
+        return {asset_id for asset_id, in rows}
+
+    def bulk_create_assignments(self, assignments: List[dict], commit: bool = True) -> Dict[int, int]:
+        """
+        Insert many assignments with multi-row INSERTs. Returns the new ID per asset, the
+        assets of one call are distinct.
+        """
+        if not assignments:
+            return {}
+        rows = self.db.execute(
+            insert(Assignment).returning(Assignment.asset_id, Assignment.id), assignments
+        ).all()
+        if commit:
+            self.db.commit()
+        return dict(rows)
+
+    def get_assignments_by_ids(self, assignment_ids: Iterable[int], for_update: bool = False) -> List[Assignment]:
+        """Fetch the given assignments in one query, locked in id order with ``for_update``."""
+        query = self.db.query(Assignment).filter(Assignment.id.in_(list(assignment_ids))).order_by(Assignment.id)
+        if for_update:
+            query = query.with_for_update().populate_existing()
+        return query.all()
+
+    def update_assignment_states(
+        self, assignment_ids: Iterable[int], assignment_state: AssignmentState, commit: bool = True
+    ) -> None:
+        """Set the state of many assignments with one UPDATE."""
+        self.db.execute(
+            update(Assignment)
+            .where(Assignment.id.in_(list(assignment_ids)))
+            .values(assignment_state=assignment_state, updated_at=datetime.now(timezone.utc))
+        )
+        if commit:
+            self.db.commit()
+
     def get_assignment_by_id_no_join(self, assignment_id: int) -> Assignment:
         return self.db.query(Assignment).filter(Assignment.id == assignment_id).first()
     
     def get_assignment_history(self, asset_id: int, filter: AssignmentFilter) -> PaginatedResponse[AssetHistory]:
         # Create aliases for the User table to avoid conflicts
-        from sqlalchemy.orm import aliased
         AssignedToUser = aliased(User)
         AssignedByUser = aliased(User)
         
+        projection = Projection(
+            AssetHistory,
+            id=Assignment.id,
+            assign_date=Converted(Assignment.assign_date, to_date),
+            assigned_to=AssignedToUser.username,
+            assigned_by=AssignedByUser.username,
+            return_date=Converted(Request.return_date, to_date),
+        )
         query = (
-            self.db.query(Assignment)
+            self.db.query(*projection.columns)
             .join(Asset, Assignment.asset_id == Asset.id)
             .join(AssignedToUser, Assignment.assigned_to_id == AssignedToUser.id)
             .join(AssignedByUser, Assignment.assigned_by_id == AssignedByUser.id)
@@ -333,33 +332,8 @@ class AssignmentRepository:
             .order_by(Assignment.created_at.desc())  # Sort from latest to oldest
         )
         
-        total = query.count()
-        total_pages = (total + filter.size - 1) // filter.size
-
-        assignments = (
-            query.offset((filter.page - 1) * filter.size)
-            .limit(filter.size)
-            .all()
-        )
-        
-        # Create AssetHistory objects for each assignment
-        asset_history = [
-            AssetHistory(
-                id=assignment.id,
-                assign_date=assignment.assign_date.date(),  # Convert datetime to date
-                assigned_to=assignment.assigned_to_user.username,
-                assigned_by=assignment.assigned_by_user.username,
-                return_date=assignment.requests.return_date.date() if assignment.requests and assignment.requests.return_date else None
-            )
-            for assignment in assignments  # Iterate over each assignment
-        ]
-        
-        return PaginatedResponse(
-            data=asset_history,
-            meta=PaginationMeta(
-                total=total,
-                total_pages=total_pages,
-                page=filter.page,
-                page_size=filter.size,
-            ),
+        rows, meta = paginate(
+            query, filter, Assignment.id, Assignment.created_at, SortDirection.DESC
         )
+
+        return PaginatedResponse(data=projection.build_all(rows), meta=meta)
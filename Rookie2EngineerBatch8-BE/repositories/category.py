@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from models.category import Category  # Ensure you have a Category model
-from typing import Optional, List
+from typing import Iterable, Optional, List, Tuple
+from sqlalchemy import update
 from sqlalchemy.sql import func
 
 class CategoryRepository:
@@ -15,6 +16,29 @@ class CategoryRepository:
         """Fetch a single category by its ID."""
         return self.db.query(Category).filter(Category.id == category_id).first()
 
+    def get_categories_by_ids(self, category_ids: Iterable[int]) -> List[Category]:
+        """Fetch the given categories in one query."""
+        return self.db.query(Category).filter(Category.id.in_(list(category_ids))).all()
+
+    def reserve_id_range(self, category_id: int, count: int) -> Optional[Tuple[str, int]]:
+        """
+        Advance the category's id_counter by ``count`` in a single statement.
+
+        Returns the category prefix and the first reserved number, None when the category does
+        not exist. The counter row stays locked until the caller's transaction ends.
+        """
+        row = self.db.execute(
+            update(Category)
+            .where(Category.id == category_id)
+            .values(id_counter=Category.id_counter + count)
+            .returning(Category.prefix, Category.id_counter)
+            .execution_options(synchronize_session=False)
+        ).first()
+        if row is None:
+            return None
+        prefix, last_counter = row
+        return prefix, last_counter - count + 1
+
     def get_next_id_counter(self, prefix: str) -> int:
         """Get the next id_counter value for a given prefix."""
         last_category = (
@@ -0,0 +1,34 @@
+"""
+Loader options for the list endpoints that still map ORM entities.
+
+The listings already join the tables they filter and sort on, ``contains_eager`` fills the
+relationships from those same rows. Relationships whose table is not part of the query are
+fetched with ``selectinload``, one extra query per page instead of one lazy load per row.
+"""
+from typing import List, Optional
+from sqlalchemy.orm import contains_eager, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlalchemy.orm.util import AliasedClass
+from models.asset import Asset
+from models.assignment import Assignment
+
+
+def _user(relationship, alias: Optional[AliasedClass]) -> LoaderOption:
+    if alias is None:
+        return selectinload(relationship)
+    return contains_eager(relationship.of_type(alias))
+
+
+def assignment_options(
+    assigned_to: Optional[AliasedClass] = None,
+    assigned_by: Optional[AliasedClass] = None,
+    category_joined: bool = False,
+) -> List[LoaderOption]:
+    """Options for assignment rows mapped with their asset, its category and both users. Asset must be joined."""
+    asset = contains_eager(Assignment.asset)
+    return [
+        asset.contains_eager(Asset.category) if category_joined else asset.selectinload(Asset.category),
+        _user(Assignment.assigned_to_user, assigned_to),
+        _user(Assignment.assigned_by_user, assigned_by),
+    ]
+
@@ -0,0 +1,220 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, List, Optional, Tuple
+from sqlalchemy import and_, func, or_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Query
+from core.exceptions import ValidationException
+from core.logging_config import get_logger
+from schemas.query.sort.sort_type import SortDirection
+from schemas.shared.paginated_param import PaginationParams
+from schemas.shared.paginated_response import PaginationMeta
+
+logger = get_logger(__name__)
+
+
+def apply_sort(query: Query, sort_expression, sort_direction: Optional[SortDirection]) -> Query:
+    """Order the query by the chosen sort expression, no-op when there is nothing to sort by."""
+    if sort_expression is None:
+        return query
+    return query.order_by(
+        sort_expression.asc()
+        if sort_direction == SortDirection.ASC
+        else sort_expression.desc()
+    )
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    payload = json.dumps({"v": _to_json(sort_value), "id": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_expression=None) -> Tuple[Any, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        sort_value = payload["v"]
+        if sort_expression is not None:
+            sort_value = _from_json(sort_value, sort_expression.type)
+        return sort_value, int(payload["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValidationException(detail="Invalid pagination cursor")
+
+
+def paginate(
+    query: Query,
+    params: PaginationParams,
+    id_column,
+    sort_expression=None,
+    sort_direction: Optional[SortDirection] = SortDirection.ASC,
+) -> Tuple[List[Any], PaginationMeta]:
+    """
+    Fetch one page of an already filtered and sorted query together with its total.
+
+    Offset mode is used unless ``params.cursor`` is set. In cursor mode the page starts right
+    after the row encoded in the cursor (an empty cursor means the first page), so deep pages
+    cost the same as the first one. In both modes ``id_column`` breaks ties between equal sort
+    keys, in the sort direction.
+
+    Offset pages read the total from ``COUNT(*) OVER()`` in the same round trip. With
+    ``params.approximate_total`` the planner's row estimate is used instead of counting.
+    Cursor pages never count: ``total`` is the planner's estimate, or None where there is none,
+    and ``page`` is None since a cursor has no page number.
+    """
+    total_is_estimate = False
+    next_cursor = None
+
+    if params.cursor is not None:
+        items, next_cursor = _fetch_after_cursor(
+            query, params, id_column, sort_expression, sort_direction
+        )
+        # counting every row would cost deep pages what keyset paging saves, only estimate
+        total = estimate_count(query)
+        return items, PaginationMeta(
+            total=total,
+            total_pages=None if total is None else (total + params.size - 1) // params.size,
+            page=None,
+            page_size=params.size,
+            next_cursor=next_cursor,
+            total_is_estimate=total is not None,
+        )
+    elif params.approximate_total:
+        query = query.order_by(_tiebreaker(id_column, sort_direction))
+        items = query.offset((params.page - 1) * params.size).limit(params.size).all()
+        total, total_is_estimate = _approximate_total(query, params, len(items))
+    else:
+        items, total = _fetch_page_with_total(query.order_by(_tiebreaker(id_column, sort_direction)), params)
+
+    return items, PaginationMeta(
+        total=total,
+        total_pages=(total + params.size - 1) // params.size,
+        page=params.page,
+        page_size=params.size,
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
+    )
+
+
+def estimate_count(query: Query) -> Optional[int]:
+    """Row count the PostgreSQL planner expects for the query, None when it is not available."""
+    session = query.session
+    bind = session.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+    try:
+        statement = query.statement.compile(dialect=bind.dialect, compile_kwargs={"literal_binds": True})
+        plan = session.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}").scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (SQLAlchemyError, NotImplementedError, LookupError, TypeError, ValueError):
+        logger.warning("Could not estimate row count, falling back to COUNT(*)", exc_info=True)
+        return None
+
+
+def _fetch_page_with_total(query: Query, params: PaginationParams) -> Tuple[List[Any], int]:
+    # the window runs after WHERE/JOIN but before LIMIT, so every row carries the full total
+    rows = (
+        query.add_columns(func.count().over().label("total_count"))
+        .offset((params.page - 1) * params.size)
+        .limit(params.size)
+        .all()
+    )
+    if rows:
+        return [_entities(row, 1) for row in rows], rows[0][-1]
+    # past the last page no row is left to carry the total
+    return [], query.count() if params.page > 1 else 0
+
+
+def _approximate_total(query: Query, params: PaginationParams, fetched: int) -> Tuple[int, bool]:
+    offset = (params.page - 1) * params.size
+    if fetched < params.size and (fetched or params.page == 1):
+        # a short page is the last one, the exact total is already known
+        return offset + fetched, False
+    estimate = estimate_count(query)
+    if estimate is None:
+        return query.count(), False
+    return max(estimate, offset + fetched), True
+
+
+def _fetch_after_cursor(query, params, id_column, sort_expression, sort_direction):
+    ascending = sort_direction != SortDirection.DESC
+    key_expression = sort_expression if sort_expression is not None else id_column
+
+    keyed = query.add_columns(key_expression.label("cursor_key"), id_column.label("cursor_id"))
+    if params.cursor:
+        last_value, last_id = decode_cursor(params.cursor, key_expression)
+        keyed = keyed.filter(_after(key_expression, id_column, last_value, last_id, ascending))
+    keyed = keyed.order_by(_tiebreaker(id_column, sort_direction))
+
+    # one extra row tells us whether another page exists without a second query
+    rows = keyed.limit(params.size + 1).all()
+    has_more = len(rows) > params.size
+    rows = rows[:params.size]
+
+    items = [_entities(row, 2) for row in rows]
+    next_cursor = encode_cursor(rows[-1][-2], rows[-1][-1]) if has_more else None
+    return items, next_cursor
+
+
+def _tiebreaker(id_column, sort_direction: Optional[SortDirection]):
+    """Secondary order on the id, rows with equal sort keys keep one order across pages."""
+    return id_column.desc() if sort_direction == SortDirection.DESC else id_column.asc()
+
+
+def _entities(row, extra_columns: int):
+    """Drop the helper columns added for paging and unwrap single-entity rows."""
+    entities = tuple(row[:-extra_columns])
+    return entities[0] if len(entities) == 1 else entities
+
+
+def _after(key_expression, id_column, last_value, last_id, ascending: bool):
+    """Rows strictly after (last_value, last_id) in PostgreSQL's default NULL ordering."""
+    if ascending:
+        # ASC puts NULL keys last
+        if last_value is None:
+            return and_(key_expression.is_(None), id_column > last_id)
+        return or_(
+            key_expression > last_value,
+            and_(key_expression == last_value, id_column > last_id),
+            key_expression.is_(None),
+        )
+    # DESC puts NULL keys first
+    if last_value is None:
+        return or_(
+            and_(key_expression.is_(None), id_column < last_id),
+            key_expression.is_not(None),
+        )
+    return or_(
+        key_expression < last_value,
+        and_(key_expression == last_value, id_column < last_id),
+    )
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _from_json(value: Any, sql_type) -> Any:
+    if value is None:
+        return None
+    enum_class = getattr(sql_type, "enum_class", None)
+    if enum_class is not None:
+        return enum_class(value)
+    try:
+        python_type = sql_type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    # str, int and bool survive the JSON round trip as they are
+    return value
@@ -0,0 +1,127 @@
+"""
+Column projections for the list endpoints.
+
+A ``Projection`` names the columns a read schema needs and builds the schema straight from
+the selected row with ``model_construct``. The listings no longer hydrate ORM objects only to
+validate them into DTOs a second time, the database already guarantees the column types.
+"""
+from datetime import date, datetime, time
+from typing import Any, Callable, List, Optional, Sequence, Type
+from pydantic import BaseModel
+from sqlalchemy.orm.util import AliasedClass
+from models.asset import Asset
+from models.category import Category
+from models.user import User
+from schemas.asset import AssetRead
+from schemas.category import CategoryRead
+from schemas.user import UserRead, UserReadSimple
+
+
+class Converted:
+    """A column whose value is adjusted in Python before it is put on the schema."""
+
+    def __init__(self, column, convert: Callable[[Any], Any]):
+        self.column = column
+        self.convert = convert
+
+
+class Projection:
+    """
+    Columns of one read schema, fields map to a column, a ``Converted`` column or a nested
+    projection. With ``optional`` the nested schema becomes None when its first column is NULL,
+    which is how an outer joined row shows up.
+    """
+
+    def __init__(self, schema: Type[BaseModel], optional: bool = False, **fields):
+        self.schema = schema
+        self.optional = optional
+        self.fields = fields
+        self.columns: List[Any] = []
+        for field in fields.values():
+            if isinstance(field, Projection):
+                self.columns.extend(field.columns)
+            elif isinstance(field, Converted):
+                self.columns.append(field.column)
+            else:
+                self.columns.append(field)
+
+    def build(self, row: Sequence[Any], start: int = 0) -> Optional[BaseModel]:
+        if self.optional and row[start] is None:
+            return None
+        values = {}
+        position = start
+        for name, field in self.fields.items():
+            if isinstance(field, Projection):
+                values[name] = field.build(row, position)
+                position += len(field.columns)
+            elif isinstance(field, Converted):
+                values[name] = field.convert(row[position])
+                position += 1
+            else:
+                values[name] = row[position]
+                position += 1
+        return self.schema.model_construct(**values)
+
+    def build_all(self, rows) -> List[BaseModel]:
+        return [self.build(row) for row in rows]
+
+
+def to_date(value: Optional[datetime]) -> Optional[date]:
+    return value.date() if value else None
+
+
+def to_midnight(value: Optional[datetime]) -> Optional[datetime]:
+    """Keep the day of a timestamp, as the responses did when they passed ``.date()`` to a datetime field."""
+    return datetime.combine(value.date(), time.min) if value else None
+
+
+def category_read() -> Projection:
+    return Projection(
+        CategoryRead,
+        category_name=Category.category_name,
+        prefix=Category.prefix,
+        id=Category.id,
+    )
+
+
+def asset_read() -> Projection:
+    return Projection(
+        AssetRead,
+        asset_name=Asset.asset_name,
+        id=Asset.id,
+        asset_code=Asset.asset_code,
+        specification=Asset.specification,
+        installed_date=Asset.installed_date,
+        asset_state=Asset.asset_state,
+        asset_location=Asset.asset_location,
+        category=category_read(),
+    )
+
+
+def user_read(user=User) -> Projection:
+    return Projection(
+        UserRead,
+        date_of_birth=user.date_of_birth,
+        join_date=user.join_date,
+        type=user.type,
+        id=user.id,
+        staff_code=user.staff_code,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        username=user.username,
+        gender=user.gender,
+        location=user.location,
+        status=user.status,
+        is_first_login=user.is_first_login,
+    )
+
+
+def user_read_simple(user: AliasedClass, optional: bool = False) -> Projection:
+    return Projection(
+        UserReadSimple,
+        optional=optional,
+        staff_code=user.staff_code,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        username=user.username,
+    )
@@ -1,99 +1,52 @@
+from typing import Iterator
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case, desc, asc
+from sqlalchemy import and_, func
 from schemas.query.sort.report import ReportSort, SortDirection, SortReportBy
 from models.category import Category
-from models.asset import Asset
+from models.asset_summary import AssetSummary
 from enums.shared.location import Location
-from enums.asset.state import AssetState
+from repositories.pagination import apply_sort, paginate
+from repositories.projection import Projection
 from schemas.report import ReportRead
-from schemas.shared.paginated_response import PaginatedResponse, PaginationMeta
+from schemas.shared.paginated_response import PaginatedResponse
+
+COUNT_COLUMNS = ("total", "assigned", "available", "not_available", "waiting_for_recycling", "recycled")
+
+REPORT_READ = Projection(
+    ReportRead,
+    category=Category.category_name.label("category"),
+    **{column: func.coalesce(getattr(AssetSummary, column), 0).label(column) for column in COUNT_COLUMNS},
+)
 
 
 class ReportRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_report_paginated(self, sort: ReportSort, location: Location) -> PaginatedResponse[ReportRead]:
-        base_query = self.db.query(
-            Category.category_name.label('category'),
-            func.count(case((Asset.asset_location == location,
-                       Asset.id), else_=None)).label('total'),
-            func.sum(case((Asset.asset_state == AssetState.ASSIGNED, 1), else_=0)).label(
-                'assigned'),
-            func.sum(case((Asset.asset_state == AssetState.AVAILABLE, 1), else_=0)).label(
-                'available'),
-            func.sum(case((Asset.asset_state == AssetState.NOT_AVAILABLE, 1), else_=0)).label(
-                'not_available'),
-            func.sum(case((Asset.asset_state == AssetState.WAITING_FOR_RECYCLING, 1), else_=0)).label(
-                'waiting_for_recycling'),
-            func.sum(case((Asset.asset_state == AssetState.RECYCLED, 1), else_=0)).label(
-                'recycled'),
-        ).outerjoin(
-            Asset, Category.id == Asset.category_id
-        ).group_by(
-            Category.category_name
+    def _summary_query(self, location: Location):
+        """One row per category read from the trigger maintained asset_summary table."""
+        return self.db.query(*REPORT_READ.columns).outerjoin(
+            AssetSummary,
+            and_(AssetSummary.category_id == Category.id, AssetSummary.asset_location == location),
         )
 
+    def get_report_paginated(self, sort: ReportSort, location: Location) -> PaginatedResponse[ReportRead]:
+        query = self._summary_query(location)
+
+        sort_expression = None
         if sort.sort_by:
-            subquery = base_query.subquery()
-            query = self.db.query(subquery)
-            
-            if sort.sort_by == SortReportBy.CATEGORY:
-                column = func.lower(subquery.c.category)
+            sort_by = SortReportBy(sort.sort_by)
+            if sort_by == SortReportBy.CATEGORY:
+                sort_expression = func.lower(Category.category_name)
             else:
-                column = subquery.c.get(sort.sort_by)
-
-            if column is None:
-                raise ValueError(f"Invalid sort field: {sort.sort_by}")
+                sort_expression = func.coalesce(getattr(AssetSummary, sort_by.value), 0)
+            query = apply_sort(query, sort_expression, sort.sort_direction)
 
-            direction = asc(
-                column) if sort.sort_direction == SortDirection.ASC else desc(column)
-            query = query.order_by(direction)
-        else:
-            query = base_query
-
-        total = query.count()
-        total_pages = (total + sort.size - 1) // sort.size
-
-        results = query.offset(
-            (sort.page - 1) * sort.size).limit(sort.size).all()
-        reports = [ReportRead(**row._asdict()) for row in results]
-
-        return PaginatedResponse(
-            data=reports,
-            meta=PaginationMeta(
-                total=total,
-                total_pages=total_pages,
-                page=sort.page,
-                page_size=sort.size
-            )
-        )
-
-    async def get_excel_reports(self, page: int, size: int, location: Location) -> list[ReportRead]:
-        query = self.db.query(
-            Category.category_name.label('category'),
-            func.count(case((Asset.asset_location == location,
-                       Asset.id), else_=None)).label('total'),
-            func.sum(case((Asset.asset_state == AssetState.ASSIGNED, 1), else_=0)).label(
-                'assigned'),
-            func.sum(case((Asset.asset_state == AssetState.AVAILABLE, 1), else_=0)).label(
-                'available'),
-            func.sum(case((Asset.asset_state == AssetState.NOT_AVAILABLE, 1), else_=0)).label(
-                'not_available'),
-            func.sum(case((Asset.asset_state == AssetState.WAITING_FOR_RECYCLING, 1), else_=0)).label(
-                'waiting_for_recycling'),
-            func.sum(case((Asset.asset_state == AssetState.RECYCLED, 1), else_=0)).label(
-                'recycled'),
-        ).outerjoin(
-            Asset, Category.id == Asset.category_id
-        ).group_by(
-            Category.category_name
-        )
-        subquery = query.subquery()
-        query = self.db.query(subquery)
-        column = func.lower(subquery.c.category)
+        rows, meta = paginate(query, sort, Category.id, sort_expression, sort.sort_direction)
+        return PaginatedResponse(data=REPORT_READ.build_all(rows), meta=meta)
 
-        direction = asc(column)
-        query = query.order_by(direction)
-        results = query.offset((page - 1) * size).limit(size).all()
-        return [ReportRead(**row._asdict()) for row in results]
+    def iter_report_rows(self, location: Location, batch_size: int = 500) -> Iterator[tuple]:
+        """Every report row ordered by category, fetched in batches from one server-side cursor."""
+        query = apply_sort(self._summary_query(location), func.lower(Category.category_name), SortDirection.ASC)
+        for row in query.execution_options(stream_results=True, yield_per=batch_size):
+            yield tuple(row)
@@ -1,9 +1,13 @@
 from datetime import datetime, timezone
 from models.request import Request
 from models.asset import Asset
+from models.category import Category
 from models.user import User
 from schemas.query.filter.request import RequestFilter
-from schemas.shared.paginated_response import PaginatedResponse, PaginationMeta
+from schemas.shared.paginated_response import PaginatedResponse
+from repositories.pagination import apply_sort, paginate
+from repositories.projection import Converted, Projection, asset_read, to_date, to_midnight, user_read_simple
+from repositories.search import search_filter, search_rank
 from schemas.request import RequestReadDetail, RequestRead
 from schemas.user import UserReadSimple, UserRead
 from sqlalchemy.orm import Session, aliased, joinedload
@@ -30,10 +34,29 @@ class RequestReturningRepository:
         RequestedBy = aliased(User)
         AcceptedBy = aliased(User)
         
+        # every column the response reads is part of the row, mapping it needs no further query
+        projection = Projection(
+            RequestReadDetail,
+            id=Request.id,
+            asset=asset_read(),
+            requested_by=user_read_simple(RequestedBy),
+            accepted_by=user_read_simple(AcceptedBy, optional=True),
+            assignment=Projection(
+                AssignmentReadSimple,
+                id=Assignment.id,
+                assign_date=Converted(Assignment.assign_date, to_date),
+                assignment_state=Assignment.assignment_state,
+                assignment_note=Assignment.assignment_note,
+            ),
+            return_date=Converted(Request.return_date, to_midnight),
+            request_state=Request.request_state,
+        )
         query = (
-            self.db.query(Request)
+            self.db.query(*projection.columns)
+            .select_from(Request)
             .join(Assignment, onclause=Request.assignment_id == Assignment.id)
             .join(Asset, onclause=Assignment.asset_id == Asset.id)
+            .join(Category, onclause=Asset.category_id == Category.id)
             .join(RequestedBy, onclause=Request.requested_by_id == RequestedBy.id)
             .outerjoin(AcceptedBy, onclause=Request.accepted_by_id == AcceptedBy.id)
             .where(Asset.asset_location == current_user.location)
@@ -52,97 +75,35 @@ class RequestReturningRepository:
                 Request.return_date.between(start_of_day, end_of_day)
             )
             
+        search_columns = (Asset.asset_code, Asset.asset_name, RequestedBy.username)
         if request_filter.search:
-            query = query.filter(
-                (Asset.asset_code.ilike(f"%{request_filter.search}%"))
-                | (Asset.asset_name.ilike(f"%{request_filter.search}%"))
-                | (RequestedBy.username.ilike(f"%{request_filter.search}%"))
-            )
+            query = query.filter(search_filter(request_filter.search, *search_columns))
             
-        if request_filter.sort_by:
-            if request_filter.sort_by == SortRequestBy.ID:
-                query = query.order_by(
-                    Request.id.asc() if request_filter.sort_direction == SortDirection.ASC
-                    else Request.id.desc()
-                )
-            elif request_filter.sort_by == SortRequestBy.ASSET_CODE:
-                query = query.order_by(
-                    Asset.asset_code.asc() if request_filter.sort_direction == SortDirection.ASC
-                    else Asset.asset_code.desc()
-                )
-            elif request_filter.sort_by == SortRequestBy.ASSET_NAME:
-                query = query.order_by(
-                    func.lower(Asset.asset_name).asc() if request_filter.sort_direction == SortDirection.ASC
-                    else func.lower(Asset.asset_name).desc()
-                )
-            elif request_filter.sort_by == SortRequestBy.REQUESTED_BY:
-                query = query.order_by(
-                    func.lower(RequestedBy.username).asc() if request_filter.sort_direction == SortDirection.ASC
-                    else func.lower(RequestedBy.username).desc()
-                )
-            elif request_filter.sort_by == SortRequestBy.ACCEPTED_BY:
-                query = query.order_by(
-                    func.lower(AcceptedBy.username).asc() if request_filter.sort_direction == SortDirection.ASC
-                    else func.lower(AcceptedBy.username).desc()
-                )
-            elif request_filter.sort_by == SortRequestBy.ASSIGN_DATE:
-                query = query.order_by(
-                    Assignment.assign_date.asc() if request_filter.sort_direction == SortDirection.ASC
-                    else Assignment.assign_date.desc()
-                )
-            elif request_filter.sort_by == SortRequestBy.RETURN_DATE:
-                query = query.order_by(
-                    Request.return_date.asc() if request_filter.sort_direction == SortDirection.ASC
-                    else Request.return_date.desc()
-                )
-            elif request_filter.sort_by == SortRequestBy.STATE:
-                query = query.order_by(
-                    Request.request_state.asc() if request_filter.sort_direction == SortDirection.ASC
-                    else Request.request_state.desc()
-                )
-        
+        sort_columns = {
+            SortRequestBy.ID: Request.id,
+            SortRequestBy.ASSET_CODE: Asset.asset_code,
+            SortRequestBy.ASSET_NAME: func.lower(Asset.asset_name),
+            SortRequestBy.REQUESTED_BY: func.lower(RequestedBy.username),
+            SortRequestBy.ACCEPTED_BY: func.lower(AcceptedBy.username),
+            SortRequestBy.ASSIGN_DATE: Assignment.assign_date,
+            SortRequestBy.RETURN_DATE: Request.return_date,
+            SortRequestBy.STATE: Request.request_state,
+        }
+        if request_filter.search:
+            sort_columns[SortRequestBy.RELEVANCE] = search_rank(request_filter.search, *search_columns)
+        sort_expression = sort_columns.get(SortRequestBy(request_filter.sort_by)) if request_filter.sort_by else None
+        query = apply_sort(query, sort_expression, request_filter.sort_direction)
         
         # Function already designed for admin, staff filter will return requests made by staff or correspond to the assignment which was assigned to staff
         if current_user.type == Type.STAFF:
-            query = query.filter(or_(Request.requested_by_id == current_user.id, Request.assignment.has(Assignment.assigned_to_id == current_user.id)))
+            query = query.filter(or_(Request.requested_by_id == current_user.id, Assignment.assigned_to_id == current_user.id))
                 
-        total = query.count()
-        total_pages = (total + request_filter.size - 1) // request_filter.size
-        
-        requests = (
-            query.offset((request_filter.page - 1) * request_filter.size)
-            .limit(request_filter.size)
-            .all()
-        )
-        
-        request_reads = [
-            RequestReadDetail(
-                id = request.id,
-                asset= AssetRead.model_validate(request.assignment.asset, from_attributes=True),
-                requested_by = UserReadSimple.model_validate(request.requested_by_user, from_attributes=True),
-                accepted_by = UserReadSimple.model_validate(request.accepted_by_user, from_attributes=True) if request.accepted_by_user else None,
-                request_state = request.request_state,
-                return_date = request.return_date.date() if request.return_date else None,
-                assignment = AssignmentReadSimple(
-                    id=request.assignment.id,
-                    assign_date=request.assignment.assign_date.date(), 
-                    assignment_state=request.assignment.assignment_state,
-                    assignment_note=request.assignment.assignment_note
-                )
-            )
-            for request in requests
-        ]
-        
-        return PaginatedResponse(
-            data = request_reads,
-            meta = PaginationMeta(
-                total = total,
-                total_pages = total_pages,
-                page = request_filter.page,
-                page_size = request_filter.size,
-            ),
+        rows, meta = paginate(
+            query, request_filter, Request.id, sort_expression, request_filter.sort_direction
         )
 
+        return PaginatedResponse(data=projection.build_all(rows), meta=meta)
+
     def create_request_returning(self, request_data: Request) -> RequestRead:
         """Create a new request returning entry in the database."""
         self.db.add(request_data)
@@ -182,9 +143,10 @@ class RequestReturningRepository:
             .first()
         )
 
-    def complete_return_request(self, request_id: int, current_admin_id: int) -> Request:
+    def complete_return_request(self, request_id: int, current_admin_id: int, commit: bool = True) -> Request:
         """Complete a return request by updating state and returned date."""
-        request = self.get_request_by_id(request_id)
+        # the identity map hands back the request the caller already loaded without a query
+        request = self.db.get(Request, request_id)
 
         if request:
             request.request_state = RequestState.COMPLETED
@@ -192,8 +154,9 @@ class RequestReturningRepository:
             request.updated_at = datetime.now(timezone.utc)
             request.accepted_by_id = current_admin_id
 
-            self.db.commit()
-            self.db.refresh(request)
+            if commit:
+                self.db.commit()
+                self.db.refresh(request)
 
         return request
 
@@ -0,0 +1,19 @@
+from sqlalchemy import Float, cast, func, or_
+
+
+def search_filter(term: str, *columns):
+    """
+    Case-insensitive substring match on any of the columns.
+
+    The columns carry pg_trgm GIN indexes (see models/search.py), which PostgreSQL uses for
+    ILIKE '%term%' once the term is at least three characters long.
+    """
+    pattern = f"%{term}%"
+    return or_(*(column.ilike(pattern) for column in columns))
+
+
+def search_rank(term: str, *columns):
+    """Relevance of a row for the term, the best trigram word similarity across the columns."""
+    # word_similarity returns real, compare as double so cursor values round-trip exactly
+    scores = [cast(func.word_similarity(term, column), Float(precision=53)) for column in columns]
+    return scores[0] if len(scores) == 1 else func.greatest(*scores)
@@ -1,12 +1,15 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
+from sqlalchemy import func, insert, or_, select
 from enums.assignment.state import AssignmentState
 from enums.user.status import Status
 from models.assignment import Assignment
-from models.user import User
+from models.user import STAFF_CODE_SEQUENCE, User
 from schemas.query.filter.user import UserFilter
 from schemas.user import UserRead
-from schemas.shared.paginated_response import PaginatedResponse, PaginationMeta
+from schemas.shared.paginated_response import PaginatedResponse
+from repositories.pagination import apply_sort, paginate
+from repositories.projection import user_read
+from repositories.search import search_filter, search_rank
 from schemas.query.sort.sort_type import SortUserBy, SortDirection
 from schemas.user import UserUpdate
 
@@ -14,7 +17,7 @@ from enums.user.type import Type
 from enums.shared.location import Location
 from datetime import date, datetime, timezone
 
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 
 
 
@@ -38,8 +41,29 @@ class UserRepository:
     def is_username_exists(self, username: str) -> bool:
         return self.db.query(User).filter(User.username == username).first() is not None
 
-    def get_count_all_users(self) -> int:
-        return self.db.query(User).count()
+    def get_usernames_with_prefixes(self, prefixes: Iterable[str]) -> Set[str]:
+        """Every username starting with one of ``prefixes``, in one query."""
+        prefixes = list(prefixes)
+        if not prefixes:
+            return set()
+        rows = self.db.query(User.username).filter(
+            or_(*[User.username.startswith(prefix, autoescape=True) for prefix in prefixes])
+        ).all()
+        return {username for username, in rows}
+
+    def reserve_staff_numbers(self, count: int) -> List[int]:
+        """Draw ``count`` staff code numbers from the sequence in one statement."""
+        return list(self.db.execute(
+            select(STAFF_CODE_SEQUENCE.next_value()).select_from(func.generate_series(1, count))
+        ).scalars())
+
+    def bulk_create_users(self, users: List[dict]) -> None:
+        """Insert many users, SQLAlchemy batches them into multi-row INSERT statements."""
+        if not users:
+            return
+        # render_nulls keeps rows with and without a gender in the same batch
+        self.db.execute(insert(User).execution_options(render_nulls=True), users)
+        self.db.commit()
 
     def get_user_by_staff_code(self, staff_code: str) -> User:
         return (
@@ -79,10 +103,15 @@ class UserRepository:
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         return self.db.query(User).filter(User.id == user_id).first()
 
+    def get_users_by_ids(self, user_ids: Iterable[int]) -> List[User]:
+        """Fetch the given users in one query."""
+        return self.db.query(User).filter(User.id.in_(list(user_ids))).all()
+
     def get_users_paginated(
         self, user_filter: UserFilter, user_current: User
     ) -> PaginatedResponse[UserRead]:
-        query = self.db.query(User)
+        projection = user_read()
+        query = self.db.query(*projection.columns)
 
         # Exclude the current user from the results
         query = query.filter(User.id != user_current.id)
@@ -96,63 +125,27 @@ class UserRepository:
         if user_filter.type:
             query = query.filter(User.type == user_filter.type)
 
+        search_columns = (User.staff_code, User.first_name, User.last_name)
         if user_filter.search:
-            query = query.filter(
-                (User.staff_code.ilike(f"%{user_filter.search}%"))
-                | (User.first_name.ilike(f"%{user_filter.search}%"))
-                | (User.last_name.ilike(f"%{user_filter.search}%"))
-            )
+            query = query.filter(search_filter(user_filter.search, *search_columns))
+
+        sort_columns = {
+            SortUserBy.FIRST_NAME: func.lower(User.first_name),
+            SortUserBy.STAFF_CODE: User.staff_code,
+            SortUserBy.JOIN_DATE: User.join_date,
+            SortUserBy.TYPE: User.type,
+            SortUserBy.UPDATED_AT: User.updated_at,
+        }
+        if user_filter.search:
+            sort_columns[SortUserBy.RELEVANCE] = search_rank(user_filter.search, *search_columns)
+        sort_expression = sort_columns.get(SortUserBy(user_filter.sort_by)) if user_filter.sort_by else None
+        query = apply_sort(query, sort_expression, user_filter.sort_direction)
 
-        if user_filter.sort_by:
-            if user_filter.sort_by == SortUserBy.FIRST_NAME:
-                query = query.order_by(
-                    func.lower(User.first_name).asc()
-                    if user_filter.sort_direction == SortDirection.ASC
-                    else func.lower(User.first_name).desc()
-                )
-            elif user_filter.sort_by == SortUserBy.STAFF_CODE:
-                query = query.order_by(
-                    User.staff_code.asc()
-                    if user_filter.sort_direction == SortDirection.ASC
-                    else User.staff_code.desc()
-                )
-            elif user_filter.sort_by == SortUserBy.JOIN_DATE:
-                query = query.order_by(
-                    User.join_date.asc()
-                    if user_filter.sort_direction == SortDirection.ASC
-                    else User.join_date.desc()
-                )
-            elif user_filter.sort_by == SortUserBy.TYPE:
-                query = query.order_by(
-                    User.type.asc()
-                    if user_filter.sort_direction == SortDirection.ASC
-                    else User.type.desc()
-                )
-            elif user_filter.sort_by == SortUserBy.UPDATED_AT:
-                query = query.order_by(
-                    User.updated_at.asc()
-                    if user_filter.sort_direction == SortDirection.ASC
-                    else User.updated_at.desc()
-                )
-
-        total = query.count()
-        total_pages = (total + user_filter.size - 1) // user_filter.size
-
-        users = (
-            query.offset((user_filter.page - 1) * user_filter.size)
-            .limit(user_filter.size)
-            .all()
+        rows, meta = paginate(
+            query, user_filter, User.id, sort_expression, user_filter.sort_direction
         )
 
-        return PaginatedResponse(
-            data=users,
-            meta=PaginationMeta(
-                total=total,
-                total_pages=total_pages,
-                page=user_filter.page,
-                page_size=user_filter.size,
-            ),
-        )
+        return PaginatedResponse(data=projection.build_all(rows), meta=meta)
 
     def has_active_assignments(self, user: User) -> bool:
         return (
@@ -187,13 +180,10 @@ class UserRepository:
         )
         
         if query:
-            search = f"%{query}%"
-            query_builder = query_builder.filter(
-                or_(
-                    User.staff_code.ilike(search),
-                    User.username.ilike(search)
-                )
-            )
+            search_columns = (User.staff_code, User.username)
+            query_builder = query_builder.filter(search_filter(query, *search_columns))
+            # best matches first
+            query_builder = query_builder.order_by(search_rank(query, *search_columns).desc(), User.id)
             
         return query_builder.all()
 
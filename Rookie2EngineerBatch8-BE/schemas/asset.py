@@ -2,7 +2,7 @@ from pydantic import BaseModel, root_validator, field_validator
 from datetime import date
 from enums.shared.location import Location
 from enums.asset.state import AssetState
-from typing import Optional
+from typing import List, Optional
 from schemas.category import CategoryRead
 
 class AssetHistory(BaseModel):
@@ -23,6 +23,17 @@ class AssetCreate(AssetBase):
     installed_date: date
     asset_state: AssetState
 
+class AssetImportError(BaseModel):
+    """Why one row of an asset import was rejected, row is None when the file itself could not be read"""
+    row: Optional[int]
+    errors: List[str]
+
+class AssetImportResult(BaseModel):
+    total_rows: int
+    created: int
+    failed: int
+    errors: List[AssetImportError]
+
 class AssetRead(AssetBase):
     id: int
     asset_code: str
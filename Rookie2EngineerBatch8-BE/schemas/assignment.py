@@ -1,6 +1,6 @@
-from pydantic import BaseModel, root_validator, model_validator
+from pydantic import BaseModel, Field, root_validator, model_validator
 from datetime import datetime, date
-from typing import Optional
+from typing import List, Optional
 from enums.assignment.state import AssignmentState
 from schemas.user import UserRead
 from schemas.asset import AssetRead
@@ -72,4 +72,33 @@ class AssignmentReadDetail(BaseModel):
     assignment: AssignmentReadSimple
     assigned_to_user: UserRead
     assigned_by_user: UserRead
-    asset: AssetRead
\ No newline at end of file
+    asset: AssetRead
+class AssignmentBatchCreate(BaseModel):
+    assignments: List[AssignmentCreate] = Field(..., min_length=1, max_length=100)
+
+class AssignmentBatchStateUpdate(AssignmentStateUpdate):
+    assignment_ids: List[int] = Field(..., min_length=1, max_length=100)
+
+class AssignmentBatchItem(BaseModel):
+    """Outcome of one item of a batch, in request order"""
+    index: int
+    assignment: Optional[AssignmentRead] = None
+    error: Optional[str] = None
+
+class AssignmentBatchResult(BaseModel):
+    total: int
+    succeeded: int
+    failed: int
+    results: List[AssignmentBatchItem]
+
+class AssignmentBatchStateItem(BaseModel):
+    """Outcome of one assignment of a batch state update, in request order"""
+    assignment_id: int
+    assignment_state: Optional[AssignmentState] = None
+    error: Optional[str] = None
+
+class AssignmentBatchStateResult(BaseModel):
+    total: int
+    succeeded: int
+    failed: int
+    results: List[AssignmentBatchStateItem]
@@ -12,6 +12,7 @@ class SortUserBy(str, Enum):
     JOIN_DATE = "join_date"
     TYPE = "type"
     UPDATED_AT = "updated_at"
+    RELEVANCE = "relevance"
     
 class SortAssignmentBy(str, Enum):
     """Enum for sort assignment by."""
@@ -23,6 +24,7 @@ class SortAssignmentBy(str, Enum):
     ASSIGN_DATE = "assign_date"
     STATE = "state"
     UPDATED_AT = "updated_at"
+    RELEVANCE = "relevance"
     
 class SortRequestBy(str, Enum):
     """Enum for sort request by."""
@@ -34,6 +36,7 @@ class SortRequestBy(str, Enum):
     ACCEPTED_BY = "accepted_by"
     RETURN_DATE = "return_date"
     STATE = "state"
+    RELEVANCE = "relevance"
     
 class SortAssetBy(str, Enum):
     """Enum for sort asset by."""
@@ -42,6 +45,7 @@ class SortAssetBy(str, Enum):
     CATEGORY = "category"
     STATE = "state"
     UPDATED_AT = "updated_at"
+    RELEVANCE = "relevance"
     
 class SortReportBy(str, Enum):
     """Enum for sort report by."""
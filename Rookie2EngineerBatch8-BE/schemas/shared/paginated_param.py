@@ -1,7 +1,17 @@
+from typing import Optional
 from pydantic import BaseModel, Field
 
 
 class PaginationParams(BaseModel):
     """Base pagination parameters for query parameters"""
     page: int = Field(1, ge=1, description="Page number, starting from 1")
-    size: int = Field(10, ge=1, le=100, description="Number of items per page")
\ No newline at end of file
+    size: int = Field(10, ge=1, le=100, description="Number of items per page")
+    cursor: Optional[str] = Field(
+        None,
+        description="Opaque keyset cursor from meta.next_cursor. Send an empty value to start cursor paging. "
+                    "page is ignored in this mode, meta.page is null and meta.total is an estimate or null",
+    )
+    approximate_total: bool = Field(
+        False,
+        description="Use the planner's row estimate for meta.total instead of an exact count",
+    )
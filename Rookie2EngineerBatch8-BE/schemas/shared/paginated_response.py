@@ -1,15 +1,17 @@
-from typing import Generic, TypeVar, List
+from typing import Generic, TypeVar, List, Optional
 from pydantic import BaseModel
-from pydantic.generics import GenericModel
 
 T = TypeVar("T")
 
 class PaginationMeta(BaseModel):
-    total: int
-    total_pages: int
-    page: int
+    # total, total_pages and page are None in cursor mode, see repositories.pagination.paginate
+    total: Optional[int]
+    total_pages: Optional[int]
+    page: Optional[int]
     page_size: int
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
-class PaginatedResponse(GenericModel, Generic[T]):
+class PaginatedResponse(BaseModel, Generic[T]):
     data: List[T]
     meta: PaginationMeta
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, root_validator, field_validator, model_validator
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 from enums.shared.location import Location
 from enums.user.gender import Gender
 from enums.user.type import Type
@@ -103,3 +103,16 @@ class UserUpdate(BaseModel):
                 detail="Joined date is Saturday or Sunday. Please select a different date"
             )
         return self
+
+
+class UserImportError(BaseModel):
+    """Why one row of a user import was rejected, row is None when the file itself could not be read"""
+    row: Optional[int]
+    errors: List[str]
+
+
+class UserImportResult(BaseModel):
+    total_rows: int
+    created: int
+    failed: int
+    errors: List[UserImportError]
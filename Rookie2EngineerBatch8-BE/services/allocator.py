@@ -0,0 +1,138 @@
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from core.config import settings
+from core.exceptions import NotFoundException
+from core.logging_config import get_logger
+from repositories.category import CategoryRepository
+from repositories.user import UserRepository
+from utils.generator import Generator
+
+logger = get_logger(__name__)
+
+_PENDING_BLOCKS = "asset_code_allocator.pending_blocks"
+
+
+@dataclass
+class _Block:
+    prefix: str
+    next_number: int
+    end: int  # exclusive
+
+    @property
+    def remaining(self) -> int:
+        return self.end - self.next_number
+
+
+class AssetCodeAllocator:
+    """
+    Hands out unique asset codes per category.
+
+    Numbers come from ``UPDATE category SET id_counter = id_counter + n ... RETURNING`` on the
+    caller's session, so a create needs no second pooled connection. The category row stays
+    locked until the caller commits, which for a create or an import chunk is the insert that
+    follows, and a rolled back create gives its numbers back.
+
+    With ``block_size`` > 1 each process reserves that many numbers at once and serves them
+    from memory. The leftover of a block is only kept once the reserving transaction has
+    committed. Codes stay unique but are no longer handed out in creation order across
+    workers, and unused numbers of a block are lost on restart.
+    """
+
+    def __init__(self, block_size: int = 1):
+        self.block_size = max(block_size, 1)
+        self._blocks: Dict[int, _Block] = {}
+        self._lock = threading.Lock()
+
+    def allocate(self, db: Session, category_id: int, count: int = 1) -> List[str]:
+        """Reserve ``count`` consecutive codes of the category, oldest first."""
+        with self._lock:
+            block = self._blocks.get(category_id)
+            if block is not None and block.remaining >= count:
+                return self._take(block, count)
+
+        reserve = max(count, self.block_size)
+        reserved = CategoryRepository(db).reserve_id_range(category_id, reserve)
+        if reserved is None:
+            raise NotFoundException(detail="Category not found")
+        prefix, first = reserved
+        block = _Block(prefix=prefix, next_number=first, end=first + reserve)
+        codes = self._take(block, count)
+        if block.remaining:
+            # the numbers are only taken once the caller commits, see _keep_committed_blocks
+            db.info.setdefault(_PENDING_BLOCKS, []).append((self, category_id, block))
+        return codes
+
+    def reset(self) -> None:
+        """Forget the cached blocks, their unused numbers are skipped."""
+        with self._lock:
+            self._blocks.clear()
+
+    @staticmethod
+    def _take(block: _Block, count: int) -> List[str]:
+        first = block.next_number
+        block.next_number += count
+        return [Generator.generate_asset_code(block.prefix, number) for number in range(first, first + count)]
+
+    def _keep(self, category_id: int, block: _Block) -> None:
+        with self._lock:
+            # a leftover of an older block is dropped, numbers only need to be unique
+            self._blocks[category_id] = block
+
+
+@event.listens_for(Session, "after_commit")
+def _keep_committed_blocks(session: Session) -> None:
+    for allocator, category_id, block in session.info.pop(_PENDING_BLOCKS, []):
+        allocator._keep(category_id, block)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rolled_back_blocks(session: Session) -> None:
+    session.info.pop(_PENDING_BLOCKS, None)
+
+
+class StaffCodeAllocator:
+    """
+    Hands out unique SDxxxx staff codes.
+
+    Numbers come from the ``user_staff_code_seq`` sequence, one statement per draw however
+    large the user table grows, and concurrent creates never draw the same number. nextval is
+    not transactional, so no lock is held for the caller's transaction and a rolled back create
+    leaves a gap.
+
+    With ``block_size`` > 1 each process draws that many numbers at once and serves them from
+    memory, with the same trade-off as ``AssetCodeAllocator``: codes stay unique but are no
+    longer handed out in creation order across workers, and unused numbers are lost on restart.
+    """
+
+    def __init__(self, block_size: int = 1):
+        self.block_size = max(block_size, 1)
+        self._numbers: Deque[int] = deque()
+        self._lock = threading.Lock()
+
+    def allocate(self, db: Session, count: int = 1) -> List[str]:
+        """Reserve ``count`` staff codes, lowest first."""
+        with self._lock:
+            if len(self._numbers) >= count:
+                return self._take(count)
+
+        drawn = UserRepository(db).reserve_staff_numbers(max(count, self.block_size))
+        with self._lock:
+            # whatever other threads left over is used up first
+            self._numbers.extend(drawn)
+            return self._take(count)
+
+    def reset(self) -> None:
+        """Forget the cached numbers, they are skipped."""
+        with self._lock:
+            self._numbers.clear()
+
+    def _take(self, count: int) -> List[str]:
+        return [Generator.generate_staff_code(self._numbers.popleft()) for _ in range(count)]
+
+
+asset_code_allocator = AssetCodeAllocator(block_size=settings.ASSET_CODE_BLOCK_SIZE)
+staff_code_allocator = StaffCodeAllocator(block_size=settings.STAFF_CODE_BLOCK_SIZE)
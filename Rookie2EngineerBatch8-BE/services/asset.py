@@ -9,12 +9,17 @@ from schemas.asset import AssetRead
 from enums.shared.location import Location
 from enums.asset.state import AssetState
 from fastapi import HTTPException
-from schemas.asset import AssetCreate, AssetUpdate
+from schemas.asset import AssetCreate, AssetUpdate, AssetImportError, AssetImportResult
 from schemas.user import UserRead
-from utils.generator import Generator
 from models.asset import Asset
-from services.category import CategoryService
-from typing import List, Optional
+from services.allocator import asset_code_allocator
+from repositories.category import CategoryRepository
+from core.config import settings
+from utils.tabular import TableRow, TableRowReader
+from pydantic import ValidationError
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 logger = get_logger(__name__)
 
 
@@ -48,29 +53,12 @@ class AssetService:
         return asset_data 
     
     def create_asset(self, asset_data: AssetCreate, current_user: UserRead) -> AssetRead:
-        
-        category_service = CategoryService(self.db)
         try:
             # Log the asset creation attempt
             logger.info(f"Creating asset with name: {asset_data.asset_name}")
-            category = category_service.get_category_by_id(asset_data.category_id)
-            
-            if not category:
-                raise NotFoundException(detail="Category not found")
-
-            # Increment the id_counter for this category
-            # If id_counter is None, start from 1
-            current_counter = category.id_counter
-            new_counter = current_counter + 1
-            category.id_counter = new_counter
-            # Update the category's id_counter
-            category_service.update_category(category)
-
-            # Use the category prefix and the incremented counter
-            prefix = category.prefix
-            
-            # Format the new asset code using the incremented counter
-            asset_code = Generator.generate_asset_code(prefix, new_counter)
+
+            # The allocator advances the category counter atomically, concurrent creates never share a code
+            asset_code = asset_code_allocator.allocate(self.db, asset_data.category_id)[0]
 
             # Create new asset with current timestamps
             asset_model = Asset(
@@ -94,6 +82,86 @@ class AssetService:
             logger.error(f"Error creating asset: {e}")
             raise HTTPException(status_code=500, detail=str(e))
         
+    def import_assets(self, rows: Iterable[TableRow], current_user: UserRead) -> AssetImportResult:
+        """
+        Create assets from uploaded rows in chunks of ASSET_IMPORT_CHUNK_SIZE.
+
+        Each chunk is validated, reserves its asset codes with one counter update per category
+        and is inserted with multi-row INSERTs in its own transaction. Invalid rows are skipped
+        and reported, they do not stop the rest of the file. A file that cannot be read past some
+        row ends the import there, the chunks already saved are kept and the reason is reported
+        as an error without a row number.
+        """
+        category_repository = CategoryRepository(self.db)
+        categories: Dict[int, Optional[str]] = {}
+        total_rows = 0
+        created = 0
+        errors: List[AssetImportError] = []
+
+        rows = TableRowReader(rows)
+        while chunk := rows.read_chunk(settings.ASSET_IMPORT_CHUNK_SIZE):
+            total_rows += len(chunk)
+            valid: List[Tuple[int, AssetCreate]] = []
+            for row_number, row in chunk:
+                try:
+                    valid.append((row_number, AssetCreate.model_validate(row)))
+                except ValidationError as e:
+                    errors.append(AssetImportError(row=row_number, errors=self._format_errors(e)))
+
+            unknown_ids = {asset.category_id for _, asset in valid} - categories.keys()
+            if unknown_ids:
+                found = category_repository.get_categories_by_ids(unknown_ids)
+                categories.update({category_id: None for category_id in unknown_ids})
+                categories.update({category.id: category.prefix for category in found})
+
+            accepted: List[AssetCreate] = []
+            for row_number, asset in valid:
+                if categories[asset.category_id] is None:
+                    errors.append(AssetImportError(row=row_number, errors=[f"category_id: Category {asset.category_id} not found"]))
+                else:
+                    accepted.append(asset)
+
+            created += self._insert_chunk(accepted, current_user)
+
+        if rows.error is not None:
+            errors.append(AssetImportError(row=None, errors=[rows.error]))
+            logger.warning(f"Import stopped after {total_rows} rows: {rows.error}")
+        logger.info(f"Imported {created} of {total_rows} assets, {len(errors)} rows rejected")
+        return AssetImportResult(total_rows=total_rows, created=created, failed=len(errors), errors=errors)
+
+    def _insert_chunk(self, assets: List[AssetCreate], current_user: UserRead) -> int:
+        if not assets:
+            return 0
+        codes: Dict[int, Iterator[str]] = {
+            category_id: iter(asset_code_allocator.allocate(self.db, category_id, count))
+            # one category row lock each, taken in id order so concurrent imports cannot deadlock
+            for category_id, count in sorted(Counter(asset.category_id for asset in assets).items())
+        }
+
+        now = datetime.now(timezone.utc)
+        values = []
+        for asset in assets:
+            values.append({
+                "asset_code": next(codes[asset.category_id]),
+                "asset_name": asset.asset_name,
+                "category_id": asset.category_id,
+                "specification": asset.specification,
+                "installed_date": asset.installed_date,
+                "asset_state": asset.asset_state,
+                "asset_location": current_user.location,
+                "created_at": now,
+                "updated_at": now,
+            })
+        self.repository.bulk_create_assets(values)
+        return len(values)
+
+    @staticmethod
+    def _format_errors(error: ValidationError) -> List[str]:
+        return [
+            f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: {detail['msg']}"
+            for detail in error.errors()
+        ]
+
     def update_asset(self, current_user: UserRead, asset_id: int, asset_update: AssetUpdate) -> AssetRead:
         existing_asset = self.repository.get_asset_by_id(asset_id)
         if not existing_asset:
@@ -1,26 +1,36 @@
-from datetime import date
+from datetime import date, datetime, timezone
+from typing import Dict, List
 from sqlalchemy.orm import Session
-from core.exceptions import BusinessException, PermissionDeniedException, ValidationException, NotFoundException
+from sqlalchemy.exc import IntegrityError
+from core.exceptions import BusinessException, ConflictException, PermissionDeniedException, ValidationException, NotFoundException
 from core.logging_config import get_logger
 from enums.asset.state import AssetState
 from enums.assignment.state import AssignmentState
 from enums.shared.location import Location
 from enums.user.status import Status
 from repositories.assignment import AssignmentRepository
-from schemas.assignment import AssignmentCreate, AssignmentRead, AssignmentUpdate, AssignmentStateUpdate, AssignmentUpdateResponse, AssignmentReadDetail, AssignmentReadSimple
+from schemas.assignment import AssignmentBatchCreate, AssignmentBatchItem, AssignmentBatchResult, AssignmentBatchStateItem, AssignmentBatchStateResult, AssignmentBatchStateUpdate, AssignmentCreate, AssignmentRead, AssignmentUpdate, AssignmentStateUpdate, AssignmentUpdateResponse, AssignmentReadDetail, AssignmentReadSimple
 from schemas.query.filter.assignment import AssignmentFilter
 from schemas.shared.paginated_param import PaginationParams
 from schemas.shared.paginated_response import PaginatedResponse
 from schemas.assignment import AssignmentUserReadByUID
 from schemas.asset import AssetRead, AssetUpdate
 from schemas.user import UserRead
+from models.assignment import ACTIVE_ASSIGNMENT_INDEX, Assignment
 from services.asset import AssetService
+from services.unit_of_work import UnitOfWork
 from services.user import UserService
 from schemas.asset import AssetHistory
 
 logger = get_logger(__name__)
 
 
+def _is_active_assignment_conflict(error: IntegrityError) -> bool:
+    # PostgreSQL names the violated index, SQLite names the indexed column
+    message = str(error.orig)
+    return ACTIVE_ASSIGNMENT_INDEX in message or "assignment.asset_id" in message
+
+
 class AssignmentService:
     def __init__(self, db: Session):
         self.repository = AssignmentRepository(db)
@@ -30,39 +40,18 @@ class AssignmentService:
         return assignments
 
     def read_assignment(self, assignment_id: int, current_user: UserRead) -> AssignmentReadDetail:
-        assignment = self.repository.get_assignment_by_id_no_join(assignment_id)
+        assignment = self.repository.get_assignment_detail(assignment_id)
 
         if not assignment:
             raise NotFoundException(detail=f"Assignment with id {assignment_id} not found")
 
-        related_asset = AssetService(self.repository.db).read_asset(assignment.asset_id, current_user.location)
-        if not related_asset:
-            raise NotFoundException(detail=f"Asset with id {assignment.asset_id} in this assignment not found")
-
-        # if related_asset.asset_location != current_user.location:
-        #     raise BusinessException(detail="You don't have permission to view assignment from other location")
-
-        user_service = UserService(self.repository.db)
+        if assignment.asset.asset_location != current_user.location:
+            logger.warning(f"Asset with id {assignment.asset.id} is not in the same location as the user")
+            raise BusinessException(
+                detail="You can only read asset that are in the same location as you"
+            )
 
-        assignee = user_service.read_user(assignment.assigned_to_id)
-        if not assignee:
-            raise NotFoundException(detail=f"User with id {assignment.assigned_to_id} in this assignment not found")
-
-        assigner = user_service.read_user(assignment.assigned_by_id)
-        if not assigner:
-            raise NotFoundException(detail=f"User with id {assignment.assigned_by_id} in this assignment not found")
-
-        return AssignmentReadDetail(
-            assignment=AssignmentReadSimple(
-                id=assignment.id,
-                assign_date=assignment.assign_date,
-                assignment_state=assignment.assignment_state,
-                assignment_note=assignment.assignment_note
-            ),
-            assigned_to_user=UserRead.model_validate(assignee, from_attributes=True),
-            assigned_by_user=UserRead.model_validate(assigner, from_attributes=True),
-            asset=AssetRead.model_validate(related_asset, from_attributes=True)
-        )
+        return assignment
 
     def edit_assignment(
         self, assignment_id: int, assignment_update: AssignmentUpdate, current_admin: UserRead
@@ -120,20 +109,23 @@ class AssignmentService:
             raise PermissionDeniedException(
                 detail="You can only update assignments that are waiting for acceptance"
             )
-        updated_assignment = self.repository.update_assignment_state(
-            assignment_id, assignment_update
-        )
-
-        # If the assignment is declined, update the asset state to "Available"
-        if assignment_update.assignment_state == AssignmentState.DECLINED:
-            logger.info(
-                f"Assignment {assignment_id} declined, updating asset {assignment.asset_id} to Available state"
+        with UnitOfWork(self.repository.db):
+            updated_assignment = self.repository.update_assignment_state(
+                assignment_id, assignment_update, commit=False
             )
-            asset_service = AssetService(self.repository.db)
-            asset = asset_service.read_asset(assignment.asset_id,user_location)
-            asset_update = AssetUpdate(asset_state=AssetState.AVAILABLE)
-            asset_service.repository.update_asset(asset.id, asset_update)
-        return updated_assignment
+
+            # If the assignment is declined, update the asset state to "Available"
+            if assignment_update.assignment_state == AssignmentState.DECLINED:
+                logger.info(
+                    f"Assignment {assignment_id} declined, updating asset {assignment.asset_id} to Available state"
+                )
+                asset_service = AssetService(self.repository.db)
+                asset = asset_service.read_asset(assignment.asset_id,user_location)
+                asset_update = AssetUpdate(asset_state=AssetState.AVAILABLE)
+                asset_service.repository.update_asset(asset.id, asset_update, commit=False)
+            # built before the commit expires the row, reading it afterwards would load it again
+            response = AssignmentUpdateResponse.model_validate(updated_assignment, from_attributes=True)
+        return response
 
     def create_assignment(self, assignment: AssignmentCreate, assigned_by_id: int, current_user: UserRead) -> AssignmentRead:
         """Create a new assignment
@@ -147,7 +139,8 @@ class AssignmentService:
 
         Raises:
             NotFoundException: If user or asset is not found
-            BusinessException: If asset is not available or assign date is invalid
+            ConflictException: If asset already has an open assignment
+            BusinessException: If the assignment cannot be saved
         """
         # Check if assigned user exists
         user_service = UserService(self.repository.db)
@@ -156,18 +149,7 @@ class AssignmentService:
         except NotFoundException:
             raise NotFoundException(f"User with ID {assignment.assigned_to_id} not found")
 
-        # Check if asset exists
-        asset_service = AssetService(self.repository.db)
-        asset = asset_service.repository.get_asset_by_id(assignment.asset_id)
-        if not asset:
-            raise NotFoundException(f"Asset with ID {assignment.asset_id} not found")
-
-        # Check if asset is available for assignment
-        if not self.repository.is_asset_available(assignment.asset_id):
-            raise BusinessException(detail=f"Asset with ID {assignment.asset_id} is not available for assignment")
-
         # Create the assignment object
-        from models.assignment import Assignment
         db_assignment = Assignment(
             asset_id=assignment.asset_id,
             assigned_to_id=assignment.assigned_to_id,
@@ -177,26 +159,43 @@ class AssignmentService:
             assignment_note=assignment.assignment_note
         )
 
-        # Save to database through repository
-        try:
-            db_assignment = self.repository.create_assignment(db_assignment)
-
-            # Update asset state to "Assigned" immediately after creating assignment
-            logger.info(f"Assignment {db_assignment.id} created, updating asset {db_assignment.asset_id} to Assigned state")
-            asset_service = AssetService(self.repository.db)
-            asset_update = AssetUpdate(asset_state=AssetState.ASSIGNED)
-            asset_service.repository.update_asset(db_assignment.asset_id, asset_update)
-            logger.info(f"Asset {db_assignment.asset_id} state updated to Assigned")
-
-            # Get usernames and asset for the response
-            user_service = UserService(self.repository.db)
-            assigned_to = user_service.read_user(db_assignment.assigned_to_id)
-            assigned_by = user_service.read_user(db_assignment.assigned_by_id)
-
-            # Get updated asset info (with new state)
-            asset = asset_service.read_asset(db_assignment.asset_id, current_user.location)
-
-            # Create response with all required fields
+        # The assignment and the asset state change are committed together
+        asset_service = AssetService(self.repository.db)
+        with UnitOfWork(self.repository.db) as uow:
+            # Lock the asset row, a concurrent assignment of the same asset waits here until
+            # this one commits and then sees it in the availability check
+            asset = asset_service.repository.get_asset_by_id(assignment.asset_id, for_update=True)
+            if not asset:
+                raise NotFoundException(f"Asset with ID {assignment.asset_id} not found")
+            if asset.asset_location != current_user.location:
+                logger.warning(f"Asset with id {asset.id} is not in the same location as the user")
+                raise BusinessException(
+                    detail="You can only read asset that are in the same location as you"
+                )
+
+            # Check if asset is available for assignment
+            if not self.repository.is_asset_available(assignment.asset_id):
+                raise ConflictException(detail=f"Asset with ID {assignment.asset_id} is not available for assignment")
+
+            try:
+                asset_service.repository.update_asset(
+                    assignment.asset_id, AssetUpdate(asset_state=AssetState.ASSIGNED), commit=False
+                )
+                db_assignment = self.repository.create_assignment(db_assignment, commit=False)
+                uow.flush()
+            except IntegrityError as e:
+                # The unique index on open assignments is the last line if the lock was not taken
+                if _is_active_assignment_conflict(e):
+                    logger.warning(f"Asset {assignment.asset_id} was assigned by a concurrent request")
+                    raise ConflictException(detail=f"Asset with ID {assignment.asset_id} is not available for assignment")
+                logger.error(f"Error creating assignment: {str(e)}")
+                raise BusinessException(detail=f"Failed to create assignment: {str(e.orig)}")
+            except Exception as e:
+                logger.error(f"Error creating assignment: {str(e)}")
+                raise BusinessException(detail=f"Failed to create assignment: {str(e)}")
+            logger.info(f"Assignment {db_assignment.id} created, asset {db_assignment.asset_id} set to Assigned")
+
+            # Everything the response needs is already loaded, build it before the commit expires it
             response = AssignmentRead(
                 id=db_assignment.id,
                 asset_id=db_assignment.asset_id,
@@ -205,17 +204,188 @@ class AssignmentService:
                 assign_date=db_assignment.assign_date.date(),
                 assignment_state=db_assignment.assignment_state,
                 assignment_note=db_assignment.assignment_note,
-                assigned_to_username=assigned_to.username,
-                assigned_by_username=assigned_by.username,
+                assigned_to_username=assigned_user.username,
+                assigned_by_username=current_user.username,
                 asset=AssetRead.model_validate(asset, from_attributes=True)
             )
 
-            return response
+        return response
 
-        except Exception as e:
-            self.repository.db.rollback()
-            logger.error(f"Error creating assignment: {str(e)}")
-            raise BusinessException(detail=f"Failed to create assignment: {str(e)}")
+    def create_assignments(self, batch: AssignmentBatchCreate, current_user: UserRead) -> AssignmentBatchResult:
+        """
+        Create many assignments at once.
+
+        Users, assets and their open assignments are read with one IN query each, the assets
+        locked like in create_assignment. Every item gets the location, status and state checks
+        of the single create. Items failing a check are reported and skipped, the
+        rest are inserted with one multi-row INSERT and their assets set to Assigned with one
+        UPDATE, in a single unit of work.
+        """
+        items = batch.assignments
+        db = self.repository.db
+        asset_service = AssetService(db)
+        users = {
+            user.id: user
+            for user in UserService(db).repository.get_users_by_ids({item.assigned_to_id for item in items})
+        }
+        errors: Dict[int, str] = {}
+        created: Dict[int, AssignmentRead] = {}
+
+        with UnitOfWork(db):
+            assets = {
+                asset.id: asset
+                for asset in asset_service.repository.get_assets_by_ids({item.asset_id for item in items}, for_update=True)
+            }
+            taken = self.repository.get_assigned_asset_ids(assets.keys())
+
+            location = current_user.location
+            accepted: List[int] = []
+            for index, item in enumerate(items):
+                user = users.get(item.assigned_to_id)
+                asset = assets.get(item.asset_id)
+                # the checks of validate_assigned_user and validate_asset, against the rows read above
+                if user is None:
+                    errors[index] = f"User with ID {item.assigned_to_id} not found"
+                elif user.location != location:
+                    errors[index] = (
+                        f"User with ID {user.id} belongs to {user.location.value} location, "
+                        f"but assignment is for {location.value} location"
+                    )
+                elif user.status != Status.ACTIVE:
+                    errors[index] = f"User with ID {user.id} is not active (current status: {user.status.value})"
+                elif asset is None:
+                    errors[index] = f"Asset with ID {item.asset_id} not found"
+                elif asset.asset_location != location:
+                    errors[index] = (
+                        f"Asset with ID {asset.id} belongs to {asset.asset_location.value} location, "
+                        f"but assignment is for {location.value} location"
+                    )
+                elif item.asset_id in taken:
+                    errors[index] = f"Asset with ID {item.asset_id} is not available for assignment"
+                elif asset.asset_state != AssetState.AVAILABLE:
+                    errors[index] = f"Asset with ID {asset.id} is not available (current state: {asset.asset_state.value})"
+                else:
+                    # a later item of the same batch cannot take the asset again
+                    taken.add(item.asset_id)
+                    accepted.append(index)
+
+            if accepted:
+                now = datetime.now(timezone.utc)
+                try:
+                    assignment_ids = self.repository.bulk_create_assignments([
+                        {
+                            "asset_id": items[index].asset_id,
+                            "assigned_to_id": items[index].assigned_to_id,
+                            "assigned_by_id": current_user.id,
+                            "assign_date": items[index].assign_date,
+                            "assignment_state": AssignmentState.WAITING_FOR_ACCEPTANCE,
+                            "assignment_note": items[index].assignment_note,
+                            "created_at": now,
+                            "updated_at": now,
+                        }
+                        for index in accepted
+                    ], commit=False)
+                except IntegrityError as e:
+                    if _is_active_assignment_conflict(e):
+                        logger.warning("An asset of the batch was assigned by a concurrent request")
+                        raise ConflictException(detail="An asset of the batch was assigned by a concurrent request")
+                    logger.error(f"Error creating assignments: {str(e)}")
+                    raise BusinessException(detail=f"Failed to create assignments: {str(e.orig)}")
+                asset_service.repository.update_asset_states(
+                    [items[index].asset_id for index in accepted], AssetState.ASSIGNED, commit=False
+                )
+
+                for index in accepted:
+                    item = items[index]
+                    created[index] = AssignmentRead(
+                        id=assignment_ids[item.asset_id],
+                        asset_id=item.asset_id,
+                        assigned_to_id=item.assigned_to_id,
+                        assigned_by_id=current_user.id,
+                        assign_date=item.assign_date.date(),
+                        assignment_state=AssignmentState.WAITING_FOR_ACCEPTANCE,
+                        assignment_note=item.assignment_note,
+                        assigned_to_username=users[item.assigned_to_id].username,
+                        assigned_by_username=current_user.username,
+                        asset=AssetRead.model_validate(assets[item.asset_id], from_attributes=True)
+                    )
+
+        logger.info(f"Created {len(created)} of {len(items)} assignments, {len(errors)} rejected")
+        return AssignmentBatchResult(
+            total=len(items),
+            succeeded=len(created),
+            failed=len(errors),
+            results=[
+                AssignmentBatchItem(index=index, assignment=created.get(index), error=errors.get(index))
+                for index in range(len(items))
+            ],
+        )
+
+    def update_assignment_states(
+        self, batch: AssignmentBatchStateUpdate, user_id: int, user_location: Location
+    ) -> AssignmentBatchStateResult:
+        """
+        Accept or decline many of the user's own assignments at once.
+
+        Every assignment gets the checks of update_assignment_state. The assignments are read
+        and locked with one query and the valid ones change state with one UPDATE, declining
+        frees their assets with one more.
+        """
+        assignment_ids = list(dict.fromkeys(batch.assignment_ids))
+        state = batch.assignment_state
+        declined = state == AssignmentState.DECLINED
+        asset_service = AssetService(self.repository.db)
+        errors: Dict[int, str] = {}
+
+        with UnitOfWork(self.repository.db):
+            assignments = {
+                assignment.id: assignment
+                for assignment in self.repository.get_assignments_by_ids(assignment_ids, for_update=True)
+            }
+            locations = {}
+            if declined:
+                locations = {
+                    asset.id: asset.asset_location
+                    for asset in asset_service.repository.get_assets_by_ids(
+                        {assignment.asset_id for assignment in assignments.values()}
+                    )
+                }
+
+            accepted: List[Assignment] = []
+            for assignment_id in assignment_ids:
+                assignment = assignments.get(assignment_id)
+                if not assignment:
+                    errors[assignment_id] = "Assignment not found"
+                elif assignment.assigned_to_id != user_id:
+                    errors[assignment_id] = "You can only update your own assignments"
+                elif assignment.assignment_state in [AssignmentState.DECLINED, AssignmentState.ACCEPTED, AssignmentState.RETURNED]:
+                    errors[assignment_id] = "You can only update assignments that are waiting for acceptance"
+                elif declined and locations.get(assignment.asset_id) != user_location:
+                    errors[assignment_id] = "You can only read asset that are in the same location as you"
+                else:
+                    accepted.append(assignment)
+
+            if accepted:
+                self.repository.update_assignment_states([assignment.id for assignment in accepted], state, commit=False)
+                if declined:
+                    asset_service.repository.update_asset_states(
+                        [assignment.asset_id for assignment in accepted], AssetState.AVAILABLE, commit=False
+                    )
+
+        logger.info(f"User {user_id} set {len(accepted)} of {len(assignment_ids)} assignments to {state}")
+        return AssignmentBatchStateResult(
+            total=len(assignment_ids),
+            succeeded=len(accepted),
+            failed=len(errors),
+            results=[
+                AssignmentBatchStateItem(
+                    assignment_id=assignment_id,
+                    assignment_state=None if assignment_id in errors else state,
+                    error=errors.get(assignment_id),
+                )
+                for assignment_id in assignment_ids
+            ],
+        )
 
     def delete_assignment(self, assignment_id: int, location: Location) -> None:
         """
@@ -239,15 +409,13 @@ class AssignmentService:
             detail="You can only delete assignments that are 'Waiting for acceptance' or 'Declined'"
             )
 
-        # Change asset state to Available
-        asset_service = AssetService(self.repository.db)
-        asset = asset_service.read_asset(assignment.asset_id, location)
-        asset_update = AssetUpdate(asset_state=AssetState.AVAILABLE)
-        asset_service.repository.update_asset(asset.id, asset_update)
-        logger.info(f"Asset {asset.id} state updated to Available after deleting assignment {assignment_id}")
-
-        self.repository.delete_assignment(assignment)
-        
+        # Free the asset and delete the assignment in one transaction
+        with UnitOfWork(self.repository.db):
+            asset_service = AssetService(self.repository.db)
+            asset_update = AssetUpdate(asset_state=AssetState.AVAILABLE)
+            asset_service.repository.update_asset(assignment.asset_id, asset_update, commit=False)
+            self.repository.delete_assignment(assignment, commit=False)
+        logger.info(f"Asset {assignment.asset_id} state updated to Available after deleting assignment {assignment_id}")
 
     def validate_assigned_user(self, user_id: int | None, admin_location: Location) -> None:
         if not user_id:
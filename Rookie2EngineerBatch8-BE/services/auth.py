@@ -1,40 +1,26 @@
 from sqlalchemy.orm import Session
 from schemas.auth import TokenResponse, AccessTokenPayload, RefreshTokenPayload
+from schemas.user import UserRead
 from fastapi import Response, Request, HTTPException
 from core.config import settings
 from datetime import timedelta, datetime, timezone
 from jose import jwt
 from services.user import UserService
 from core.exceptions import AuthenticationException
-from utils.hash import verify_password, hash_password
+from utils.cache import user_cache
+from utils.hash import verify_password, hash_password, run_on_password_executor
 from core.exceptions import PasswordValidationException
 import uuid
 import redis.asyncio as redis
 import logging
-import asyncio
 
 class AuthService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, redis_client: redis.Redis | None = None):
         self.db = db
         self.user_service = UserService(db)
         self.logger = logging.getLogger(__name__)
-        self.redis_client: redis.Redis | None = None
-        try:
-            pool = redis.ConnectionPool(
-                host=settings.REDIS_HOST,
-                port=settings.REDIS_PORT,
-                db=0,
-                decode_responses=True,
-                max_connections=10,
-                socket_timeout=2.0,
-            )
-            self.redis_client = redis.Redis(connection_pool=pool)
-            # Test connection asynchronously (need event loop)
-            # But constructor is sync, so we just trust connection here
-            self.logger.info("Initialized async Redis connection pool")
-        except Exception as e:
-            self.logger.error(f"Error initializing Redis connection pool: {str(e)}")
-            self.redis_client = None
+        # shared client from database.redis_client, refresh tokens are not tracked without it
+        self.redis_client = redis_client
 
     @staticmethod
     def create_access_token(data: dict | AccessTokenPayload, expires_delta: timedelta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)):
@@ -96,8 +82,8 @@ class AuthService:
             self.logger.error(f"Unexpected error when storing refresh token: {str(e)}")
             return False
 
-    def login(self, username: str, password: str, response: Response = None) -> TokenResponse:
-        user = self.user_service.authenticate_user(username, password)
+    async def login(self, username: str, password: str, response: Response = None) -> TokenResponse:
+        user = await self.user_service.authenticate_user_async(username, password)
         if not user:
             raise AuthenticationException(detail="Invalid username or password")
 
@@ -145,12 +131,8 @@ class AuthService:
                 samesite="none"
             )
 
-        # Store refresh token in Redis
-        try:
-            asyncio.run(self._store_refresh_token_in_redis(user.id, refresh_token))
-        except Exception as e:
-            self.logger.warning(f"Failed to store refresh token asynchronously: {str(e)}")
-            # Continue even if Redis storage fails - the token is still valid
+        # Store refresh token in Redis, failures are logged and the token is still valid
+        await self._store_refresh_token_in_redis(user.id, refresh_token)
 
         return TokenResponse(access_token=access_token, refresh_token=refresh_token)
 
@@ -325,10 +307,13 @@ class AuthService:
             )
         return {"message": "Logged out successfully"}
 
-    def change_password(self, user, old_password: str, new_password: str):
-        if not verify_password(old_password, user.password):
+    def change_password(self, user: UserRead, old_password: str, new_password: str):
+        # current_user is a cached or detached snapshot without the hash, work on the stored row
+        stored_user = self.user_service.read_user(user.id)
+        if not run_on_password_executor(verify_password, old_password, stored_user.password):
             raise PasswordValidationException(detail="Password is incorrect")
-        user.password = hash_password(new_password)
-        user.is_first_login = False
+        stored_user.password = run_on_password_executor(hash_password, new_password)
+        stored_user.is_first_login = False
         self.db.commit()
+        user_cache.invalidate(user.id)
         return {"message": "Your password has been changed successfully"}
@@ -1,12 +1,15 @@
 from sqlalchemy.orm import Session
 from repositories.report import ReportRepository
-from schemas.query.sort.sort_type import SortDirection, SortReportBy
 from schemas.query.sort.report import ReportSort
 from schemas.user import UserRead
 from schemas.shared.paginated_response import PaginatedResponse
-from openpyxl import Workbook
-from io import BytesIO 
-from asyncio import to_thread
+from enums.shared.export_format import ExportFormat
+from utils.export import stream_csv, stream_xlsx
+from typing import Iterator
+
+REPORT_HEADER = ["Category", "Total", "Assigned", "Available",
+                 "Not available", "Waiting for recycling", "Recycled"]
+
 
 class ReportService:
     def __init__(self, db: Session):
@@ -15,23 +18,9 @@ class ReportService:
     def get_report_paginated(self, sort: ReportSort, current_user: UserRead) -> PaginatedResponse:
         return self.repository.get_report_paginated(sort, current_user.location)
 
-    async def convert_to_excel(self, current_user: UserRead) -> BytesIO:
-        workbook = Workbook(write_only=True)
-        worksheet = workbook.create_sheet(title="Report")
-        worksheet.append(["Category", "Total", "Assigned", "Available",
-                  "Not available", "Waiting for recycling", "Recycled"])
-        sort = ReportSort(page=1, size=100,sort_by=SortReportBy.CATEGORY,sort_direction=SortDirection.DESC)
-        while True:
-            response = await to_thread(self.repository.get_report_paginated, sort, current_user.location)
-            reports = response.data
-            if len(reports) == 0:
-                break
-            for report in reports:
-                worksheet.append([report.category, report.total, report.assigned, report.available,
-                          report.not_available, report.waiting_for_recycling, report.recycled])
-
-            sort.page += 1
-        stream = BytesIO()
-        workbook.save(stream)
-        stream.seek(0)
-        return stream
\ No newline at end of file
+    def export_report(self, current_user: UserRead, file_format: ExportFormat = ExportFormat.XLSX) -> Iterator[bytes]:
+        """File content of the whole report, produced while the rows are read from the database."""
+        rows = self.repository.iter_report_rows(current_user.location)
+        if file_format == ExportFormat.CSV:
+            return stream_csv(REPORT_HEADER, rows)
+        return stream_xlsx(REPORT_HEADER, rows, sheet_name="Report")
@@ -15,6 +15,7 @@ from schemas.request import RequestCreate, RequestRead, RequestUpdate
 from models.request import Request
 from schemas.user import UserRead
 from services.assignment import AssignmentService
+from services.unit_of_work import UnitOfWork
 from schemas.shared.paginated_response import PaginatedResponse
 from schemas.query.filter.request import RequestFilter
 
@@ -155,21 +156,23 @@ class RequestReturningService:
                 detail="You can only complete requests for assets in your location"
             )
         
-        # Complete the request
-        completed_request = self.repository.complete_return_request(request_id, current_admin.id)
-        
-        # Update the assignment state to RETURNED
-        assignment = request.assignment
-        if assignment:
-            assignment_state_update = AssignmentStateUpdate(assignment_state=AssignmentState.RETURNED)
-            self.assignment_repository.update_assignment_state(assignment.id, assignment_state_update)
-            logger.info(f"Assignment {assignment.id} state updated to RETURNED for completed return request {request_id}")
-        
-        # Update asset state to AVAILABLE
-        asset_update = AssetUpdate(asset_state=AssetState.AVAILABLE)
-        self.asset_repository.update_asset(asset.id, asset_update)
-        
-        return RequestRead.model_validate(completed_request, from_attributes=True)
+        # The request, its assignment and the asset change together or not at all
+        with UnitOfWork(self.repository.db):
+            completed_request = self.repository.complete_return_request(request_id, current_admin.id, commit=False)
+
+            # Update the assignment state to RETURNED
+            assignment = request.assignment
+            if assignment:
+                assignment_state_update = AssignmentStateUpdate(assignment_state=AssignmentState.RETURNED)
+                self.assignment_repository.update_assignment_state(assignment.id, assignment_state_update, commit=False)
+                logger.info(f"Assignment {assignment.id} state updated to RETURNED for completed return request {request_id}")
+
+            # Update asset state to AVAILABLE
+            asset_update = AssetUpdate(asset_state=AssetState.AVAILABLE)
+            self.asset_repository.update_asset(asset.id, asset_update, commit=False)
+
+            response = RequestRead.model_validate(completed_request, from_attributes=True)
+        return response
 
     def cancel_request(self, request_id: int, current_admin: UserRead) -> bool:
         """
@@ -0,0 +1,43 @@
+from sqlalchemy.orm import Session
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class UnitOfWork:
+    """
+    Runs the writes of one workflow in a single transaction.
+
+    Repository writes called with ``commit=False`` only stage their changes. Autoflush is off
+    inside the block, so the staged rows go out in one flush, either through ``flush()`` when
+    generated keys are needed or as part of the single commit on exit. Any exception rolls the
+    whole workflow back.
+
+    Build response DTOs inside the block, the commit expires the loaded rows and reading them
+    afterwards would load them again.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+        self._autoflush = None
+
+    def __enter__(self) -> "UnitOfWork":
+        self._autoflush = self.session.autoflush
+        self.session.autoflush = False
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        self.session.autoflush = self._autoflush
+        if exc_type is not None:
+            logger.warning(f"Rolling back unit of work: {exc}")
+            self.session.rollback()
+            return False
+        try:
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return False
+
+    def flush(self) -> None:
+        self.session.flush()
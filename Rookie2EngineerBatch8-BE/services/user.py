@@ -1,13 +1,18 @@
+from datetime import datetime, timezone
+from fastapi import HTTPException
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from schemas.query.check.isValid import IsValid
 from schemas.query.filter.user import UserFilter
 from schemas.shared.paginated_response import PaginatedResponse
-from schemas.user import UserCreate, UserRead, UserUpdate
+from schemas.user import UserCreate, UserImportError, UserImportResult, UserRead, UserUpdate
 from models.user import User
 from repositories.user import UserRepository
+from services.allocator import staff_code_allocator
 from utils.generator import Generator
 from core.logging_config import get_logger
+from enums.user.status import Status
 from enums.user.type import Type
 from enums.shared.location import Location
 from core.exceptions import (
@@ -16,8 +21,11 @@ from core.exceptions import (
     NotFoundException,
     BusinessException,
 )
-from utils.hash import verify_password
+from utils.cache import user_cache
+from utils.hash import hash_password, map_on_password_executor, verify_password, verify_password_async
+from starlette.concurrency import run_in_threadpool
 from core.config import settings
+from utils.tabular import TableRow, TableRowReader
 
 logger = get_logger(__name__)
 
@@ -47,8 +55,7 @@ class UserService:
             count += 1
         logger.info(f"Generated username: {generated_username}")
 
-        count_all_users = self.repository.get_count_all_users()
-        generated_staff_code = Generator.generate_staff_code(count_all_users)
+        generated_staff_code = staff_code_allocator.allocate(self.repository.db)[0]
         logger.info(f"Generated staff code: {generated_staff_code}")
 
         generated_password = Generator.generate_password(generated_username, user.date_of_birth)
@@ -72,6 +79,97 @@ class UserService:
 
         return created_user
 
+    def import_users(self, rows: Iterable[TableRow], current_admin_location: Location) -> UserImportResult:
+        """
+        Create users from uploaded rows in chunks of USER_IMPORT_CHUNK_SIZE.
+
+        Each chunk resolves its usernames against one prefix query, takes its staff codes from
+        the staff code allocator, hashes the default passwords on the password executor
+        and is inserted with multi-row INSERTs in its own transaction. Invalid rows are skipped
+        and reported, they do not stop the rest of the file. A file that cannot be read past some
+        row ends the import there, the chunks already saved are kept and the reason is reported
+        as an error without a row number.
+        """
+        total_rows = 0
+        created = 0
+        errors: List[UserImportError] = []
+
+        rows = TableRowReader(rows)
+        while chunk := rows.read_chunk(settings.USER_IMPORT_CHUNK_SIZE):
+            total_rows += len(chunk)
+            accepted: List[UserCreate] = []
+            for row_number, row in chunk:
+                try:
+                    # blank cells fall back to the schema defaults
+                    user = UserCreate.model_validate({key: value for key, value in row.items() if value is not None})
+                except ValidationError as e:
+                    errors.append(UserImportError(row=row_number, errors=self._format_errors(e)))
+                    continue
+                except HTTPException as e:
+                    errors.append(UserImportError(row=row_number, errors=[e.detail]))
+                    continue
+                if user.type == Type.STAFF and user.location != current_admin_location:
+                    errors.append(UserImportError(
+                        row=row_number, errors=["You are not allowed to create a staff in other location"]
+                    ))
+                    continue
+                accepted.append(user)
+
+            created += self._insert_chunk(accepted)
+
+        if rows.error is not None:
+            errors.append(UserImportError(row=None, errors=[rows.error]))
+            logger.warning(f"Import stopped after {total_rows} rows: {rows.error}")
+        logger.info(f"Imported {created} of {total_rows} users, {len(errors)} rows rejected")
+        return UserImportResult(total_rows=total_rows, created=created, failed=len(errors), errors=errors)
+
+    def _insert_chunk(self, users: List[UserCreate]) -> int:
+        if not users:
+            return 0
+        base_usernames = [Generator.generate_username(user.first_name, user.last_name) for user in users]
+        taken = self.repository.get_usernames_with_prefixes(set(base_usernames))
+        usernames = []
+        for base_username in base_usernames:
+            username = Generator.generate_unique_username(base_username, taken)
+            taken.add(username)
+            usernames.append(username)
+
+        staff_codes = staff_code_allocator.allocate(self.repository.db, len(users))
+        # bcrypt releases the GIL, the executor's threads hash on every core
+        passwords = map_on_password_executor(
+            hash_password,
+            [Generator.generate_plain_password(username, user.date_of_birth) for username, user in zip(usernames, users)],
+        )
+
+        now = datetime.now(timezone.utc)
+        values = []
+        for user, username, staff_code, password in zip(users, usernames, staff_codes, passwords):
+            values.append({
+                "staff_code": staff_code,
+                "username": username,
+                "password": password,
+                "first_name": user.first_name,
+                "last_name": user.last_name,
+                "date_of_birth": user.date_of_birth,
+                "join_date": user.join_date,
+                "gender": user.gender,
+                "type": user.type,
+                "location": user.location,
+                "status": Status.ACTIVE,
+                "is_first_login": True,
+                "created_at": now,
+                "updated_at": now,
+            })
+        self.repository.bulk_create_users(values)
+        return len(values)
+
+    @staticmethod
+    def _format_errors(error: ValidationError) -> List[str]:
+        return [
+            f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: {detail['msg']}"
+            for detail in error.errors()
+        ]
+
     def get_user_by_username(self, username: str) -> UserRead:
         return self.repository.get_user_by_username(username)
 
@@ -83,6 +181,14 @@ class UserService:
             raise AuthenticationException(detail="Invalid username or password")
         return user
 
+    async def authenticate_user_async(self, username: str, password: str) -> UserRead:
+        user = await run_in_threadpool(self.get_user_by_username, username)
+        if not user:
+            raise AuthenticationException(detail="Invalid username or password")
+        if not await verify_password_async(password, user.password):
+            raise AuthenticationException(detail="Invalid username or password")
+        return user
+
     def edit_user(
         self, user_id: int, user: UserUpdate, current_admin_location: Location
     ) -> UserRead:
@@ -95,6 +201,7 @@ class UserService:
         updated_user = self.repository.edit_user(user_id, user)
         if not updated_user:
             raise AuthenticationException(detail="User not found")
+        user_cache.invalidate(user_id)
 
         logger.info(f"User edited successfully")
         return updated_user
@@ -107,7 +214,6 @@ class UserService:
             logger.warning(f"User with id {user_id} not found")
             raise NotFoundException(detail=f"User with id {user_id} not found")
 
-        print(user_data)
         return user_data
 
     def read_users_paginated(
@@ -147,9 +253,7 @@ class UserService:
             hashed_password = Generator.generate_root_password(
                 settings.ROOT_ACCOUNT_PASSWORD
             )
-            staff_code = Generator.generate_staff_code(
-                self.repository.get_count_all_users()
-            )
+            staff_code = staff_code_allocator.allocate(self.repository.db)[0]
             return self.repository.create_root_user(
                 settings.ROOT_ACCOUNT_USERNAME, hashed_password, staff_code
             )
@@ -173,6 +277,7 @@ class UserService:
                 detail="Cannot disable user. User has one or more valid assignments."
             )
         disabled_user = self.repository.disable_user(user)
+        user_cache.invalidate(user_id)
         logger.info(f"User with ID {user_id} disabled successfully")
 
         return disabled_user
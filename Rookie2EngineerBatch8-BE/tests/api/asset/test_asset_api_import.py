@@ -0,0 +1,36 @@
+from fastapi import status
+import pytest
+from sqlmodel import func, select
+from models.asset import Asset
+from tests.fixtures.listing import LISTING_ROWS
+
+CSV_HEADER = b"asset_name,category_id,specification,installed_date,asset_state\n"
+CHUNK_SIZE = 50
+# well past the text decoder's read-ahead, so several chunks are saved before the bad bytes are met
+VALID_ROWS = 400
+
+
+@pytest.fixture
+def db_session(listing_session):
+    """The client fixture serves the endpoints with this session, use the seeded SQLite one."""
+    return listing_session
+
+
+def imported_assets(session) -> int:
+    return session.exec(select(func.count()).select_from(Asset).where(Asset.id > LISTING_ROWS)).one()
+
+
+class TestAssetImport:
+    def test_file_unreadable_mid_way_keeps_saved_chunks(self, client, listing_session, mocker):
+        mocker.patch("services.asset.settings.ASSET_IMPORT_CHUNK_SIZE", CHUNK_SIZE)
+        body = CSV_HEADER + b"".join(
+            f"Laptop {n},1,16GB,2024-01-02,Available\n".encode() for n in range(VALID_ROWS)
+        ) + b"Broken \xff\xfe,1,16GB,2024-01-02,Available\n"
+
+        response = client.post("/v1/assets/bulk", files={"file": ("assets.csv", body, "text/csv")})
+
+        assert response.status_code == status.HTTP_200_OK
+        result = response.json()
+        assert CHUNK_SIZE < result["created"] < VALID_ROWS
+        assert result["errors"] == [{"row": None, "errors": ["CSV file must be UTF-8 encoded"]}]
+        assert imported_assets(listing_session) == result["created"]
@@ -13,6 +13,7 @@ from tests.fixtures.auth import mock_current_user, mock_token
 from tests.fixtures.database import mock_db_query, db_session, load_metadata
 from tests.fixtures.services import user_service, asset_service
 from tests.fixtures.test_data import multiple_users, multiple_assets
+from tests.fixtures.listing import listing_engine, listing_session, real_user_model
 
 
 
@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock
+from sqlalchemy import create_engine, text
+import database.db as db_module
+from database import bootstrap as bootstrap_module
+from database.migrations import get_current_revisions
+
+
+def fake_database():
+    database = MagicMock()
+    database.engine = create_engine("sqlite://")
+    return database
+
+
+class TestBootstrap:
+    def test_get_database_creates_instance_once(self, mocker):
+        factory = mocker.patch.object(db_module, "PostgresDatabase")
+        mocker.patch.object(db_module, "_database", None)
+
+        first = db_module.get_database()
+        second = db_module.get_database()
+
+        assert first is second
+        factory.assert_called_once_with()
+
+    def test_legacy_schema_is_stamped_at_baseline(self):
+        database = fake_database()
+        with database.engine.begin() as connection:
+            connection.execute(text('CREATE TABLE "user" (id INTEGER PRIMARY KEY)'))
+
+        bootstrap_module.stamp_legacy_schema(database)
+
+        with database.engine.connect() as connection:
+            assert get_current_revisions(connection) == {bootstrap_module.BASELINE_REVISION}
+
+    def test_empty_database_is_not_stamped(self):
+        database = fake_database()
+
+        bootstrap_module.stamp_legacy_schema(database)
+
+        with database.engine.connect() as connection:
+            assert get_current_revisions(connection) == set()
+
+    def test_bootstrap_migrates_then_creates_root_user(self, mocker):
+        database = fake_database()
+        mocker.patch.object(bootstrap_module, "PostgresDatabase", return_value=database)
+
+        bootstrap_module.bootstrap()
+
+        assert [call[0] for call in database.mock_calls] == ["migrate", "create_root_user"]
+
+    def test_bootstrap_can_skip_root_user(self, mocker):
+        database = fake_database()
+        mocker.patch.object(bootstrap_module, "PostgresDatabase", return_value=database)
+
+        bootstrap_module.bootstrap(skip_root_user=True)
+
+        database.migrate.assert_called_once_with()
+        database.create_root_user.assert_not_called()
@@ -0,0 +1,65 @@
+from sqlalchemy import create_engine
+from core.config import settings
+from database.pool import MeteredAsyncAdaptedQueuePool, MeteredQueuePool, PoolMetrics, build_engine_options
+
+
+class TestDatabasePool:
+    def test_build_engine_options_uses_settings(self):
+        options = build_engine_options(settings)
+
+        assert options["poolclass"] is MeteredQueuePool
+        assert options["pool_size"] == settings.DATABASE_POOL_SIZE
+        assert options["max_overflow"] == settings.DATABASE_MAX_OVERFLOW
+        assert options["pool_timeout"] == settings.DATABASE_POOL_TIMEOUT
+        assert options["pool_recycle"] == settings.DATABASE_POOL_RECYCLE
+        assert options["pool_pre_ping"] == settings.DATABASE_POOL_PRE_PING
+        assert options["echo"] == settings.DATABASE_ECHO
+
+    def test_build_engine_options_sets_statement_timeout(self):
+        custom_settings = settings.model_copy(update={"DATABASE_STATEMENT_TIMEOUT": 5000})
+
+        options = build_engine_options(custom_settings)
+
+        assert options["connect_args"] == {"options": "-c statement_timeout=5000"}
+
+    def test_build_engine_options_for_async_engine(self):
+        custom_settings = settings.model_copy(update={"DATABASE_STATEMENT_TIMEOUT": 5000})
+
+        options = build_engine_options(custom_settings, is_async=True)
+
+        assert options["poolclass"] is MeteredAsyncAdaptedQueuePool
+        assert options["connect_args"] == {"server_settings": {"statement_timeout": "5000"}}
+
+    def test_build_engine_options_without_statement_timeout(self):
+        custom_settings = settings.model_copy(update={"DATABASE_STATEMENT_TIMEOUT": 0})
+
+        options = build_engine_options(custom_settings)
+
+        assert "connect_args" not in options
+
+    def test_pool_metrics_records_checkouts(self):
+        metrics = PoolMetrics(window_seconds=10)
+
+        metrics.record_checkout(0.002)
+        metrics.record_checkout(0.004)
+        snapshot = metrics.snapshot()
+
+        assert snapshot["total_checkouts"] == 2
+        assert snapshot["wait_time_avg_ms"] == 3.0
+        assert snapshot["wait_time_max_ms"] == 4.0
+        assert snapshot["wait_time_last_ms"] == 4.0
+        assert snapshot["checkouts_per_second"] == 0.2
+
+    def test_metered_pool_reports_stats_and_survives_dispose(self):
+        engine = create_engine("sqlite://", poolclass=MeteredQueuePool, pool_size=2, max_overflow=1)
+
+        with engine.connect():
+            stats = engine.pool.stats()
+            assert stats["checked_out"] == 1
+            assert stats["total_checkouts"] == 1
+
+        metrics = engine.pool.metrics
+        engine.dispose()
+
+        assert engine.pool.metrics is metrics
+        assert engine.pool.stats()["checked_out"] == 0
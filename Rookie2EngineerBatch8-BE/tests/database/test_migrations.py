@@ -0,0 +1,84 @@
+import pytest
+from enums.asset.state import AssetState
+from schemas.report import ReportRead
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, text
+from sqlmodel import SQLModel
+from database.migrations import SchemaNotAtHeadError, ensure_schema_at_head, get_alembic_config, get_head_revisions
+from models.asset import Asset  # noqa: F401
+from models.asset_summary import AssetSummary  # noqa: F401
+from models.assignment import Assignment  # noqa: F401
+from models.category import Category  # noqa: F401
+from models.request import Request  # noqa: F401
+from models.user import User  # noqa: F401
+
+
+def stamped_engine(revision=None):
+    engine = create_engine("sqlite://")
+    if revision is not None:
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"))
+            connection.execute(text("INSERT INTO alembic_version VALUES (:revision)"), {"revision": revision})
+    return engine
+
+
+class TestMigrations:
+    def test_revisions_form_a_single_chain(self):
+        script = ScriptDirectory.from_config(get_alembic_config())
+
+        revisions = [revision.revision for revision in script.walk_revisions()]
+
+        assert len(script.get_heads()) == 1
+        assert revisions[-1] == "0001"
+        assert len(revisions) == len(set(revisions))
+
+    def test_migration_indexes_are_declared_on_models(self):
+        script = ScriptDirectory.from_config(get_alembic_config())
+        migration = script.get_revision("0003").module
+        model_indexes = {
+            index.name: [column.name for column in index.columns]
+            for table in SQLModel.metadata.tables.values()
+            for index in table.indexes
+        }
+
+        for name, _, columns in migration.INDEXES:
+            assert model_indexes[name] == columns
+        assert model_indexes["uq_assignment_active_asset_id"] == ["asset_id"]
+
+    def test_active_assignment_index_is_unique_and_partial(self):
+        script = ScriptDirectory.from_config(get_alembic_config())
+        migration = script.get_revision("0005").module
+        index = next(index for index in Assignment.__table__.indexes if index.name == "uq_assignment_active_asset_id")
+
+        assert index.unique
+        assert str(index.dialect_options["postgresql"]["where"]) == migration.ACTIVE_ASSIGNMENT
+
+    def test_asset_summary_triggers_cover_every_state(self):
+        script = ScriptDirectory.from_config(get_alembic_config())
+        migration = script.get_revision("0004").module
+
+        assert set(migration.STATE_COLUMNS.values()) == {state.name for state in AssetState}
+        assert migration.COUNT_COLUMNS == [
+            column.name for column in AssetSummary.__table__.columns if column.name not in ("category_id", "asset_location")
+        ]
+        assert set(migration.COUNT_COLUMNS) == set(ReportRead.model_fields) - {"category"}
+
+    def test_staff_code_sequence_is_declared_on_models(self):
+        script = ScriptDirectory.from_config(get_alembic_config())
+        migration = script.get_revision("0006").module
+
+        assert migration.SEQUENCE in SQLModel.metadata._sequences
+
+    def test_schema_check_passes_at_head(self):
+        engine = stamped_engine(next(iter(get_head_revisions())))
+
+        with engine.connect() as connection:
+            ensure_schema_at_head(connection)
+
+    @pytest.mark.parametrize("revision", [None, "0001"])
+    def test_schema_check_rejects_outdated_database(self, revision):
+        engine = stamped_engine(revision)
+
+        with engine.connect() as connection:
+            with pytest.raises(SchemaNotAtHeadError):
+                ensure_schema_at_head(connection)
@@ -0,0 +1,79 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+import redis.asyncio as redis
+from core.config import Settings
+from database import redis_client
+from database.redis_client import RedisClient
+
+
+def make_settings(**overrides) -> Settings:
+    values = dict(
+        POSTGRES_DB="db",
+        POSTGRES_USER="user",
+        POSTGRES_PASSWORD="password",
+        DATABASE_HOST="localhost",
+        DATABASE_PORT=5432,
+        ROOT_ACCOUNT_USERNAME="root",
+        ROOT_ACCOUNT_PASSWORD="root",
+        REDIS_HOST="redis.local",
+        REDIS_PORT=6380,
+        REDIS_PASSWORD="s3cret",
+        REDIS_MAX_CONNECTIONS=7,
+        REDIS_HEALTH_CHECK_INTERVAL=15,
+    )
+    values.update(overrides)
+    return Settings(**values)
+
+
+class TestRedisClient:
+    def test_pool_uses_settings(self):
+        client = RedisClient(make_settings())
+
+        kwargs = client.pool.connection_kwargs
+        assert kwargs["host"] == "redis.local"
+        assert kwargs["port"] == 6380
+        assert kwargs["password"] == "s3cret"
+        assert kwargs["health_check_interval"] == 15
+        assert client.pool.max_connections == 7
+        assert client.client.connection_pool is client.pool
+
+    def test_pool_stats_before_any_connection(self):
+        client = RedisClient(make_settings())
+
+        assert client.get_pool_stats() == {
+            "max_connections": 7,
+            "created_connections": 0,
+            "in_use": 0,
+            "available": 0,
+        }
+
+    def test_pool_stats_follow_checkouts(self):
+        client = RedisClient(make_settings())
+
+        async def check_out_and_release():
+            # get_available_connection hands out a connection without dialling the server
+            connection = client.pool.get_available_connection()
+            checked_out = client.get_pool_stats()
+            await client.pool.release(connection)
+            return checked_out, client.get_pool_stats()
+
+        checked_out, released = asyncio.run(check_out_and_release())
+
+        assert (checked_out["in_use"], checked_out["available"], checked_out["created_connections"]) == (1, 0, 1)
+        assert (released["in_use"], released["available"], released["created_connections"]) == (0, 1, 1)
+
+    def test_ping_reports_unreachable_server(self):
+        client = RedisClient(make_settings())
+
+        with patch.object(client.client, "ping", AsyncMock(side_effect=redis.ConnectionError("refused"))):
+            assert asyncio.run(client.ping()) is False
+
+    def test_get_redis_is_shared_and_skipped_without_host(self):
+        with patch.object(redis_client, "_redis", None):
+            with patch.object(redis_client.settings, "REDIS_HOST", None):
+                assert redis_client.get_redis() is None
+            with patch.object(redis_client.settings, "REDIS_HOST", "redis.local"):
+                first = redis_client.get_redis()
+                assert first is redis_client.get_redis()
+                asyncio.run(redis_client.close_redis())
+                assert redis_client._redis is None
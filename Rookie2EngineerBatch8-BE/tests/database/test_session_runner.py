@@ -0,0 +1,115 @@
+import asyncio
+import json
+import threading
+from typing import List, Optional
+from unittest.mock import MagicMock
+from pydantic import BaseModel
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.util import greenlet_spawn
+from sqlmodel import Field, Session, SQLModel, create_engine
+import pytest
+from database.runner import AsyncSessionRunner, SessionRunner, SyncSessionRunner, run_blocking
+from schemas.shared.paginated_response import PaginatedResponse, PaginationMeta
+
+
+class RunnerItem(SQLModel, table=True):
+    __tablename__ = "runner_item"
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+
+
+class RunnerItemRead(BaseModel):
+    id: int
+    name: str
+
+
+def create_session() -> Session:
+    # the sync runner hops to a worker thread, share the single in-memory connection
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    RunnerItem.__table__.create(engine)
+    session = Session(engine)
+    session.add_all([RunnerItem(name="laptop"), RunnerItem(name="monitor")])
+    session.commit()
+    return session
+
+
+class TestSessionRunner:
+    def test_runner_interface_is_abstract(self):
+        with pytest.raises(TypeError):
+            SessionRunner()
+
+    def test_sync_runner_passes_session_and_arguments(self):
+        session = create_session()
+        runner = SyncSessionRunner(session)
+
+        result = asyncio.run(runner.run(lambda db, item_id: db.get(RunnerItem, item_id), 2))
+
+        assert result.name == "monitor"
+        session.close()
+
+    def test_sync_runner_builds_response_model(self):
+        session = create_session()
+        runner = SyncSessionRunner(session)
+
+        result = asyncio.run(
+            runner.run(
+                lambda db: db.query(RunnerItem).order_by(RunnerItem.id).all(),
+                response_model=List[RunnerItemRead],
+            )
+        )
+
+        assert result == [RunnerItemRead(id=1, name="laptop"), RunnerItemRead(id=2, name="monitor")]
+        session.close()
+
+    def test_run_json_encodes_paginated_response(self):
+        session = create_session()
+        runner = SyncSessionRunner(session)
+        meta = PaginationMeta(total=2, total_pages=1, page=1, page_size=10)
+
+        response = asyncio.run(
+            runner.run_json(
+                lambda db: PaginatedResponse(
+                    data=[RunnerItemRead.model_construct(id=item.id, name=item.name)
+                          for item in db.query(RunnerItem).order_by(RunnerItem.id)],
+                    meta=meta,
+                ),
+                response_model=PaginatedResponse[RunnerItemRead],
+            )
+        )
+
+        assert response.status_code == 200
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {
+            "data": [{"id": 1, "name": "laptop"}, {"id": 2, "name": "monitor"}],
+            "meta": meta.model_dump(),
+        }
+        session.close()
+
+    def test_async_runner_uses_run_sync(self):
+        sync_session = create_session()
+        async_session = MagicMock()
+
+        async def run_sync(fn):
+            return fn(sync_session)
+
+        async_session.run_sync = run_sync
+        runner = AsyncSessionRunner(async_session)
+
+        result = asyncio.run(
+            runner.run(lambda db: db.get(RunnerItem, 1), response_model=RunnerItemRead)
+        )
+
+        assert result == RunnerItemRead(id=1, name="laptop")
+        sync_session.close()
+
+    def test_run_blocking_leaves_the_loop_thread_under_run_sync(self):
+        thread = lambda: threading.get_ident()
+
+        async def from_greenlet():
+            # AsyncSession.run_sync runs the service in a greenlet on the event loop thread
+            return await greenlet_spawn(run_blocking, thread), threading.get_ident()
+
+        worker, loop_thread = asyncio.run(from_greenlet())
+
+        assert worker != loop_thread
+        assert run_blocking(thread) == threading.get_ident()
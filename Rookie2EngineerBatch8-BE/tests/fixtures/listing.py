@@ -0,0 +1,165 @@
+import sys
+import pytest
+from contextlib import contextmanager
+from typing import List
+from datetime import date, datetime, timedelta, timezone
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, create_engine
+from enums.asset.state import AssetState
+from enums.assignment.state import AssignmentState
+from enums.request.state import RequestState
+from enums.shared.location import Location
+from enums.user.type import Type
+from models.asset import Asset
+from models.assignment import Assignment
+from models.category import Category
+from models.request import Request
+from models.user import User
+
+LISTING_ROWS = 12
+
+
+def _user(index: int, user_type: Type, now: datetime) -> User:
+    return User(
+        id=index,
+        staff_code=f"SD{index:04d}",
+        username=f"user{index}",
+        password="hashed",
+        first_name="User",
+        last_name=str(index),
+        date_of_birth=date(1990, 1, 1),
+        join_date=date(2023, 1, 1),
+        type=user_type,
+        location=Location.HANOI,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def real_user_model(monkeypatch):
+    """tests/conftest.py imports the app while models.user.User is mocked, hand back the model."""
+    for name, module in list(sys.modules.items()):
+        if name.startswith(("repositories.", "services.")) and getattr(getattr(module, "User", None), "__name__", None) == "MockUser":
+            monkeypatch.setattr(module, "User", User)
+
+
+def seed_listing(engine) -> None:
+    """
+    Create the tables and seed one admin, and per row a staff member, an asset of its own
+    category, an assignment to that staff member and a return request, so every relationship
+    a listing maps points at a different row.
+    """
+    for model in (Category, User, Asset, Assignment, Request):
+        model.__table__.create(engine)
+
+    now = datetime.now(timezone.utc)
+    rows = [_user(1, Type.ADMIN, now)]
+    for index in range(1, LISTING_ROWS + 1):
+        rows += [
+            _user(index + 1, Type.STAFF, now),
+            # the counter matches the one asset code handed out
+            Category(id=index, category_name=f"Category {index}", prefix=f"C{index}", id_counter=1,
+                     created_at=now, updated_at=now),
+            Asset(
+                id=index,
+                asset_code=f"C{index}000001",
+                asset_name=f"Asset {index}",
+                specification="spec",
+                installed_date=date(2023, 1, 1),
+                asset_state=AssetState.ASSIGNED,
+                asset_location=Location.HANOI,
+                category_id=index,
+                created_at=now,
+                updated_at=now,
+            ),
+            Assignment(
+                id=index,
+                asset_id=index,
+                assigned_to_id=index + 1,
+                assigned_by_id=1,
+                assign_date=now - timedelta(days=1),
+                assignment_state=AssignmentState.ACCEPTED,
+                created_at=now + timedelta(seconds=index),
+                updated_at=now,
+            ),
+            Request(
+                id=index,
+                assignment_id=index,
+                requested_by_id=index + 1,
+                # every other request is still waiting and has no admin yet
+                accepted_by_id=1 if index % 2 else None,
+                return_date=now if index % 2 else None,
+                request_state=RequestState.COMPLETED if index % 2 else RequestState.WAITING_FOR_RETURNING,
+                created_at=now,
+                updated_at=now,
+            ),
+        ]
+
+    with Session(engine) as session:
+        session.add_all(rows)
+        session.commit()
+
+
+def add_available_assets(session: Session, count: int) -> List[int]:
+    """Add ``count`` available Hanoi assets after the listing rows and return their ids."""
+    now = datetime.now(timezone.utc)
+    asset_ids = [LISTING_ROWS + offset for offset in range(1, count + 1)]
+    session.add_all([
+        Asset(
+            id=asset_id, asset_code=f"C1{asset_id:06d}", asset_name=f"Asset {asset_id}", specification="spec",
+            installed_date=date(2023, 1, 1), asset_state=AssetState.AVAILABLE, asset_location=Location.HANOI,
+            category_id=1, created_at=now, updated_at=now,
+        )
+        for asset_id in asset_ids
+    ])
+    session.commit()
+    session.expunge_all()
+    return asset_ids
+
+
+@pytest.fixture
+def listing_session(real_user_model):
+    """In-memory SQLite session over the listing rows, see seed_listing."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    seed_listing(engine)
+
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def listing_engine(tmp_path, real_user_model):
+    """File backed SQLite with the listing rows, for tests that give every thread its own connection."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'listing.db'}", connect_args={"timeout": 30})
+    seed_listing(engine)
+    yield engine
+    engine.dispose()
+
+
+@contextmanager
+def count_queries(session: Session):
+    """Collect the statements the session sends while the block runs."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def projected_row(model: BaseModel) -> tuple:
+    """The column values a projection selects for ``model``, nested schemas flattened in field order."""
+    values = []
+    for name in type(model).model_fields:
+        value = getattr(model, name)
+        values.extend(projected_row(value) if isinstance(value, BaseModel) else [value])
+    return tuple(values)
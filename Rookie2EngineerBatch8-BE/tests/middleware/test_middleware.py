@@ -0,0 +1,98 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+from jose import jwt
+from core.config import settings
+from api.dependencies import verify_metrics_token
+from core.request_context import get_auth_context
+from middleware.auth import AuthMiddleware
+from middleware.logging import LoggingMiddleware
+
+
+def make_token(sub: str = "johnd", expires_in: timedelta = timedelta(minutes=5)) -> str:
+    exp = int((datetime.now(timezone.utc) + expires_in).timestamp())
+    return jwt.encode({"sub": sub, "user_id": 1, "exp": exp}, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    def health():
+        return {"status": "ok"}
+
+    @app.get("/metrics", dependencies=[Depends(verify_metrics_token)])
+    def metrics():
+        return {"db_pool": {}}
+
+    @app.get("/v1/me")
+    def me(request: Request):
+        return {"sub": get_auth_context(request).claims["sub"]}
+
+    @app.get("/v1/missing")
+    def missing():
+        raise HTTPException(status_code=404, detail="Not found")
+
+    app.add_middleware(LoggingMiddleware)
+    app.add_middleware(AuthMiddleware)
+    return app
+
+
+class TestAuthMiddleware:
+    def test_excluded_path_skips_authentication(self):
+        client = TestClient(create_app())
+
+        assert client.get("/health").status_code == 200
+
+    def test_metrics_take_the_scrape_token_instead_of_a_login(self, monkeypatch):
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+        client = TestClient(create_app())
+
+        assert client.get("/metrics").status_code == 401
+        assert client.get("/metrics", headers={"Authorization": f"Bearer {make_token()}"}).status_code == 401
+        assert client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
+
+    def test_missing_token(self):
+        response = TestClient(create_app()).get("/v1/me")
+
+        assert response.status_code == 401
+        assert response.json() == {"message": "Missing authentication token", "error": "no_tokens"}
+
+    def test_invalid_and_expired_token(self):
+        client = TestClient(create_app())
+
+        invalid = client.get("/v1/me", headers={"Authorization": "garbage"})
+        expired = client.get("/v1/me", headers={"Authorization": make_token(expires_in=timedelta(minutes=-5))})
+
+        assert invalid.status_code == 401
+        assert invalid.json()["error"] == "invalid"
+        assert expired.status_code == 401
+        assert expired.json()["error"] == "expired"
+
+    def test_cookie_takes_precedence_over_header(self):
+        client = TestClient(create_app())
+        client.cookies.set("access_token", make_token("cookie-user"))
+
+        response = client.get("/v1/me", headers={"Authorization": make_token("header-user")})
+
+        assert response.status_code == 200
+        assert response.json() == {"sub": "cookie-user"}
+
+    def test_options_request_is_not_authenticated(self):
+        response = TestClient(create_app()).options("/v1/me")
+
+        assert response.status_code != 401
+
+
+class TestLoggingMiddleware:
+    def test_log_level_follows_status(self, caplog):
+        client = TestClient(create_app())
+
+        with caplog.at_level(logging.INFO, logger="middleware.logging"):
+            client.get("/health")
+            client.get("/v1/missing", headers={"Authorization": make_token()})
+
+        responses = [record for record in caplog.records if record.getMessage().startswith("Response:")]
+        assert [record.levelno for record in responses] == [logging.INFO, logging.WARNING]
+        assert "Status: 404" in responses[1].getMessage()
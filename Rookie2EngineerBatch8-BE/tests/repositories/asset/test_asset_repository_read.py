@@ -6,6 +6,7 @@ from enums.asset.state import AssetState
 from models.category import Category
 from models.asset import Asset
 from sqlmodel import func
+from tests.fixtures.listing import projected_row
 
 class TestAssetRead:
     def test_get_asset_by_id_calls_filter_correct(self, asset_repository, mock_asset_read, mocker):
@@ -62,14 +63,17 @@ class TestAssetRead:
         mock_query.filter.return_value = mock_query
         mock_query.join.return_value = mock_query
         mock_query.order_by.return_value = mock_query
+        mock_query.add_columns.return_value = mock_query
         asset_repository.db.query.return_value = mock_query
         mock_query.count.return_value = expected_meta["total"]
 
-        # expected page slice
+        # expected page slice, each row carries the COUNT(*) OVER() total
         paged_index_start = (page - 1) * size
         paged_index_end = paged_index_start + size
         page_assets = multiple_assets[paged_index_start:paged_index_end]
-        mock_query.offset.return_value.limit.return_value.all.return_value = page_assets
+        mock_query.offset.return_value.limit.return_value.all.return_value = [
+            (*projected_row(asset), expected_meta["total"]) for asset in page_assets
+        ]
 
         # Call the repository method directly!
         paginated_response = asset_repository.get_assets_paginated(
@@ -0,0 +1,63 @@
+from datetime import date
+from models.user import User
+from repositories.assignment import AssignmentRepository
+from schemas.query.filter.assignment import AssignmentFilter, HomeAssignmentFilter
+from schemas.user import UserRead
+from tests.fixtures.listing import LISTING_ROWS, count_queries
+
+
+
+def admin(session) -> UserRead:
+    return UserRead.model_validate(session.get(User, 1), from_attributes=True)
+
+
+class TestAssignmentListingQueries:
+    def test_list_query_count_does_not_grow_with_page_size(self, listing_session):
+        repository = AssignmentRepository(listing_session)
+        current_user = admin(listing_session)
+        counts = []
+        for size in (3, LISTING_ROWS):
+            listing_session.expunge_all()
+            with count_queries(listing_session) as statements:
+                result = repository.get_assignments_paginated(AssignmentFilter(size=size), current_user)
+            counts.append(len(statements))
+            assert len(result.data) == size
+
+        # the projection selects every column of the page and its total in one statement
+        assert counts == [1, 1]
+        first = result.data[0]
+        assert (first.assigned_to_username, first.assigned_by_username) == ("user2", "user1")
+        assert first.asset.category.category_name == "Category 1"
+
+    def test_home_list_loads_relationships_per_page(self, listing_session):
+        repository = AssignmentRepository(listing_session)
+
+        with count_queries(listing_session) as statements:
+            result = repository.get_user_assignments_paginated(HomeAssignmentFilter(), date.today(), user_id=2)
+
+        # the page with its category, then one selectin for each user relationship
+        assert len(statements) == 3
+        assert result.data[0].asset.category.category_name == "Category 1"
+        assert result.data[0].assigned_by_user.username == "user1"
+
+    def test_history_reads_users_and_request_from_the_page_query(self, listing_session):
+        repository = AssignmentRepository(listing_session)
+
+        with count_queries(listing_session) as statements:
+            result = repository.get_assignment_history(1, AssignmentFilter())
+
+        assert len(statements) == 1
+        assert (result.data[0].assigned_to, result.data[0].assigned_by) == ("user2", "user1")
+        assert result.data[0].return_date == date.today()
+
+    def test_detail_is_one_joined_query(self, listing_session):
+        repository = AssignmentRepository(listing_session)
+
+        with count_queries(listing_session) as statements:
+            detail = repository.get_assignment_detail(3)
+
+        assert len(statements) == 1
+        assert detail.assignment.id == 3
+        assert (detail.assigned_to_user.username, detail.assigned_by_user.username) == ("user4", "user1")
+        assert detail.asset.category.category_name == "Category 3"
+        assert repository.get_assignment_detail(999) is None
@@ -0,0 +1,54 @@
+from models.user import User
+from repositories.request import RequestReturningRepository
+from enums.user.type import Type
+from schemas.query.filter.request import RequestFilter
+from schemas.user import UserRead
+from tests.fixtures.listing import LISTING_ROWS, count_queries
+
+
+
+class TestRequestListingQueries:
+    def test_list_query_count_does_not_grow_with_page_size(self, listing_session):
+        repository = RequestReturningRepository(listing_session)
+        current_user = UserRead.model_validate(listing_session.get(User, 1), from_attributes=True)
+        counts = []
+        for size in (3, LISTING_ROWS):
+            listing_session.expunge_all()
+            with count_queries(listing_session) as statements:
+                result = repository.get_requests_paginated(RequestFilter(size=size), current_user)
+            counts.append(len(statements))
+            assert len(result.data) == size
+
+        # rows carry every entity the DTO reads, the page and its total are one statement
+        assert counts == [1, 1]
+        first, second = result.data[:2]
+        assert (first.requested_by.username, first.accepted_by.username) == ("user2", "user1")
+        assert second.accepted_by is None
+        assert first.asset.category.category_name == "Category 1"
+
+    def test_staff_sees_own_requests_in_one_query(self, listing_session):
+        repository = RequestReturningRepository(listing_session)
+        staff = UserRead.model_validate(listing_session.get(User, 3), from_attributes=True)
+        assert staff.type == Type.STAFF
+
+        with count_queries(listing_session) as statements:
+            result = repository.get_requests_paginated(RequestFilter(), staff)
+
+        assert len(statements) == 1
+        assert [(request.id, request.requested_by.username) for request in result.data] == [(2, "user3")]
+
+    def test_cursor_page_builds_from_rows(self, listing_session):
+        repository = RequestReturningRepository(listing_session)
+        current_user = UserRead.model_validate(listing_session.get(User, 1), from_attributes=True)
+
+        first = repository.get_requests_paginated(RequestFilter(size=5, cursor=""), current_user)
+        with count_queries(listing_session) as statements:
+            second = repository.get_requests_paginated(
+                RequestFilter(size=5, cursor=first.meta.next_cursor), current_user
+            )
+
+        # only the page, cursor mode does not count
+        assert len(statements) == 1
+        assert second.meta.total is None
+        assert [request.id for request in second.data] == [6, 7, 8, 9, 10]
+        assert second.data[0].asset.category.category_name == "Category 6"
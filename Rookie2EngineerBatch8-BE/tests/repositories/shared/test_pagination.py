@@ -0,0 +1,141 @@
+from datetime import date
+from typing import Optional
+from unittest.mock import MagicMock
+import pytest
+from sqlmodel import Field, Session, SQLModel, create_engine
+from core.exceptions import ValidationException
+from enums.asset.state import AssetState
+from repositories.pagination import apply_sort, decode_cursor, encode_cursor, estimate_count, paginate
+from schemas.query.sort.sort_type import SortDirection
+from schemas.shared.paginated_param import PaginationParams
+
+
+class KeysetItem(SQLModel, table=True):
+    __tablename__ = "keyset_item"
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    joined: date
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    KeysetItem.__table__.create(engine)
+    with Session(engine) as session:
+        # duplicated sort keys force the id tiebreak to be used
+        names = ["b", "a", "c", "a", "b", "a", "c"]
+        session.add_all(
+            [KeysetItem(name=name, joined=date(2024, 1, index + 1)) for index, name in enumerate(names)]
+        )
+        session.commit()
+        yield session
+
+
+def walk_pages(session, size, direction):
+    items, cursor = [], ""
+    while cursor is not None:
+        query = apply_sort(session.query(KeysetItem), KeysetItem.name, direction)
+        page, meta = paginate(
+            query, PaginationParams(size=size, cursor=cursor), KeysetItem.id, KeysetItem.name, direction
+        )
+        assert len(page) <= size
+        # SQLite has no planner estimate, cursor pages never count
+        assert (meta.total, meta.total_pages, meta.page) == (None, None, None)
+        items.extend(page)
+        cursor = meta.next_cursor
+    return [(item.name, item.id) for item in items]
+
+
+class TestOffsetPagination:
+    def test_total_comes_from_window_count(self, session, mocker):
+        count = mocker.spy(session.query(KeysetItem).__class__, "count")
+
+        page, meta = paginate(session.query(KeysetItem), PaginationParams(page=3, size=3), KeysetItem.id)
+
+        assert [item.id for item in page] == [7]
+        assert (meta.total, meta.total_pages, meta.total_is_estimate) == (7, 3, False)
+        count.assert_not_called()
+
+    def test_page_past_the_end_falls_back_to_count(self, session):
+        page, meta = paginate(session.query(KeysetItem), PaginationParams(page=5, size=3), KeysetItem.id)
+
+        assert page == []
+        assert meta.total == 7
+
+    def test_approximate_total_without_planner_estimate_is_exact(self, session):
+        page, meta = paginate(
+            session.query(KeysetItem), PaginationParams(page=1, size=3, approximate_total=True), KeysetItem.id
+        )
+
+        assert len(page) == 3
+        assert (meta.total, meta.total_is_estimate) == (7, False)
+
+    def test_approximate_total_uses_planner_estimate(self, session, mocker):
+        mocker.patch("repositories.pagination.estimate_count", return_value=6)
+
+        page, meta = paginate(
+            session.query(KeysetItem), PaginationParams(page=1, size=3, approximate_total=True), KeysetItem.id
+        )
+
+        assert len(page) == 3
+        assert (meta.total, meta.total_is_estimate) == (6, True)
+
+    def test_estimate_count_reads_plan_rows(self):
+        query = MagicMock()
+        query.session.get_bind.return_value.dialect.name = "postgresql"
+        query.session.connection.return_value.exec_driver_sql.return_value.scalar.return_value = [
+            {"Plan": {"Plan Rows": 1234}}
+        ]
+
+        assert estimate_count(query) == 1234
+
+    def test_estimate_count_is_skipped_outside_postgres(self, session):
+        assert estimate_count(session.query(KeysetItem)) is None
+
+
+class TestKeysetPagination:
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 10])
+    def test_cursor_pages_cover_rows_in_sort_order(self, session, size):
+        assert walk_pages(session, size, SortDirection.ASC) == sorted(
+            (item.name, item.id) for item in session.query(KeysetItem).all()
+        )
+
+    def test_cursor_pages_descending(self, session):
+        assert walk_pages(session, 2, SortDirection.DESC) == sorted(
+            ((item.name, item.id) for item in session.query(KeysetItem).all()), reverse=True
+        )
+
+    def test_cursor_pages_do_not_count(self, session, mocker):
+        count = mocker.spy(session.query(KeysetItem).__class__, "count")
+        mocker.patch("repositories.pagination.estimate_count", return_value=6)
+
+        page, meta = paginate(
+            session.query(KeysetItem), PaginationParams(page=3, size=3, cursor=""), KeysetItem.id
+        )
+
+        assert [item.id for item in page] == [1, 2, 3]
+        assert (meta.total, meta.total_pages, meta.total_is_estimate, meta.page) == (6, 2, True, None)
+        count.assert_not_called()
+
+    def test_offset_mode_has_no_cursor(self, session):
+        page, meta = paginate(session.query(KeysetItem), PaginationParams(page=2, size=3), KeysetItem.id)
+
+        assert [item.id for item in page] == [4, 5, 6]
+        assert meta.next_cursor is None
+        assert meta.total_pages == 3
+
+    def test_cursor_round_trip_restores_column_types(self):
+        cursor = encode_cursor(date(2024, 5, 1), 42)
+
+        assert decode_cursor(cursor, KeysetItem.joined) == (date(2024, 5, 1), 42)
+
+    def test_cursor_round_trip_for_enum_value(self):
+        from models.asset import Asset
+
+        cursor = encode_cursor(AssetState.AVAILABLE, 7)
+
+        assert decode_cursor(cursor, Asset.asset_state) == (AssetState.AVAILABLE, 7)
+
+    def test_invalid_cursor_raises_validation_error(self):
+        with pytest.raises(ValidationException):
+            decode_cursor("not-a-cursor")
@@ -0,0 +1,60 @@
+from datetime import date, datetime
+from enums.shared.location import Location
+from models.user import User
+from repositories.asset import AssetRepository
+from repositories.projection import Converted, Projection, to_date, user_read_simple
+from repositories.user import UserRepository
+from schemas.asset import AssetHistory
+from schemas.query.filter.asset import AssetFilter
+from schemas.query.filter.user import UserFilter
+from schemas.request import RequestReadDetail
+from schemas.user import UserRead, UserReadSimple
+from tests.fixtures.listing import LISTING_ROWS, count_queries
+
+
+
+class TestProjection:
+    def test_build_converts_and_nests_in_column_order(self):
+        projection = Projection(
+            AssetHistory,
+            id=User.id,
+            assign_date=Converted(User.created_at, to_date),
+            assigned_to=User.username,
+            assigned_by=User.username,
+            return_date=Converted(User.updated_at, to_date),
+        )
+
+        history = projection.build((7, datetime(2024, 5, 1, 9, 30), "to", "by", None))
+
+        assert len(projection.columns) == 5
+        assert history == AssetHistory(id=7, assign_date=date(2024, 5, 1), assigned_to="to", assigned_by="by")
+
+    def test_optional_projection_is_none_for_outer_joined_null(self):
+        projection = Projection(
+            RequestReadDetail,
+            id=User.id,
+            requested_by=user_read_simple(User),
+            accepted_by=user_read_simple(User, optional=True),
+        )
+
+        request = projection.build((1, "SD0001", "A", "B", "ab", None, None, None, None))
+
+        assert request.requested_by == UserReadSimple(staff_code="SD0001", first_name="A", last_name="B", username="ab")
+        assert request.accepted_by is None
+
+    def test_asset_list_reads_category_from_the_row(self, listing_session):
+        with count_queries(listing_session) as statements:
+            result = AssetRepository(listing_session).get_assets_paginated(None, AssetFilter(), Location.HANOI)
+
+        assert len(statements) == 1
+        assert result.meta.total == LISTING_ROWS
+        assert all(asset.asset_code.startswith(asset.category.prefix) for asset in result.data)
+
+    def test_user_list_builds_user_reads(self, listing_session):
+        current_user = UserRead.model_validate(listing_session.get(User, 1), from_attributes=True)
+
+        with count_queries(listing_session) as statements:
+            result = UserRepository(listing_session).get_users_paginated(UserFilter(size=3), current_user)
+
+        assert len(statements) == 1
+        assert result.data[0] == UserRead.model_validate(listing_session.get(User, result.data[0].id), from_attributes=True)
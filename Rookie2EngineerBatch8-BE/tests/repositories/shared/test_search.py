@@ -0,0 +1,48 @@
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+from models.asset import Asset
+from models.user import User
+from repositories.search import search_filter, search_rank
+
+
+def compile_postgres(expression) -> str:
+    return str(expression.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+class TestSearch:
+    def test_search_filter_matches_any_column(self):
+        expected = (Asset.asset_code.ilike("%lap%")) | (Asset.asset_name.ilike("%lap%"))
+
+        assert expected.compare(search_filter("lap", Asset.asset_code, Asset.asset_name))
+
+    def test_search_rank_uses_best_word_similarity(self):
+        sql = compile_postgres(search_rank("lap", Asset.asset_code, Asset.asset_name))
+
+        assert sql.startswith("greatest(")
+        assert "word_similarity('lap', asset.asset_code)" in sql
+        assert "word_similarity('lap', asset.asset_name)" in sql
+        assert "AS FLOAT(53)" in sql
+
+    def test_search_rank_single_column_is_not_wrapped(self):
+        sql = compile_postgres(search_rank("SD01", User.staff_code))
+
+        assert not sql.startswith("greatest(")
+
+    def test_searched_columns_have_trigram_indexes(self):
+        indexes = {
+            index.name: str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+            for table in (Asset.__table__, User.__table__)
+            for index in table.indexes
+        }
+
+        for table, column in [
+            ("asset", "asset_code"),
+            ("asset", "asset_name"),
+            ("user", "staff_code"),
+            ("user", "username"),
+            ("user", "first_name"),
+            ("user", "last_name"),
+        ]:
+            ddl = indexes[f"ix_{table}_{column}_trgm"]
+            assert "USING gin" in ddl
+            assert f"{column} gin_trgm_ops" in ddl
@@ -1,5 +1,14 @@
+import os
+
 import pytest
-from models.user import User
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from models.user import STAFF_CODE_SEQUENCE, User
+from repositories.user import UserRepository
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
 
 class TestUserCreate:
     def test_create_user_calls_add_commit_refresh(self,user_repository,mock_user_create):
@@ -12,4 +21,52 @@ class TestUserCreate:
         user_repository.db.add.assert_called_once_with(user_data)
         user_repository.db.commit.assert_called_once()
         user_repository.db.refresh.assert_called_once_with(user_data)
-        assert result == user_data
\ No newline at end of file
+        assert result == user_data
+
+class TestUserBulkCreate:
+    def test_reserve_staff_numbers_draws_from_the_sequence_once(self, user_repository):
+        user_repository.db.execute.return_value.scalars.return_value = iter([7, 8, 9])
+
+        assert user_repository.reserve_staff_numbers(3) == [7, 8, 9]
+
+        statement = user_repository.db.execute.call_args[0][0]
+        sql = str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+        assert " ".join(sql.split()) == (
+            "SELECT nextval('user_staff_code_seq') AS next_value_1 FROM generate_series(1, 3)"
+        )
+        user_repository.db.execute.assert_called_once()
+
+    def test_bulk_create_users_inserts_and_commits(self, user_repository):
+        user_repository.bulk_create_users([{"username": "a"}, {"username": "b"}])
+
+        user_repository.db.execute.assert_called_once()
+        assert user_repository.db.execute.call_args[0][1] == [{"username": "a"}, {"username": "b"}]
+        user_repository.db.commit.assert_called_once()
+
+    def test_bulk_create_users_skips_empty_batch(self, user_repository):
+        user_repository.bulk_create_users([])
+
+        user_repository.db.execute.assert_not_called()
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(POSTGRES_URL is None, reason="TEST_POSTGRES_URL is not set")
+class TestReserveStaffNumbersOnPostgres:
+    @pytest.fixture
+    def session(self):
+        engine = create_engine(POSTGRES_URL)
+        STAFF_CODE_SEQUENCE.create(engine, checkfirst=True)
+        with Session(engine) as session:
+            yield session
+        engine.dispose()
+
+    def test_reserved_numbers_are_distinct_and_never_reused(self, session):
+        repository = UserRepository(session)
+
+        first = repository.reserve_staff_numbers(5)
+        session.rollback()
+        second = repository.reserve_staff_numbers(5)
+
+        assert len(set(first)) == 5
+        assert first == sorted(first)
+        assert min(second) > max(first)
@@ -5,6 +5,7 @@ from enums.shared.location import Location
 from enums.user.type import Type
 from schemas.query.sort.sort_type import SortDirection, SortUserBy
 from sqlmodel import func
+from tests.fixtures.listing import projected_row
 
 class TestUserRead:
     def test_get_user_by_id_calls_filter_correct(self, user_repository, mock_user_read, mocker):
@@ -62,13 +63,14 @@ class TestUserRead:
         mock_query.order_by.return_value = mock_query
         mock_query.offset.return_value = mock_query
         mock_query.limit.return_value = mock_query
+        mock_query.add_columns.return_value = mock_query
 
         mock_query.count.return_value = expected_meta["total"]
         
         paged_index_start = (page - 1) * size
         paged_index_end = paged_index_start + size
         page_users = multiple_users[paged_index_start:paged_index_end]
-        mock_query.all.return_value = page_users
+        mock_query.all.return_value = [(*projected_row(user), expected_meta["total"]) for user in page_users]
         
         paginated_response = user_repository.get_users_paginated(
             user_filter=user_filter,
@@ -0,0 +1,80 @@
+import threading
+import pytest
+from sqlmodel import Session
+from core.exceptions import NotFoundException
+from models.category import Category
+from services.allocator import AssetCodeAllocator
+
+
+def counter(engine) -> int:
+    with Session(engine) as session:
+        return session.get(Category, 1).id_counter
+
+
+# listing_engine is file backed so every thread gets its own connection, category 1 has
+# already handed out C1000001
+class TestAssetCodeAllocator:
+    def test_allocates_consecutive_codes(self, listing_engine):
+        allocator = AssetCodeAllocator()
+        with Session(listing_engine) as session:
+            assert allocator.allocate(session, 1) == ["C1000002"]
+            assert allocator.allocate(session, 1, 3) == ["C1000003", "C1000004", "C1000005"]
+            session.commit()
+        assert counter(listing_engine) == 5
+
+    def test_reservation_rolls_back_with_the_caller(self, listing_engine):
+        allocator = AssetCodeAllocator(block_size=10)
+        with Session(listing_engine) as session:
+            assert allocator.allocate(session, 1) == ["C1000002"]
+            session.rollback()
+            # the rolled back block is not served from memory
+            assert allocator.allocate(session, 1) == ["C1000002"]
+            session.commit()
+        assert counter(listing_engine) == 11
+
+    def test_reservation_uses_the_callers_connection(self, listing_engine):
+        with Session(listing_engine) as session:
+            AssetCodeAllocator().allocate(session, 1)
+            # the counter update is part of the caller's open transaction
+            assert listing_engine.pool.checkedout() == 1
+            session.commit()
+
+    def test_block_reservation_serves_codes_from_memory(self, listing_engine):
+        allocator = AssetCodeAllocator(block_size=10)
+        codes = []
+        with Session(listing_engine) as session:
+            for _ in range(12):
+                codes.extend(allocator.allocate(session, 1))
+                session.commit()
+        assert codes == [f"C1{n:06d}" for n in range(2, 14)]
+        # two blocks of ten were reserved
+        assert counter(listing_engine) == 21
+
+    def test_unknown_category(self, listing_engine):
+        with Session(listing_engine) as session:
+            with pytest.raises(NotFoundException):
+                AssetCodeAllocator().allocate(session, 99)
+
+    @pytest.mark.parametrize("block_size", [1, 5])
+    def test_concurrent_allocations_are_unique(self, listing_engine, block_size):
+        allocator = AssetCodeAllocator(block_size=block_size)
+        codes, errors = [], []
+
+        def worker():
+            try:
+                with Session(listing_engine) as session:
+                    for _ in range(20):
+                        codes.extend(allocator.allocate(session, 1))
+                        session.commit()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(codes) == 160
+        assert len(set(codes)) == 160
@@ -7,6 +7,7 @@ from enums.asset.state import AssetState
 from enums.shared.location import Location
 from models.asset import Asset
 from services.asset import AssetService
+from core.exceptions import NotFoundException
 from tests.test_data.mock_asset import get_mock_asset_create
 from tests.test_data.mock_user import get_mock_user_read
 from tests.services.assignment.conftest import mock_category as base_mock_category
@@ -34,10 +35,8 @@ def asset_service(mocker):
 
 class TestAssetServiceCreate:
     def test_create_asset_success(self, asset_service, mock_category, mock_current_user, mocker):
-        mock_category_service = Mock()
-        mock_category_service.get_category_by_id.return_value = mock_category
-        mock_category_service.update_category.return_value = mock_category
-        mocker.patch('services.asset.CategoryService', return_value=mock_category_service)
+        mock_allocator = mocker.patch('services.asset.asset_code_allocator')
+        mock_allocator.allocate.return_value = ["TC000001"]
 
         mock_asset = Asset(
             id=1,
@@ -58,13 +57,12 @@ class TestAssetServiceCreate:
         assert result.id == 1
         assert result.asset_code == "TC0001"
         assert result.asset_name == "Test Asset"
-        mock_category_service.update_category.assert_called_once()
+        mock_allocator.allocate.assert_called_once_with(asset_service.db, 1)
         asset_service.repository.create_asset.assert_called_once()
 
     def test_create_asset_category_not_found(self, asset_service, mock_current_user, mocker):
-        mock_category_service = Mock()
-        mock_category_service.get_category_by_id.return_value = None
-        mocker.patch('services.asset.CategoryService', return_value=mock_category_service)
+        mock_allocator = mocker.patch('services.asset.asset_code_allocator')
+        mock_allocator.allocate.side_effect = NotFoundException(detail="Category not found")
 
         asset_data = get_mock_asset_create()
         asset_data.category_id = 999
@@ -74,9 +72,8 @@ class TestAssetServiceCreate:
         assert "Category not found" in str(exc_info.value.detail)
 
     def test_create_asset_database_error(self, asset_service, mock_category, mock_current_user, mocker):
-        mock_category_service = Mock()
-        mock_category_service.get_category_by_id.return_value = mock_category
-        mocker.patch('services.asset.CategoryService', return_value=mock_category_service)
+        mock_allocator = mocker.patch('services.asset.asset_code_allocator')
+        mock_allocator.allocate.return_value = ["TC000001"]
         asset_service.repository.create_asset.side_effect = Exception("Database error")
 
         asset_data = get_mock_asset_create()
@@ -86,10 +83,8 @@ class TestAssetServiceCreate:
         assert "Database error" in str(exc_info.value.detail)
 
     def test_create_asset_code_generation(self, asset_service, mock_category, mock_current_user, mocker):
-        mock_category_service = Mock()
-        mock_category_service.get_category_by_id.return_value = mock_category
-        mock_category_service.update_category.return_value = mock_category
-        mocker.patch('services.asset.CategoryService', return_value=mock_category_service)
+        mock_allocator = mocker.patch('services.asset.asset_code_allocator')
+        mock_allocator.allocate.return_value = ["TC000001"]
 
         mock_asset = Asset(
             id=1,
@@ -108,13 +103,11 @@ class TestAssetServiceCreate:
         asset_data = get_mock_asset_create()
         result = asset_service.create_asset(asset_data, mock_current_user)
         assert result.asset_code == "TC0001"
-        mock_category_service.update_category.assert_called_once()
+        mock_allocator.allocate.assert_called_once_with(asset_service.db, 1)
 
     def test_create_asset_allows_empty_and_special_fields(self, asset_service, mock_category, mock_current_user, mocker):
-        mock_category_service = Mock()
-        mock_category_service.get_category_by_id.return_value = mock_category
-        mock_category_service.update_category.return_value = mock_category
-        mocker.patch('services.asset.CategoryService', return_value=mock_category_service)
+        mock_allocator = mocker.patch('services.asset.asset_code_allocator')
+        mock_allocator.allocate.return_value = ["TC000001"]
         mock_asset = Asset(
             id=2,
             asset_code="TC0002",
@@ -136,29 +129,21 @@ class TestAssetServiceCreate:
         assert result.asset_name == "!@#"
         assert result.specification == ""
 
-    def test_create_asset_with_none_id_counter(self, asset_service, mock_current_user, mocker):
-        # Category with id_counter=None should raise an exception
-        mock_category = Mock()
-        mock_category.id = 1
-        mock_category.category_name = "Test Category"
-        mock_category.prefix = "TC"
-        mock_category.id_counter = None
-        mock_category_service = Mock()
-        mock_category_service.get_category_by_id.return_value = mock_category
-        mock_category_service.update_category.return_value = mock_category
-        mocker.patch('services.asset.CategoryService', return_value=mock_category_service)
+    def test_create_asset_code_allocation_fails(self, asset_service, mock_current_user, mocker):
+        # The counter update failing must not create an asset without a code
+        mock_allocator = mocker.patch('services.asset.asset_code_allocator')
+        mock_allocator.allocate.side_effect = Exception("could not obtain lock on row in relation \"category\"")
         asset_data = get_mock_asset_create()
         with pytest.raises(HTTPException) as exc_info:
             asset_service.create_asset(asset_data, mock_current_user)
         assert exc_info.value.status_code == 500
-        assert "NoneType" in str(exc_info.value.detail) or "unsupported operand" in str(exc_info.value.detail)
+        assert "could not obtain lock" in str(exc_info.value.detail)
+        asset_service.repository.create_asset.assert_not_called()
 
     def test_create_asset_repository_returns_none(self, asset_service, mock_category, mock_current_user, mocker):
         # Repository returns None for created asset
-        mock_category_service = Mock()
-        mock_category_service.get_category_by_id.return_value = mock_category
-        mock_category_service.update_category.return_value = mock_category
-        mocker.patch('services.asset.CategoryService', return_value=mock_category_service)
+        mock_allocator = mocker.patch('services.asset.asset_code_allocator')
+        mock_allocator.allocate.return_value = ["TC000001"]
         asset_service.repository.create_asset.return_value = None
         asset_data = get_mock_asset_create()
         # Should raise AttributeError when trying to access new_asset.id
@@ -169,10 +154,8 @@ class TestAssetServiceCreate:
 
     def test_create_asset_with_user_location_none(self, asset_service, mock_category, mocker):
         # User with location=None
-        mock_category_service = Mock()
-        mock_category_service.get_category_by_id.return_value = mock_category
-        mock_category_service.update_category.return_value = mock_category
-        mocker.patch('services.asset.CategoryService', return_value=mock_category_service)
+        mock_allocator = mocker.patch('services.asset.asset_code_allocator')
+        mock_allocator.allocate.return_value = ["TC000001"]
         mock_user = get_mock_user_read()
         mock_user.location = None
         mock_asset = Asset(
@@ -0,0 +1,124 @@
+import io
+from datetime import date, datetime
+from unittest.mock import Mock
+import pytest
+from openpyxl import Workbook
+from sqlmodel import select
+from core.exceptions import ValidationException
+from enums.asset.state import AssetState
+from enums.shared.location import Location
+from models.asset import Asset
+from models.category import Category
+from services.asset import AssetService
+from tests.fixtures.listing import LISTING_ROWS
+from tests.test_data.mock_user import get_mock_user_read
+from utils.tabular import iter_table_rows
+
+CSV_HEADER = "asset_name,category_id,specification,installed_date,asset_state\n"
+
+
+@pytest.fixture
+def current_user():
+    return get_mock_user_read()
+
+
+def csv_rows(body: str):
+    return iter_table_rows(io.BytesIO((CSV_HEADER + body).encode()), "assets.csv")
+
+
+class TestTableRows:
+    def test_csv_rows_are_numbered_like_the_spreadsheet(self):
+        rows = list(csv_rows("Dell XPS,1,16GB,2024-01-02,Available\n,,,,\nLG 27,2, 4K ,2024-02-03,Not Available\n"))
+
+        assert rows == [
+            (2, {"asset_name": "Dell XPS", "category_id": "1", "specification": "16GB",
+                 "installed_date": "2024-01-02", "asset_state": "Available"}),
+            (4, {"asset_name": "LG 27", "category_id": "2", "specification": "4K",
+                 "installed_date": "2024-02-03", "asset_state": "Not Available"}),
+        ]
+
+    def test_xlsx_rows(self):
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["Asset_Name", "Category_ID", "Specification", "Installed_Date", "Asset_State"])
+        sheet.append(["Dell XPS", 1, "16GB", datetime(2024, 1, 2), "Available"])
+        stream = io.BytesIO()
+        workbook.save(stream)
+        stream.seek(0)
+
+        rows = list(iter_table_rows(stream, "assets.XLSX"))
+
+        assert rows == [(2, {"asset_name": "Dell XPS", "category_id": 1, "specification": "16GB",
+                             "installed_date": date(2024, 1, 2), "asset_state": "Available"})]
+
+    def test_unsupported_file_type(self):
+        with pytest.raises(ValidationException, match="Unsupported file type"):
+            iter_table_rows(io.BytesIO(b""), "assets.pdf")
+
+
+class TestAssetServiceImport:
+    def test_import_reserves_codes_per_category(self, listing_session, current_user, mocker):
+        mocker.patch("services.asset.settings.ASSET_IMPORT_CHUNK_SIZE", 2)
+        rows = csv_rows(
+            "Dell XPS,1,16GB,2024-01-02,Available\n"
+            "LG 27,2,4K,2024-02-03,Not Available\n"
+            "ThinkPad,1,32GB,2024-03-04,Available\n"
+        )
+
+        result = AssetService(listing_session).import_assets(rows, current_user)
+
+        assert (result.total_rows, result.created, result.failed) == (3, 3, 0)
+        assets = listing_session.exec(select(Asset).where(Asset.id > LISTING_ROWS).order_by(Asset.asset_code)).all()
+        assert [asset.asset_code for asset in assets] == ["C1000002", "C1000003", "C2000002"]
+        assert {asset.asset_location for asset in assets} == {Location(current_user.location)}
+        assert assets[0].asset_state == AssetState.AVAILABLE
+        assert listing_session.get(Category, 1).id_counter == 3
+
+    def test_invalid_rows_are_reported_and_skipped(self, listing_session, current_user):
+        rows = csv_rows(
+            "Dell XPS,1,16GB,2024-01-02,Available\n"
+            "No date,1,16GB,,Available\n"
+            "Unknown category,99,16GB,2024-01-02,Available\n"
+            "Bad state,2,4K,2024-01-02,Broken\n"
+        )
+
+        result = AssetService(listing_session).import_assets(rows, current_user)
+
+        assert (result.total_rows, result.created, result.failed) == (4, 1, 3)
+        assert [error.row for error in result.errors] == [3, 5, 4]
+        assert result.errors[0].errors[0].startswith("installed_date:")
+        assert result.errors[2].errors == ["category_id: Category 99 not found"]
+        assert listing_session.get(Category, 2).id_counter == 1
+
+    def test_unreadable_file_keeps_saved_chunks_and_reports_the_error(self, listing_session, current_user, mocker):
+        mocker.patch("services.asset.settings.ASSET_IMPORT_CHUNK_SIZE", 2)
+
+        def rows():
+            yield from csv_rows("".join(f"Laptop {n},1,16GB,2024-01-02,Available\n" for n in range(3)))
+            raise ValidationException(detail="CSV file must be UTF-8 encoded")
+
+        result = AssetService(listing_session).import_assets(rows(), current_user)
+
+        assert (result.total_rows, result.created, result.failed) == (3, 3, 1)
+        assert [(error.row, error.errors) for error in result.errors] == [(None, ["CSV file must be UTF-8 encoded"])]
+        assert listing_session.get(Category, 1).id_counter == 4
+
+    def test_import_inserts_in_batches(self, current_user):
+        service = AssetService(Mock())
+        service.repository = Mock()
+        category_repository = Mock()
+        category_repository.get_categories_by_ids.return_value = [Category(id=1, category_name="Laptop", prefix="LA")]
+        allocator = Mock()
+        allocator.allocate.side_effect = lambda db, category_id, count: [f"LA{n:06d}" for n in range(1, count + 1)]
+        rows = [(n, {"asset_name": f"Laptop {n}", "category_id": 1, "specification": "16GB",
+                     "installed_date": "2024-01-02", "asset_state": "Available"}) for n in range(2, 2502)]
+
+        with pytest.MonkeyPatch.context() as patch:
+            patch.setattr("services.asset.CategoryRepository", lambda db: category_repository)
+            patch.setattr("services.asset.asset_code_allocator", allocator)
+            result = service.import_assets(rows, current_user)
+
+        assert result.created == 2500
+        assert service.repository.bulk_create_assets.call_count == 3
+        category_repository.get_categories_by_ids.assert_called_once()
+        assert [call.args[1:] for call in allocator.allocate.call_args_list] == [(1, 1000), (1, 1000), (1, 500)]
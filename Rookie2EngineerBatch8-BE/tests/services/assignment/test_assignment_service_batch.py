@@ -0,0 +1,158 @@
+import pytest
+from datetime import datetime, timezone
+from enums.asset.state import AssetState
+from enums.assignment.state import AssignmentState
+from enums.shared.location import Location
+from enums.user.status import Status
+from models.asset import Asset
+from models.assignment import Assignment
+from models.user import User
+from schemas.assignment import AssignmentBatchCreate, AssignmentBatchStateUpdate, AssignmentCreate
+from schemas.user import UserRead
+from services.assignment import AssignmentService
+from tests.fixtures.listing import LISTING_ROWS, add_available_assets, count_queries
+
+FREE_ASSETS = [LISTING_ROWS + offset for offset in range(1, 5)]
+
+
+@pytest.fixture
+def session(listing_session):
+    """The listing rows, where every asset is taken, plus a few available assets."""
+    add_available_assets(listing_session, len(FREE_ASSETS))
+    return listing_session
+
+
+def admin(session) -> UserRead:
+    return UserRead.model_validate(session.get(User, 1), from_attributes=True)
+
+
+def batch(*pairs) -> AssignmentBatchCreate:
+    return AssignmentBatchCreate(assignments=[
+        AssignmentCreate(asset_id=asset_id, assigned_to_id=user_id, assign_date=datetime.now(timezone.utc))
+        for asset_id, user_id in pairs
+    ])
+
+
+class TestCreateAssignments:
+    def test_valid_items_are_created_and_invalid_ones_reported(self, session):
+        result = AssignmentService(session).create_assignments(
+            batch((FREE_ASSETS[0], 2), (1, 3), (FREE_ASSETS[1], 999), (999, 2), (FREE_ASSETS[0], 4), (FREE_ASSETS[2], 3)),
+            admin(session),
+        )
+
+        assert (result.total, result.succeeded, result.failed) == (6, 2, 4)
+        assert [item.error for item in result.results] == [
+            None,
+            "Asset with ID 1 is not available for assignment",
+            "User with ID 999 not found",
+            "Asset with ID 999 not found",
+            f"Asset with ID {FREE_ASSETS[0]} is not available for assignment",
+            None,
+        ]
+        created = result.results[0].assignment
+        assert (created.assigned_to_username, created.assigned_by_username) == ("user2", "user1")
+        assert created.asset.asset_state == AssetState.ASSIGNED
+
+        session.expunge_all()
+        assert session.get(Assignment, created.id).assignment_state == AssignmentState.WAITING_FOR_ACCEPTANCE
+        assert [session.get(Asset, asset_id).asset_state for asset_id in FREE_ASSETS[:3]] == [
+            AssetState.ASSIGNED, AssetState.AVAILABLE, AssetState.ASSIGNED
+        ]
+
+    def test_items_outside_the_admin_location_or_not_assignable_are_rejected(self, session):
+        session.get(User, 3).location = Location.HCM
+        session.get(User, 4).status = Status.DISABLED
+        session.get(Asset, FREE_ASSETS[0]).asset_location = Location.HCM
+        session.get(Asset, FREE_ASSETS[1]).asset_state = AssetState.NOT_AVAILABLE
+        session.get(Asset, FREE_ASSETS[2]).asset_state = AssetState.WAITING_FOR_RECYCLING
+        session.commit()
+        session.expunge_all()
+
+        result = AssignmentService(session).create_assignments(
+            batch((FREE_ASSETS[3], 3), (FREE_ASSETS[3], 4), (FREE_ASSETS[0], 2), (FREE_ASSETS[1], 2),
+                  (FREE_ASSETS[2], 2), (FREE_ASSETS[3], 2)),
+            admin(session),
+        )
+
+        hanoi, hcm = Location.HANOI.value, Location.HCM.value
+        assert (result.total, result.succeeded, result.failed) == (6, 1, 5)
+        assert [item.error for item in result.results] == [
+            f"User with ID 3 belongs to {hcm} location, but assignment is for {hanoi} location",
+            "User with ID 4 is not active (current status: disabled)",
+            f"Asset with ID {FREE_ASSETS[0]} belongs to {hcm} location, but assignment is for {hanoi} location",
+            f"Asset with ID {FREE_ASSETS[1]} is not available (current state: Not Available)",
+            f"Asset with ID {FREE_ASSETS[2]} is not available (current state: Waiting for Recycling)",
+            None,
+        ]
+        session.expunge_all()
+        assert [session.get(Asset, asset_id).asset_state for asset_id in FREE_ASSETS] == [
+            AssetState.AVAILABLE, AssetState.NOT_AVAILABLE, AssetState.WAITING_FOR_RECYCLING, AssetState.ASSIGNED
+        ]
+
+    def test_statement_count_does_not_grow_with_batch_size(self, session):
+        service = AssignmentService(session)
+        counts = []
+        for pairs in ([(FREE_ASSETS[0], 2)], [(asset_id, 3) for asset_id in FREE_ASSETS[1:]]):
+            session.expunge_all()
+            with count_queries(session) as statements:
+                result = service.create_assignments(batch(*pairs), admin(session))
+            assert result.succeeded == len(pairs)
+            counts.append(len(statements))
+
+        inserts = [statement for statement in statements if statement.startswith("INSERT")]
+        assert counts[0] == counts[1]
+        assert len(inserts) == 1
+
+
+class TestUpdateAssignmentStates:
+    def waiting(self, session, user_id: int = 2) -> list:
+        result = AssignmentService(session).create_assignments(
+            batch(*[(asset_id, user_id) for asset_id in FREE_ASSETS[:3]]), admin(session)
+        )
+        session.expunge_all()
+        return [item.assignment.id for item in result.results]
+
+    def test_decline_frees_assets_and_reports_rejected_items(self, session):
+        assignment_ids = self.waiting(session)
+        request = AssignmentBatchStateUpdate(
+            assignment_ids=[*assignment_ids[:2], 3, 999], assignment_state=AssignmentState.DECLINED
+        )
+
+        with count_queries(session) as statements:
+            result = AssignmentService(session).update_assignment_states(request, 2, Location.HANOI)
+
+        assert (result.total, result.succeeded, result.failed) == (4, 2, 2)
+        assert [(item.assignment_state, item.error) for item in result.results] == [
+            (AssignmentState.DECLINED, None),
+            (AssignmentState.DECLINED, None),
+            (None, "You can only update your own assignments"),
+            (None, "Assignment not found"),
+        ]
+        # assignments, their assets' locations, one UPDATE per table
+        assert sum(statement.startswith("UPDATE") for statement in statements) == 2
+        session.expunge_all()
+        assert [session.get(Asset, asset_id).asset_state for asset_id in FREE_ASSETS[:3]] == [
+            AssetState.AVAILABLE, AssetState.AVAILABLE, AssetState.ASSIGNED
+        ]
+
+    def test_accept_only_moves_waiting_assignments(self, session):
+        assignment_ids = self.waiting(session)
+        service = AssignmentService(session)
+        service.update_assignment_states(
+            AssignmentBatchStateUpdate(assignment_ids=assignment_ids[:1], assignment_state=AssignmentState.ACCEPTED),
+            2, Location.HANOI,
+        )
+
+        result = service.update_assignment_states(
+            AssignmentBatchStateUpdate(assignment_ids=assignment_ids, assignment_state=AssignmentState.ACCEPTED),
+            2, Location.HANOI,
+        )
+
+        assert [item.error for item in result.results] == [
+            "You can only update assignments that are waiting for acceptance", None, None
+        ]
+        session.expunge_all()
+        assert {session.get(Assignment, assignment_id).assignment_state for assignment_id in assignment_ids} == {
+            AssignmentState.ACCEPTED
+        }
+        assert session.get(Asset, FREE_ASSETS[0]).asset_state == AssetState.ASSIGNED
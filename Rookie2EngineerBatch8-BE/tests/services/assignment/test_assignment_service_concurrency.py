@@ -0,0 +1,97 @@
+import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from sqlalchemy import event
+from sqlmodel import Session, func, select
+from core.exceptions import ConflictException
+from enums.asset.state import AssetState
+from enums.assignment.state import AssignmentState
+from models.asset import Asset
+from models.assignment import Assignment
+from models.user import User
+from repositories.assignment import AssignmentRepository
+from schemas.assignment import AssignmentCreate
+from schemas.user import UserRead
+from services.assignment import AssignmentService
+from tests.fixtures.listing import LISTING_ROWS, add_available_assets
+
+ASSETS = 4
+ADMINS_PER_ASSET = 6
+FREE_ASSETS = [LISTING_ROWS + offset for offset in range(1, ASSETS + 1)]
+
+
+@pytest.fixture(autouse=True)
+def aware_timestamps():
+    # Base stamps naive utcnow() timestamps, newer SQLModel releases only bind aware ones
+    def stamp(mapper, connection, assignment):
+        assignment.created_at = assignment.updated_at = datetime.now(timezone.utc)
+
+    event.listen(Assignment, "before_insert", stamp)
+    yield
+    event.remove(Assignment, "before_insert", stamp)
+
+
+@pytest.fixture
+def engine(listing_engine):
+    """The listing rows on a file shared by every thread, each thread works in its own session."""
+    with Session(listing_engine) as session:
+        add_available_assets(session, ASSETS)
+    return listing_engine
+
+
+def assign(engine, asset_id: int):
+    with Session(engine) as session:
+        admin = UserRead.model_validate(session.get(User, 1), from_attributes=True)
+        assignment = AssignmentCreate(asset_id=asset_id, assigned_to_id=2, assign_date=datetime.now(timezone.utc))
+        try:
+            return AssignmentService(session).create_assignment(assignment, admin.id, admin)
+        except ConflictException as error:
+            return error
+
+
+def open_assignments(engine) -> dict:
+    with Session(engine) as session:
+        rows = session.exec(
+            select(Assignment.asset_id, func.count())
+            .where(Assignment.asset_id.in_(FREE_ASSETS))
+            .where(Assignment.assignment_state.in_([AssignmentState.WAITING_FOR_ACCEPTANCE, AssignmentState.ACCEPTED]))
+            .group_by(Assignment.asset_id)
+        ).all()
+    return dict(rows)
+
+
+class TestConcurrentAssignment:
+    def test_requests_that_pass_the_check_together_assign_once(self, engine, monkeypatch):
+        # Hold every request after its availability check until all of them passed it, the
+        # window the row lock closes on PostgreSQL and SQLite has no row locks for
+        passed_check = threading.Barrier(ADMINS_PER_ASSET, timeout=10)
+        is_asset_available = AssignmentRepository.is_asset_available
+
+        def racing_check(self, asset_id):
+            available = is_asset_available(self, asset_id)
+            passed_check.wait()
+            return available
+
+        monkeypatch.setattr(AssignmentRepository, "is_asset_available", racing_check)
+
+        with ThreadPoolExecutor(max_workers=ADMINS_PER_ASSET) as pool:
+            results = list(pool.map(lambda _: assign(engine, FREE_ASSETS[0]), range(ADMINS_PER_ASSET)))
+
+        conflicts = [result for result in results if isinstance(result, ConflictException)]
+        assert len(conflicts) == ADMINS_PER_ASSET - 1
+        assert all(conflict.status_code == 409 for conflict in conflicts)
+        assert open_assignments(engine) == {FREE_ASSETS[0]: 1}
+
+    def test_contended_load_never_double_assigns(self, engine):
+        asset_ids = [asset_id for asset_id in FREE_ASSETS for _ in range(ADMINS_PER_ASSET)]
+
+        with ThreadPoolExecutor(max_workers=ADMINS_PER_ASSET) as pool:
+            results = list(pool.map(lambda asset_id: assign(engine, asset_id), asset_ids))
+
+        created = [result for result in results if not isinstance(result, ConflictException)]
+        assert sorted(result.asset_id for result in created) == FREE_ASSETS
+        assert open_assignments(engine) == {asset_id: 1 for asset_id in FREE_ASSETS}
+        with Session(engine) as session:
+            states = session.exec(select(Asset.asset_state).where(Asset.id.in_(FREE_ASSETS))).all()
+        assert set(states) == {AssetState.ASSIGNED}
@@ -1,8 +1,9 @@
 import pytest
 from unittest.mock import Mock, patch
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime, date
 
-from core.exceptions import BusinessException, NotFoundException, ValidationException
+from core.exceptions import BusinessException, ConflictException, NotFoundException, ValidationException
 from enums.assignment.state import AssignmentState
 from enums.asset.state import AssetState
 from enums.shared.location import Location
@@ -211,6 +212,34 @@ class TestAssignmentCreateValidation:
                         assignment_data, mock_admin_user.id, mock_admin_user
                     )
 
+    def test_create_assignment_asset_in_other_location(self, assignment_service, mock_admin_user_hanoi, mock_staff_user, mock_asset):
+        """Test creating assignment with an asset of another location."""
+        # Arrange
+        assignment_data = AssignmentCreate(
+            asset_id=mock_asset.id,
+            assigned_to_id=mock_staff_user.id,
+            assign_date=datetime.now(),
+            assignment_note="Test assignment"
+        )
+
+        with patch('services.assignment.UserService') as mock_user_service:
+            mock_user_service_instance = Mock()
+            mock_user_service.return_value = mock_user_service_instance
+            mock_user_service_instance.read_user.return_value = mock_staff_user
+
+            with patch('services.assignment.AssetService') as mock_asset_service:
+                mock_asset_service_instance = Mock()
+                mock_asset_service.return_value = mock_asset_service_instance
+                mock_asset_service_instance.repository.get_asset_by_id.return_value = mock_asset
+                assignment_service.repository.is_asset_available.return_value = True
+
+                # Act & Assert
+                with pytest.raises(BusinessException, match="same location as you"):
+                    assignment_service.create_assignment(
+                        assignment_data, mock_admin_user_hanoi.id, mock_admin_user_hanoi
+                    )
+                assignment_service.repository.create_assignment.assert_not_called()
+                mock_asset_service_instance.repository.update_asset.assert_not_called()
 
 
     def test_create_assignment_asset_not_available(self, assignment_service, mock_admin_user, mock_staff_user, mock_asset):
@@ -236,7 +265,7 @@ class TestAssignmentCreateValidation:
                 assignment_service.repository.is_asset_available.return_value = False
 
                 # Act & Assert
-                with pytest.raises(BusinessException, match="is not available for assignment"):
+                with pytest.raises(ConflictException, match="is not available for assignment"):
                     assignment_service.create_assignment(
                         assignment_data, mock_admin_user.id, mock_admin_user
                     )
@@ -753,7 +782,7 @@ class TestAssignmentCreateEdgeCases:
                 assignment_service.repository.is_asset_available.return_value = False
 
                 # Act & Assert
-                with pytest.raises(BusinessException, match="is not available for assignment"):
+                with pytest.raises(ConflictException, match="is not available for assignment"):
                     assignment_service.create_assignment(
                         assignment_data, mock_admin_user.id, mock_admin_user
                     )
@@ -829,12 +858,64 @@ class TestAssignmentCreateEdgeCases:
                 assignment_service.repository.is_asset_available.return_value = False
 
                 # Act & Assert
-                with pytest.raises(BusinessException, match="is not available for assignment"):
+                with pytest.raises(ConflictException, match="is not available for assignment"):
                     assignment_service.create_assignment(
                         assignment_data, mock_admin_user.id, mock_admin_user
                     )
 
 
+    def test_create_assignment_locks_asset_row(self, assignment_service, mock_admin_user, mock_staff_user, mock_asset):
+        """Test the asset is read with a row lock before the availability check."""
+        assignment_data = AssignmentCreate(
+            asset_id=mock_asset.id,
+            assigned_to_id=mock_staff_user.id,
+            assign_date=datetime.now(),
+        )
+
+        with patch('services.assignment.UserService') as mock_user_service:
+            mock_user_service.return_value.read_user.return_value = mock_staff_user
+
+            with patch('services.assignment.AssetService') as mock_asset_service:
+                mock_asset_service_instance = mock_asset_service.return_value
+                mock_asset_service_instance.repository.get_asset_by_id.return_value = mock_asset
+                assignment_service.repository.is_asset_available.return_value = False
+
+                with pytest.raises(ConflictException):
+                    assignment_service.create_assignment(assignment_data, mock_admin_user.id, mock_admin_user)
+
+                mock_asset_service_instance.repository.get_asset_by_id.assert_called_once_with(
+                    mock_asset.id, for_update=True
+                )
+                assignment_service.repository.create_assignment.assert_not_called()
+                assignment_service.repository.db.rollback.assert_called_once()
+
+    def test_create_assignment_unique_index_violation_is_conflict(self, assignment_service, mock_admin_user, mock_staff_user, mock_asset):
+        """Test a concurrent open assignment rejected by the unique index surfaces as a conflict."""
+        assignment_data = AssignmentCreate(
+            asset_id=mock_asset.id,
+            assigned_to_id=mock_staff_user.id,
+            assign_date=datetime.now(),
+        )
+        violation = IntegrityError(
+            "INSERT INTO assignment", {},
+            Exception('duplicate key value violates unique constraint "uq_assignment_active_asset_id"'),
+        )
+
+        with patch('services.assignment.UserService') as mock_user_service:
+            mock_user_service.return_value.read_user.return_value = mock_staff_user
+
+            with patch('services.assignment.AssetService') as mock_asset_service:
+                mock_asset_service.return_value.repository.get_asset_by_id.return_value = mock_asset
+                assignment_service.repository.is_asset_available.return_value = True
+                assignment_service.repository.db.flush.side_effect = violation
+
+                with pytest.raises(ConflictException, match="is not available for assignment") as error:
+                    assignment_service.create_assignment(assignment_data, mock_admin_user.id, mock_admin_user)
+
+                assert error.value.status_code == 409
+                assignment_service.repository.db.commit.assert_not_called()
+
+
 class TestAssignmentCreateAC:
     """Test assignment creation based on Acceptance Criteria (AC1-AC5)"""
 
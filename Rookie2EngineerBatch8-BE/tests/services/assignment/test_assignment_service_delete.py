@@ -23,7 +23,7 @@ class TestAssignmentDelete:
         assignment_service.delete_assignment(mock_assignment.id, mock_user.location)
         
         # Assert
-        assignment_service.repository.delete_assignment.assert_called_once_with(mock_assignment)
+        assignment_service.repository.delete_assignment.assert_called_once_with(mock_assignment, commit=False)
     
     def test_delete_assignment_not_found(self, assignment_service, mock_user):
         """Test deleting a non-existent assignment."""
@@ -67,4 +67,4 @@ class TestAssignmentDelete:
         assignment_service.delete_assignment(mock_assignment.id, mock_user.location)
         
         # Assert
-        assignment_service.repository.delete_assignment.assert_called_once_with(mock_assignment)
\ No newline at end of file
+        assignment_service.repository.delete_assignment.assert_called_once_with(mock_assignment, commit=False)
\ No newline at end of file
@@ -3,7 +3,8 @@ from schemas.query.filter.assignment import AssignmentFilter
 from schemas.query.sort.sort_type import SortAssignmentBy, SortDirection
 from schemas.shared.paginated_response import PaginatedResponse
 from schemas.assignment import AssignmentRead
-from core.exceptions import NotFoundException
+from core.exceptions import BusinessException, NotFoundException
+from enums.shared.location import Location
 
 class TestAssignmentRead:
     def test_read_assignment_paginated_success(self, assignment_service, mock_assignment, mock_current_user):
@@ -37,53 +38,32 @@ class TestAssignmentRead:
         assert result.meta.page == 1
         assignment_service.repository.get_assignments_paginated.assert_called_once_with(assignment_filter, mock_current_user)
         
-    def test_read_assignment_success(
-        self,
-        assignment_service,
-        mock_assignment_model,
-        mock_asset_model,
-        mock_staff_user_hanoi,
-        mock_admin_user_hanoi,
-        mock_current_user,
-        mock_assignment_detail,
-        asset_service,
-        user_service,
-        mock_asset_hanoi,
-    ):
+    def test_read_assignment_success(self, assignment_service, mock_current_user, mock_assignment_detail):
         # Arrange
-        # Mock assignment retrieval
-        assignment_service.repository.get_assignment_by_id_no_join.return_value = mock_assignment_model
-
-        # Mock asset service - mock at repository level
-        asset_service.repository.get_asset_by_id.return_value = mock_asset_hanoi
-        assignment_service.repository.db = asset_service.repository.db
-
-        def mock_get_user_by_id(user_id):
-            if user_id == mock_assignment_model.assigned_to_id:  # id=2
-                return mock_staff_user_hanoi
-            elif user_id == mock_assignment_model.assigned_by_id:  # id=1
-                return mock_admin_user_hanoi
-            return None
-
-        user_service.repository.get_user_by_id.side_effect = mock_get_user_by_id
-        
-        assignment_service.repository.read_assignment.return_value = mock_assignment_detail
+        assignment_service.repository.get_assignment_detail.return_value = mock_assignment_detail
 
         # Act
-        result = assignment_service.read_assignment(mock_assignment_model.id, mock_current_user)
-        
+        result = assignment_service.read_assignment(mock_assignment_detail.assignment.id, mock_current_user)
+
         # Assert
         assert result == mock_assignment_detail
-        assignment_service.repository.get_assignment_by_id_no_join.assert_called_once_with(mock_assignment_model.id)
-        
+        assignment_service.repository.get_assignment_detail.assert_called_once_with(mock_assignment_detail.assignment.id)
+
     def test_read_assignment_not_found(self, assignment_service, mock_current_user):
         # Arrange
-        assignment_service.repository.get_assignment_by_id_no_join.return_value = None
+        assignment_service.repository.get_assignment_detail.return_value = None
         
         # Act & Assert
         with pytest.raises(NotFoundException, match="Assignment with id 9999 not found"):
             assignment_service.read_assignment(9999, mock_current_user)
         
-        assignment_service.repository.get_assignment_by_id_no_join.assert_called_once_with(9999)
-        
-        
\ No newline at end of file
+        assignment_service.repository.get_assignment_detail.assert_called_once_with(9999)
+
+    def test_read_assignment_other_location(self, assignment_service, mock_current_user, mock_assignment_detail):
+        # Arrange
+        mock_assignment_detail.asset.asset_location = Location.HCM
+        assignment_service.repository.get_assignment_detail.return_value = mock_assignment_detail
+
+        # Act & Assert
+        with pytest.raises(BusinessException, match="same location"):
+            assignment_service.read_assignment(mock_assignment_detail.assignment.id, mock_current_user)
@@ -6,8 +6,11 @@ from core.exceptions import BusinessException, NotFoundException, PermissionDeni
 from enums.assignment.state import AssignmentState
 from enums.asset.state import AssetState
 from enums.shared.location import Location
-from schemas.assignment import AssignmentStateUpdate
+from models.assignment import Assignment
+from schemas.assignment import AssignmentStateUpdate, AssignmentUpdateResponse
 from schemas.asset import AssetUpdate
+from services.assignment import AssignmentService
+from tests.fixtures.listing import count_queries
 
 
 class TestAssignmentStateUpdate:
@@ -32,7 +35,7 @@ class TestAssignmentStateUpdate:
         # Assert
         assert result.assignment_state == AssignmentState.ACCEPTED
         assignment_service.repository.update_assignment_state.assert_called_once_with(
-            mock_assignment.id, state_update
+            mock_assignment.id, state_update, commit=False
         )
 
     def test_update_assignment_state_decline_success(self, assignment_service, mock_assignment, mock_staff_user, mock_asset):
@@ -172,3 +175,22 @@ class TestAssignmentStateUpdate:
                 assignment_service.update_assignment_state(
                     mock_assignment.id, state_update, mock_staff_user.id, mock_staff_user.location
                 )
+
+
+class TestAssignmentStateUpdateQueries:
+    def test_response_is_built_without_reading_the_row_again(self, listing_session):
+        assignment = listing_session.get(Assignment, 1)
+        assignment.assignment_state = AssignmentState.WAITING_FOR_ACCEPTANCE
+        assignment.assignment_note = "note"
+        listing_session.commit()
+        listing_session.expunge_all()
+
+        with count_queries(listing_session) as statements:
+            result = AssignmentService(listing_session).update_assignment_state(
+                1, AssignmentStateUpdate(assignment_state=AssignmentState.ACCEPTED), 2, Location.HANOI
+            )
+
+        assert isinstance(result, AssignmentUpdateResponse)
+        assert (result.asset_id, result.assignment_state) == (1, AssignmentState.ACCEPTED)
+        # the lookup and the update, no refresh after the commit
+        assert [statement.split()[0] for statement in statements] == ["SELECT", "UPDATE"]
@@ -3,7 +3,9 @@ from jose import jwt
 from core.config import settings
 from services.auth import AuthService, AuthenticationException, HTTPException, PasswordValidationException
 from schemas.auth import TokenResponse
-from unittest.mock import MagicMock
+from core.exceptions import NotFoundException
+from tests.test_data.mock_user import get_mock_user_read
+from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 class TestAuthService:
@@ -151,25 +153,31 @@ class TestAuthService:
             assert decoded[key] == value
         assert decoded["exp"] == expected_exp
     
-    def test_login_success(self, user_service, mock_current_user):
+    @pytest.mark.asyncio
+    async def test_login_success(self, user_service, mock_current_user):
         # Arrange
         response = MagicMock()
         
-        # Mock the authenticate_user method
-        user_service.authenticate_user = MagicMock()
-        user_service.authenticate_user.return_value = mock_current_user
+        # Mock the authenticate_user_async method
+        user_service.authenticate_user_async = AsyncMock()
+        user_service.authenticate_user_async.return_value = mock_current_user
         
         # Create AuthService instance with mocked dependencies
         auth_service = AuthService(MagicMock())
         auth_service.user_service = user_service
-        auth_service.redis_client = MagicMock()
+        auth_service.redis_client = AsyncMock()
         
         # Act
-        result = auth_service.login("testuser", "password", response)
+        result = await auth_service.login("testuser", "password", response)
         
         # Assert
         # Check if user authentication was called
-        user_service.authenticate_user.assert_called_once_with("testuser", "password")
+        user_service.authenticate_user_async.assert_awaited_once_with("testuser", "password")
+        auth_service.redis_client.setex.assert_awaited_once_with(
+            str(mock_current_user.id),
+            settings.REFRESH_TOKEN_EXPIRE_DAYS * 60 * 60 * 24,
+            result.refresh_token,
+        )
         
         # Verify return type and token presence
         assert isinstance(result, TokenResponse)
@@ -212,17 +220,20 @@ class TestAuthService:
         assert "jti" in decoded_refresh
         assert "exp" in decoded_refresh
     
-    def test_login_invalid_credentials(self, user_service):
+    @pytest.mark.asyncio
+    async def test_login_invalid_credentials(self, user_service):
         # Arrange
         response = MagicMock()
         
-        # Mock the authenticate_user method
-        user_service.authenticate_user = MagicMock()
-        user_service.authenticate_user.return_value = None
+        # Mock the authenticate_user_async method
+        user_service.authenticate_user_async = AsyncMock()
+        user_service.authenticate_user_async.side_effect = AuthenticationException(detail="Invalid username or password")
+        auth_service = AuthService(MagicMock())
+        auth_service.user_service = user_service
         
         # Act & Assert
         with pytest.raises(AuthenticationException, match="Invalid username or password"):
-            AuthService(MagicMock()).login("testuser", "password", response)
+            await auth_service.login("testuser", "password", response)
     
     @pytest.mark.asyncio
     async def test_refresh_token_success(self, user_service, mock_current_user, mock_refresh_token_payload, mocker):
@@ -363,37 +374,68 @@ class TestAuthService:
     
     def test_change_password_success(self, mocker):
         # Arrange
-        user = MagicMock()
-        user.password = "hashed_old_password"
-        user.is_first_login = True
+        stored_user = MagicMock()
+        stored_user.password = "hashed_old_password"
+        stored_user.is_first_login = True
         db = MagicMock()
-        
+        service = AuthService(db)
+        service.user_service.repository = MagicMock()
+        service.user_service.repository.get_user_by_id.return_value = stored_user
+        invalidate = mocker.patch("services.auth.user_cache.invalidate")
+
         # Mock password verification to return True
         mocker.patch("services.auth.verify_password", return_value=True)
-        
+
         # Mock password hashing
         mocker.patch("services.auth.hash_password", return_value="hashed_new_password")
-        
+
         # Act
-        result = AuthService(db).change_password(user, "old_password", "new_password")
-        
+        result = service.change_password(get_mock_user_read(), "old_password", "new_password")
+
         # Assert
         assert result == {"message": "Your password has been changed successfully"}
-        assert user.is_first_login is False
-        assert user.password == "hashed_new_password"
+        service.user_service.repository.get_user_by_id.assert_called_once_with(1)
+        assert stored_user.is_first_login is False
+        assert stored_user.password == "hashed_new_password"
         db.commit.assert_called_once()
-    
+        invalidate.assert_called_once_with(1)
+
+    def test_change_password_verifies_against_the_stored_hash(self, mocker):
+        # current_user is a UserRead, which carries no password
+        stored_user = MagicMock()
+        stored_user.password = "hashed_old_password"
+        service = AuthService(MagicMock())
+        service.user_service.repository = MagicMock()
+        service.user_service.repository.get_user_by_id.return_value = stored_user
+        verify = mocker.patch("services.auth.verify_password", return_value=True)
+        mocker.patch("services.auth.hash_password", return_value="hashed_new_password")
+
+        service.change_password(get_mock_user_read(), "old_password", "new_password")
+
+        verify.assert_called_once_with("old_password", "hashed_old_password")
+
     def test_change_password_invalid_old_password(self, mocker):
         # Arrange
-        user = MagicMock()
-        user.password = "hashed_old_password"
-        user.is_first_login = True
+        stored_user = MagicMock()
+        stored_user.password = "hashed_old_password"
+        stored_user.is_first_login = True
         db = MagicMock()
-        
+        service = AuthService(db)
+        service.user_service.repository = MagicMock()
+        service.user_service.repository.get_user_by_id.return_value = stored_user
+
         # Mock password verification to return False
         mocker.patch("services.auth.verify_password", return_value=False)
-        
+
         # Act & Assert
         with pytest.raises(PasswordValidationException, match="Password is incorrect"):
-            AuthService(db).change_password(user, "old_password", "new_password")
-    
\ No newline at end of file
+            service.change_password(get_mock_user_read(), "old_password", "new_password")
+        db.commit.assert_not_called()
+
+    def test_change_password_user_not_found(self):
+        service = AuthService(MagicMock())
+        service.user_service.repository = MagicMock()
+        service.user_service.repository.get_user_by_id.return_value = None
+
+        with pytest.raises(NotFoundException):
+            service.change_password(get_mock_user_read(), "old_password", "new_password")
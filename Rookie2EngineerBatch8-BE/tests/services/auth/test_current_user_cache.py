@@ -0,0 +1,119 @@
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch
+import pytest
+from api.dependencies import get_current_user
+from core.request_context import AuthContext
+from enums.shared.location import Location
+from enums.user.status import Status
+from enums.user.type import Type
+from schemas.user import UserRead
+from utils.cache import TTLCache
+
+
+def make_user(user_id: int = 1, username: str = "johnd") -> UserRead:
+    return UserRead(
+        id=user_id,
+        staff_code="SD0001",
+        first_name="John",
+        last_name="Doe",
+        username=username,
+        date_of_birth=date(1990, 1, 1),
+        join_date=date(2020, 1, 1),
+        type=Type.ADMIN,
+        location=Location.HCM,
+        status=Status.ACTIVE,
+        is_first_login=False,
+    )
+
+
+class FakeRunner:
+    def __init__(self, user):
+        self.user = user
+        self.calls = 0
+
+    async def run(self, fn, *args, response_model=None, **kwargs):
+        self.calls += 1
+        return self.user
+
+
+def make_request(token: str, claims: dict):
+    return SimpleNamespace(state=SimpleNamespace(auth=AuthContext(token=token, claims=claims)))
+
+
+class TestTTLCache:
+    def test_get_returns_value_until_expired(self):
+        cache = TTLCache(maxsize=10, ttl=30)
+        with patch("utils.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("utils.cache.time.monotonic", return_value=129.0):
+            assert cache.get("a") == 1
+        with patch("utils.cache.time.monotonic", return_value=130.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_invalidate_and_disabled_cache(self):
+        cache = TTLCache(maxsize=10, ttl=30)
+        cache.set("a", 1)
+        cache.invalidate("a")
+        assert cache.get("a") is None
+
+        disabled = TTLCache(maxsize=10, ttl=0)
+        disabled.set("a", 1)
+        assert disabled.get("a") is None
+
+
+class TestGetCurrentUser:
+    @pytest.fixture(autouse=True)
+    def cache(self):
+        cache = TTLCache(maxsize=10, ttl=30)
+        with patch("api.dependencies.user_cache", cache):
+            yield cache
+
+    def test_reuses_middleware_claims_and_caches_user(self, cache):
+        user = make_user()
+        runner = FakeRunner(user)
+        request = make_request("token", {"sub": "johnd", "user_id": 1})
+
+        with patch("api.dependencies.jwt.decode") as decode:
+            first = asyncio.run(get_current_user(request, token="token", db=runner))
+            second = asyncio.run(get_current_user(request, token="token", db=runner))
+
+        decode.assert_not_called()
+        assert first == second == user
+        assert runner.calls == 1
+        assert cache.get(1) == user
+
+    def test_decodes_token_when_middleware_saw_another_token(self):
+        runner = FakeRunner(make_user())
+        request = make_request("other", {"sub": "someone", "user_id": 2})
+
+        with patch(
+            "api.dependencies.jwt.decode", return_value={"sub": "johnd", "user_id": 1}
+        ) as decode:
+            user = asyncio.run(get_current_user(request, token="token", db=runner))
+
+        decode.assert_called_once()
+        assert user.username == "johnd"
+
+    def test_ignores_cached_user_with_other_username(self, cache):
+        cache.set(1, make_user(username="renamed"))
+        runner = FakeRunner(make_user())
+        request = make_request("token", {"sub": "johnd", "user_id": 1})
+
+        user = asyncio.run(get_current_user(request, token="token", db=runner))
+
+        assert user.username == "johnd"
+        assert runner.calls == 1
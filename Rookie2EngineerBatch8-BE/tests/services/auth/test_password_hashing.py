@@ -0,0 +1,72 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+import pytest
+from core.exceptions import AuthenticationException
+from services.user import UserService
+from passlib.hash import pbkdf2_sha256
+from sqlalchemy.util import greenlet_spawn
+from utils.hash import map_on_password_executor, run_on_password_executor, verify_password_async
+
+
+@pytest.fixture(scope="module")
+def hashed_password():
+    # any scheme of pwd_context works, pbkdf2 does not depend on the installed bcrypt build
+    return pbkdf2_sha256.hash("Secret@123")
+
+
+class TestPasswordHashing:
+    @pytest.mark.asyncio
+    async def test_verify_password_async(self, hashed_password):
+        assert await verify_password_async("Secret@123", hashed_password) is True
+        assert await verify_password_async("wrong", hashed_password) is False
+
+    @pytest.mark.asyncio
+    async def test_verify_password_async_keeps_event_loop_responsive(self, hashed_password):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        task = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        await asyncio.gather(*(verify_password_async("Secret@123", hashed_password) for _ in range(4)))
+        elapsed = time.perf_counter() - start
+        task.cancel()
+
+        # a blocked loop would not tick at all while bcrypt runs
+        assert ticks >= elapsed / 0.001 / 10
+
+    @pytest.mark.asyncio
+    async def test_authenticate_user_async(self, hashed_password):
+        service = UserService(MagicMock())
+        user = MagicMock(password=hashed_password)
+
+        with patch.object(service, "get_user_by_username", return_value=user):
+            assert await service.authenticate_user_async("johnd", "Secret@123") is user
+            with pytest.raises(AuthenticationException):
+                await service.authenticate_user_async("johnd", "wrong")
+
+        with patch.object(service, "get_user_by_username", return_value=None):
+            with pytest.raises(AuthenticationException):
+                await service.authenticate_user_async("nobody", "Secret@123")
+
+    @pytest.mark.asyncio
+    async def test_service_code_under_run_sync_hashes_on_the_executor(self):
+        # AsyncSession.run_sync runs the service in a greenlet on the event loop thread
+        thread_name = lambda _: threading.current_thread().name
+
+        single = await greenlet_spawn(run_on_password_executor, thread_name, "x")
+        many = await greenlet_spawn(map_on_password_executor, thread_name, ["a", "b"])
+
+        assert single.startswith("password-hash")
+        assert all(name.startswith("password-hash") for name in many)
+
+    def test_sync_callers_hash_on_their_own_thread(self, hashed_password):
+        assert run_on_password_executor(lambda _: threading.current_thread().name, "x") == threading.current_thread().name
+        verify = lambda password: pbkdf2_sha256.verify(password, hashed_password)
+        assert map_on_password_executor(verify, ["Secret@123", "wrong"]) == [True, False]
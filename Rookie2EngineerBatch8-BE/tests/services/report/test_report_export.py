@@ -0,0 +1,46 @@
+import gzip
+from io import BytesIO
+from openpyxl import load_workbook
+from utils import export
+from utils.export import gzip_stream, stream_csv, stream_xlsx
+
+
+class TestReportExport:
+    def test_xlsx_sends_first_bytes_before_reading_rows(self):
+        consumed = []
+
+        def rows():
+            for number in range(3):
+                consumed.append(number)
+                yield (f"Category {number}", number)
+
+        chunks = stream_xlsx(["Category", "Total"], rows())
+
+        assert next(chunks).startswith(b"PK")
+        assert consumed == []
+        rest = b"".join(chunks)
+        assert consumed == [0, 1, 2]
+        assert rest
+
+    def test_xlsx_is_flushed_while_rows_arrive(self, monkeypatch):
+        monkeypatch.setattr(export, "FLUSH_EVERY", 100)
+        rows = ((f"Category <{number}> & co", number, None) for number in range(1000))
+
+        chunks = list(stream_xlsx(["Category", "Total", "Note"], rows, sheet_name="Report"))
+
+        assert len(chunks) > 10
+        sheet = load_workbook(BytesIO(b"".join(chunks)), read_only=True)["Report"]
+        values = list(sheet.iter_rows(values_only=True))
+        assert values[0] == ("Category", "Total", "Note")
+        assert values[1] == ("Category <0> & co", 0, None)
+        assert len(values) == 1001
+
+    def test_csv_gzip_round_trip(self, monkeypatch):
+        monkeypatch.setattr(export, "FLUSH_EVERY", 2)
+        rows = [("Laptop", 1), ("Monitor", 2), ("Desk", 3)]
+
+        compressed = b"".join(gzip_stream(stream_csv(["Category", "Total"], rows)))
+
+        assert gzip.decompress(compressed).decode("utf-8-sig").splitlines() == [
+            "Category,Total", "Laptop,1", "Monitor,2", "Desk,3",
+        ]
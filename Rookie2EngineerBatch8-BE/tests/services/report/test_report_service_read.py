@@ -1,6 +1,9 @@
 from schemas.query.sort.report import ReportSort, SortDirection, SortReportBy
 from schemas.shared.paginated_response import PaginatedResponse
+import csv
+import io
 from io import BytesIO
+from enums.shared.export_format import ExportFormat
 from openpyxl import load_workbook
 import pytest
 
@@ -65,64 +68,29 @@ class TestReportServiceRead:
         report_service.repository.get_report_paginated.assert_called_once_with(
             sort, mock_user.location)
 
-    @pytest.mark.asyncio
-    async def test_convert_to_excel(self, report_service, mock_user, mock_report):
-        mock_report_1 = mock_report.copy(deep=True)
-        mock_report_1.category = "Category 1"
-        mock_report_2 = mock_report.copy(deep=True)
-        mock_report_2.category = "Category 2"
-        paginated_response_1 = PaginatedResponse(
-            data=[
-                mock_report_1,
-                mock_report_2,
-            ],
-            meta={
-                "page": 1,
-                "page_size": 2,
-                "total": 2,
-                "total_pages": 1
-            }
-        )
-        paginated_response_2 = PaginatedResponse(
-            data=[],
-            meta={
-                "page": 2,
-                "page_size": 2,
-                "total": 2,
-                "total_pages": 1
-            }
-        )
-        report_service.repository.get_report_paginated.side_effect = [
-            paginated_response_1,
-            paginated_response_2
-        ]
+    def test_export_report_xlsx(self, report_service, mock_user, mock_report):
+        report_service.repository.iter_report_rows.return_value = iter([
+            ("Category 1", 10, 5, 2, 1, 1, 1),
+            ("Category 2", 3, 0, 3, 0, 0, 0),
+        ])
 
-        excel_stream = await report_service.convert_to_excel(mock_user)
-        assert isinstance(excel_stream, BytesIO)
+        content = b"".join(report_service.export_report(mock_user))
 
-        excel_stream.seek(0)
-        workbook = load_workbook(excel_stream, read_only=True)
-        sheet = workbook.active
-        rows = list(sheet.iter_rows(values_only=True))
+        workbook = load_workbook(BytesIO(content), read_only=True)
+        rows = list(workbook.active.iter_rows(values_only=True))
+        assert workbook.sheetnames == ["Report"]
         assert rows[0] == ("Category", "Total", "Assigned", "Available",
-                       "Not available", "Waiting for recycling", "Recycled")
-        
-        assert rows[1] == (
-            mock_report_1.category,
-            mock_report_1.total,
-            mock_report_1.assigned,
-            mock_report_1.available,
-            mock_report_1.not_available,
-            mock_report_1.waiting_for_recycling,
-            mock_report_1.recycled
-        )
+                           "Not available", "Waiting for recycling", "Recycled")
+        assert rows[1] == ("Category 1", 10, 5, 2, 1, 1, 1)
+        assert rows[2] == ("Category 2", 3, 0, 3, 0, 0, 0)
+        report_service.repository.iter_report_rows.assert_called_once_with(mock_user.location)
 
-        assert rows[2] == (
-            mock_report_2.category,
-            mock_report_2.total,
-            mock_report_2.assigned,
-            mock_report_2.available,
-            mock_report_2.not_available,
-            mock_report_2.waiting_for_recycling,
-            mock_report_2.recycled
-        )
\ No newline at end of file
+    def test_export_report_csv(self, report_service, mock_user):
+        report_service.repository.iter_report_rows.return_value = iter([("Laptop, 15\"", 10, 5, 2, 1, 1, 1)])
+
+        content = b"".join(report_service.export_report(mock_user, ExportFormat.CSV)).decode("utf-8-sig")
+
+        assert list(csv.reader(io.StringIO(content))) == [
+            ["Category", "Total", "Assigned", "Available", "Not available", "Waiting for recycling", "Recycled"],
+            ['Laptop, 15"', "10", "5", "2", "1", "1", "1"],
+        ]
@@ -93,7 +93,7 @@ class TestRequestServiceComplete:
         
         # Assert
         assert isinstance(result, RequestRead)
-        request_service.repository.complete_return_request.assert_called_once_with(request_id, mock_admin_user.id)
+        request_service.repository.complete_return_request.assert_called_once_with(request_id, mock_admin_user.id, commit=False)
         
         request_service.assignment_repository.update_assignment_state.assert_called_once()
         call_args = request_service.assignment_repository.update_assignment_state.call_args
@@ -127,7 +127,7 @@ class TestRequestServiceComplete:
         
         # Assert
         assert isinstance(result, RequestRead)
-        request_service.repository.complete_return_request.assert_called_once_with(request_id, mock_admin_user.id)
+        request_service.repository.complete_return_request.assert_called_once_with(request_id, mock_admin_user.id, commit=False)
 
     def test_ac3_no_button_no_action_taken(self, request_service, mock_admin_user):
         # Arrange
@@ -208,6 +208,6 @@ class TestRequestServiceComplete:
         assert mock_request_model.request_state == RequestState.WAITING_FOR_RETURNING
         request_service.repository.get_request_by_id.assert_called_once_with(request_id)
         assert isinstance(result, RequestRead)
-        request_service.repository.complete_return_request.assert_called_once_with(request_id, mock_admin_user.id)
+        request_service.repository.complete_return_request.assert_called_once_with(request_id, mock_admin_user.id, commit=False)
         request_service.assignment_repository.update_assignment_state.assert_called_once()
         request_service.asset_repository.update_asset.assert_called_once()
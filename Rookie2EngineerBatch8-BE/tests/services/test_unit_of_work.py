@@ -0,0 +1,69 @@
+import pytest
+from sqlalchemy import event
+from enums.asset.state import AssetState
+from enums.assignment.state import AssignmentState
+from enums.request.state import RequestState
+from models.asset import Asset
+from models.assignment import Assignment
+from models.request import Request
+from repositories.asset import AssetRepository
+from repositories.assignment import AssignmentRepository
+from repositories.request import RequestReturningRepository
+from schemas.asset import AssetUpdate
+from schemas.assignment import AssignmentStateUpdate
+from services.unit_of_work import UnitOfWork
+from tests.fixtures.listing import count_queries
+
+
+@pytest.fixture
+def commits(listing_session):
+    count = []
+    listener = lambda session: count.append(session)
+    event.listen(listing_session, "after_commit", listener)
+    yield count
+    event.remove(listing_session, "after_commit", listener)
+
+
+def complete_return(session, request_id: int = 2) -> None:
+    RequestReturningRepository(session).complete_return_request(request_id, 1, commit=False)
+    AssignmentRepository(session).update_assignment_state(
+        request_id, AssignmentStateUpdate(assignment_state=AssignmentState.RETURNED), commit=False
+    )
+    AssetRepository(session).update_asset(request_id, AssetUpdate(asset_state=AssetState.AVAILABLE), commit=False)
+
+
+class TestUnitOfWork:
+    def test_workflow_writes_go_out_in_one_commit(self, listing_session, commits):
+        with count_queries(listing_session) as statements:
+            with UnitOfWork(listing_session):
+                complete_return(listing_session)
+                # staged only, autoflush is off until the block ends
+                assert not any(statement.startswith("UPDATE") for statement in statements)
+
+        assert len(commits) == 1
+        assert sum(statement.startswith("UPDATE") for statement in statements) == 3
+        listing_session.expunge_all()
+        assert listing_session.get(Request, 2).request_state == RequestState.COMPLETED
+        assert listing_session.get(Assignment, 2).assignment_state == AssignmentState.RETURNED
+        assert listing_session.get(Asset, 2).asset_state == AssetState.AVAILABLE
+
+    def test_exception_rolls_back_every_staged_write(self, listing_session, commits):
+        with pytest.raises(RuntimeError):
+            with UnitOfWork(listing_session) as uow:
+                complete_return(listing_session)
+                uow.flush()
+                raise RuntimeError("asset service down")
+
+        assert commits == []
+        listing_session.expunge_all()
+        assert listing_session.get(Request, 2).request_state == RequestState.WAITING_FOR_RETURNING
+        assert listing_session.get(Assignment, 2).assignment_state == AssignmentState.ACCEPTED
+        assert listing_session.get(Asset, 2).asset_state == AssetState.ASSIGNED
+
+    def test_autoflush_is_restored(self, listing_session):
+        with pytest.raises(ValueError):
+            with UnitOfWork(listing_session):
+                assert listing_session.autoflush is False
+                raise ValueError
+
+        assert listing_session.autoflush is True
@@ -0,0 +1,73 @@
+import itertools
+import threading
+import time
+from unittest.mock import Mock
+import pytest
+from repositories.user import UserRepository
+from services.allocator import StaffCodeAllocator
+
+
+@pytest.fixture
+def draws(monkeypatch):
+    """SQLite has no sequences, hand out numbers the way user_staff_code_seq does."""
+    sequence = itertools.count(1)
+    lock = threading.Lock()
+    calls = []
+
+    def reserve_staff_numbers(self, count):
+        # leave room for other threads to reach the sequence at the same time
+        time.sleep(0.001)
+        with lock:
+            calls.append(count)
+            return [next(sequence) for _ in range(count)]
+
+    monkeypatch.setattr(UserRepository, "reserve_staff_numbers", reserve_staff_numbers)
+    return calls
+
+
+class TestStaffCodeAllocator:
+    def test_allocates_consecutive_codes(self, draws):
+        allocator = StaffCodeAllocator()
+        assert allocator.allocate(Mock()) == ["SD0001"]
+        assert allocator.allocate(Mock(), 3) == ["SD0002", "SD0003", "SD0004"]
+        # one draw per allocation, nothing is counted
+        assert draws == [1, 3]
+
+    def test_block_reservation_serves_codes_from_memory(self, draws):
+        allocator = StaffCodeAllocator(block_size=10)
+        codes = [allocator.allocate(Mock())[0] for _ in range(12)]
+        assert codes == [f"SD{n:04d}" for n in range(1, 13)]
+        assert draws == [10, 10]
+
+    def test_large_request_draws_past_the_block(self, draws):
+        allocator = StaffCodeAllocator(block_size=5)
+        assert allocator.allocate(Mock(), 8) == [f"SD{n:04d}" for n in range(1, 9)]
+        assert draws == [8]
+
+    def test_reset_skips_cached_numbers(self, draws):
+        allocator = StaffCodeAllocator(block_size=5)
+        allocator.allocate(Mock())
+        allocator.reset()
+        assert allocator.allocate(Mock()) == ["SD0006"]
+
+    @pytest.mark.parametrize("block_size", [1, 5])
+    def test_concurrent_allocations_are_unique(self, draws, block_size):
+        allocator = StaffCodeAllocator(block_size=block_size)
+        codes, errors = [], []
+
+        def worker():
+            try:
+                for _ in range(20):
+                    codes.extend(allocator.allocate(Mock()))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(codes) == 160
+        assert len(set(codes)) == 160
@@ -0,0 +1,126 @@
+import io
+from datetime import date, datetime, timezone
+import pytest
+from passlib.hash import pbkdf2_sha256
+from sqlmodel import select
+from core.exceptions import ValidationException
+from enums.shared.location import Location
+from enums.user.type import Type
+from models.user import User
+from repositories.user import UserRepository
+from services.user import UserService
+from tests.fixtures.listing import LISTING_ROWS, count_queries
+from utils.tabular import iter_table_rows
+
+CSV_HEADER = "first_name,last_name,date_of_birth,join_date,gender,type,location\n"
+# the admin and the staff of the listing rows, then the users the session fixture adds
+EXISTING_USERS = LISTING_ROWS + 1 + 3
+
+
+
+@pytest.fixture(autouse=True)
+def fast_hashing(monkeypatch):
+    # any scheme of pwd_context works, pbkdf2 does not depend on the installed bcrypt build
+    monkeypatch.setattr("services.user.hash_password", lambda password: pbkdf2_sha256.hash(password, rounds=1000))
+
+
+@pytest.fixture
+def staff_numbers(monkeypatch):
+    """SQLite has no sequences, hand out numbers the way user_staff_code_seq does."""
+    drawn = []
+
+    def reserve_staff_numbers(self, count):
+        numbers = list(range(len(drawn) + 101, len(drawn) + 101 + count))
+        drawn.extend(numbers)
+        return numbers
+
+    monkeypatch.setattr(UserRepository, "reserve_staff_numbers", reserve_staff_numbers)
+    return drawn
+
+
+@pytest.fixture
+def session(listing_session):
+    """The listing users plus a few whose usernames the imported rows collide with."""
+    now = datetime.now(timezone.utc)
+    listing_session.add_all([
+        User(
+            staff_code=f"SD{900 + index:04d}", username=username, password="hashed", first_name="Existing",
+            last_name="User", date_of_birth=date(1990, 1, 1), join_date=date(2023, 1, 2),
+            type=Type.STAFF, location=Location.HANOI, created_at=now, updated_at=now,
+        )
+        for index, username in enumerate(["binhnv", "binhnv1", "annt"], start=1)
+    ])
+    listing_session.commit()
+    return listing_session
+
+
+def imported_users(session):
+    return session.exec(select(User).where(User.id > EXISTING_USERS).order_by(User.staff_code)).all()
+
+
+def csv_rows(body: str):
+    return iter_table_rows(io.BytesIO((CSV_HEADER + body).encode()), "users.csv")
+
+
+class TestUserServiceImport:
+    def test_usernames_codes_and_passwords_follow_create_user(self, session, staff_numbers):
+        rows = csv_rows(
+            "Binh,Nguyen Van,1995-05-01,2024-01-02,male,,Hanoi\n"
+            "Binh,Nguyen Van,1996-06-02,2024-01-02,,staff,Hanoi\n"
+            "An,Tran,1990-01-03,2024-01-03,female,admin,Danang\n"
+        )
+
+        with count_queries(session) as statements:
+            result = UserService(session).import_users(rows, Location.HANOI)
+
+        assert (result.total_rows, result.created, result.failed) == (3, 3, 0)
+        created = imported_users(session)
+        assert [(user.staff_code, user.username) for user in created] == [
+            ("SD0101", "binhnv2"), ("SD0102", "binhnv3"), ("SD0103", "ant"),
+        ]
+        assert pbkdf2_sha256.verify("binhnv2@01051995", created[0].password)
+        assert created[0].type == Type.STAFF and created[0].is_first_login
+        # one prefix query for the usernames, one INSERT for the chunk
+        assert sum(statement.startswith("SELECT") for statement in statements) == 1
+        assert sum(statement.startswith("INSERT") for statement in statements) == 1
+
+    def test_invalid_rows_are_reported_and_skipped(self, session, staff_numbers):
+        rows = csv_rows(
+            "Valid,User,1995-05-01,2024-01-02,,,Hanoi\n"
+            "Too,Young,2020-01-01,2024-01-02,,,Hanoi\n"
+            "Other,Location,1995-05-01,2024-01-02,,staff,Danang\n"
+            "No,Birthday,,2024-01-02,,,Hanoi\n"
+        )
+
+        result = UserService(session).import_users(rows, Location.HANOI)
+
+        assert (result.total_rows, result.created, result.failed) == (4, 1, 3)
+        assert [error.row for error in result.errors] == [3, 4, 5]
+        assert result.errors[0].errors == ["User must be at least 18 years old"]
+        assert result.errors[1].errors == ["You are not allowed to create a staff in other location"]
+        assert result.errors[2].errors[0].startswith("date_of_birth:")
+        assert staff_numbers == [101]
+
+    def test_import_inserts_in_chunks(self, session, staff_numbers, mocker):
+        mocker.patch("services.user.settings.USER_IMPORT_CHUNK_SIZE", 2)
+        rows = csv_rows("".join(f"Imported,Number {n},1995-05-01,2024-01-02,,,Hanoi\n" for n in range(5)))
+
+        with count_queries(session) as statements:
+            result = UserService(session).import_users(rows, Location.HANOI)
+
+        assert result.created == 5
+        assert sum(statement.startswith("INSERT") for statement in statements) == 3
+        assert len({user.username for user in imported_users(session)}) == 5
+
+    def test_unreadable_file_keeps_saved_chunks_and_reports_the_error(self, session, staff_numbers, mocker):
+        mocker.patch("services.user.settings.USER_IMPORT_CHUNK_SIZE", 2)
+
+        def rows():
+            yield from csv_rows("".join(f"Imported,Number {n},1995-05-01,2024-01-02,,,Hanoi\n" for n in range(3)))
+            raise ValidationException(detail="CSV file must be UTF-8 encoded")
+
+        result = UserService(session).import_users(rows(), Location.HANOI)
+
+        assert (result.total_rows, result.created, result.failed) == (3, 3, 1)
+        assert [(error.row, error.errors) for error in result.errors] == [(None, ["CSV file must be UTF-8 encoded"])]
+        assert len(imported_users(session)) == 3
@@ -1,5 +1,6 @@
 from datetime import date
-from utils.hash import hash_password
+from typing import Set
+from utils.hash import hash_password, run_on_password_executor
 
 class Generator:
     def __init__(self):
@@ -19,20 +20,33 @@ class Generator:
         username = first_name_first_word + last_name_initials
         
         return username
+
+    @staticmethod
+    def generate_unique_username(base_username: str, taken: Set[str]) -> str:
+        """First of base, base1, base2, ... not in ``taken``, the order create_user probes them in."""
+        username = base_username
+        count = 1
+        while username in taken:
+            username = f"{base_username}{count}"
+            count += 1
+        return username
     
     @staticmethod
-    def generate_staff_code(count_all_users: int) -> str:
-        return f"SD{count_all_users + 1:04d}"
+    def generate_staff_code(number: int) -> str:
+        return f"SD{number:04d}"
+
+    @staticmethod
+    def generate_plain_password(username: str, date_of_birth: date) -> str:
+        # format: username@date_of_birth (ddmmyyyy)
+        return f"{username}@{date_of_birth.strftime('%d%m%Y')}"
     
     @staticmethod
     def generate_password(username: str, date_of_birth: date) -> str:
-        # format: username@date_of_birth (ddmmyyyy)
-        generated_password = f"{username}@{date_of_birth.strftime('%d%m%Y')}"
-        return hash_password(generated_password)
+        return run_on_password_executor(hash_password, Generator.generate_plain_password(username, date_of_birth))
     
     @staticmethod
     def generate_root_password(password: str) -> str:
-        return hash_password(password)
+        return run_on_password_executor(hash_password, password)
 
     @staticmethod
     def generate_prefix(category_name: str) -> str:
@@ -1,8 +1,18 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
 from passlib.context import CryptContext
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+from core.config import settings
 from core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 # Create a password context for hashing and verifying passwords
 # Include multiple schemes to handle different password formats
 # This allows verification of passwords hashed with different algorithms
@@ -50,6 +60,71 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+_password_executor: Optional[ThreadPoolExecutor] = None
+_password_executor_lock = threading.Lock()
+
+
+def get_password_executor() -> ThreadPoolExecutor:
+    """
+    Pool that runs bcrypt off the event loop.
+
+    The bcrypt extension releases the GIL while hashing, so threads use every core without the
+    pickling cost of a process pool. The pool is bounded so a login burst queues here instead of
+    starving the default threadpool that serves the database work.
+    """
+    global _password_executor
+    if _password_executor is None:
+        with _password_executor_lock:
+            if _password_executor is None:
+                _password_executor = ThreadPoolExecutor(
+                    max_workers=settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1,
+                    thread_name_prefix="password-hash",
+                )
+    return _password_executor
+
+
+def shutdown_password_executor() -> None:
+    global _password_executor
+    with _password_executor_lock:
+        if _password_executor is not None:
+            _password_executor.shutdown(wait=False, cancel_futures=True)
+            _password_executor = None
+
+
+async def hash_password_async(password: str) -> str:
+    """Async version of hash_password, runs on the password executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_password_executor(), hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Async version of verify_password, runs on the password executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_password_executor(), verify_password, plain_password, hashed_password)
+
+
+def run_on_password_executor(fn: Callable[..., T], *args) -> T:
+    """
+    Run a bcrypt call from sync service code without blocking the event loop.
+
+    Under AsyncSession.run_sync the service runs on the event loop thread, there the call goes
+    to the password executor and the wait is handed back to the loop. Everywhere else, on the
+    threadpool of the sync runner or in scripts, it runs on the calling thread.
+    """
+    if in_greenlet():
+        return await_only(asyncio.get_running_loop().run_in_executor(get_password_executor(), fn, *args))
+    return fn(*args)
+
+
+def map_on_password_executor(fn: Callable[[str], T], values: Iterable[str]) -> List[T]:
+    """Like ``run_on_password_executor`` for many values, spread over the executor's threads."""
+    executor = get_password_executor()
+    if in_greenlet():
+        loop = asyncio.get_running_loop()
+        return await_only(asyncio.gather(*(loop.run_in_executor(executor, fn, value) for value in values)))
+    return list(executor.map(fn, values))
+
+
 def hash_token(token: str) -> str:
     """
     Hash a refresh token using SHA-256 algorithm
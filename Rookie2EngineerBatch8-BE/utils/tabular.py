@@ -0,0 +1,113 @@
+import csv
+import io
+from datetime import datetime, time
+from itertools import islice
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from openpyxl import load_workbook
+from core.exceptions import ValidationException
+from database.runner import run_blocking
+
+TableRow = Tuple[int, Dict[str, Any]]
+
+SUPPORTED_EXTENSIONS = (".csv", ".xlsx")
+
+
+def iter_table_rows(file: IO[bytes], filename: Optional[str]) -> Iterator[TableRow]:
+    """
+    Read an uploaded CSV or XLSX file one row at a time.
+
+    Yields ``(row_number, {column: value})`` where the header is row 1, so numbers match what the
+    user sees in a spreadsheet. Column names are lower-cased, blank cells become None and empty
+    rows are skipped. The file is never loaded whole into memory.
+    """
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return _iter_csv(file)
+    if name.endswith(".xlsx"):
+        return _iter_xlsx(file)
+    raise ValidationException(detail="Unsupported file type, upload a .csv or .xlsx file")
+
+
+class TableRowReader:
+    """
+    Iterate table rows, ending early instead of raising when the file turns out to be unreadable.
+
+    Import services commit chunk by chunk, so a ValidationException from the file half way through
+    would escape after earlier chunks were saved. The reader keeps its detail in ``error`` so the
+    import can report it next to the rows it did create.
+    """
+
+    def __init__(self, rows: Iterable[TableRow]):
+        self._rows = iter(rows)
+        self.error: Optional[str] = None
+
+    def __iter__(self) -> "TableRowReader":
+        return self
+
+    def __next__(self) -> TableRow:
+        if self.error is not None:
+            raise StopIteration
+        try:
+            return next(self._rows)
+        except ValidationException as e:
+            self.error = e.detail
+            raise StopIteration
+
+    def read_chunk(self, size: int) -> List[TableRow]:
+        """Parse the next ``size`` rows, off the event loop when the async runner is in use."""
+        return run_blocking(lambda: list(islice(self, size)))
+
+
+def _iter_csv(file: IO[bytes]) -> Iterator[TableRow]:
+    # utf-8-sig drops the BOM Excel writes in front of CSV exports
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.reader(text)
+        header = _header(next(reader, None))
+        for row_number, values in enumerate(reader, start=2):
+            row = _row(header, values)
+            if row is not None:
+                yield row_number, row
+    except UnicodeDecodeError:
+        raise ValidationException(detail="CSV file must be UTF-8 encoded")
+    finally:
+        # hand the file back to its owner instead of closing it with the wrapper
+        text.detach()
+
+
+def _iter_xlsx(file: IO[bytes]) -> Iterator[TableRow]:
+    try:
+        workbook = load_workbook(file, read_only=True, data_only=True)
+    except Exception:
+        raise ValidationException(detail="File is not a valid .xlsx workbook")
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = _header(next(rows, None))
+        for row_number, values in enumerate(rows, start=2):
+            row = _row(header, values)
+            if row is not None:
+                yield row_number, row
+    finally:
+        workbook.close()
+
+
+def _header(values) -> list:
+    if not values:
+        raise ValidationException(detail="File is empty, the first row must hold the column names")
+    return [str(value).strip().lower() if value is not None else "" for value in values]
+
+
+def _row(header: list, values) -> Optional[Dict[str, Any]]:
+    row = {}
+    for column, value in zip(header, values):
+        if not column:
+            continue
+        if isinstance(value, str):
+            value = value.strip() or None
+        elif isinstance(value, datetime) and value.time() == time():
+            # spreadsheet dates come back as midnight datetimes
+            value = value.date()
+        row[column] = value
+    if all(value is None for value in row.values()):
+        return None
+    return row